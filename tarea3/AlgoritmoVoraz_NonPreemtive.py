@@ -0,0 +1,143 @@
+from collections import namedtuple
+from itertools import accumulate
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional: sin él se usan sorted y listas de Python
+    np = None
+
+# Tiempo de ejecución: O(n log n) debido al ordenamiento de las tareas
+# Uso de memoria: O(n) para almacenar las tareas y sus tiempos
+# Justificación: El ordenamiento domina el tiempo de ejecución. La memoria se usa para guardar la lista y variables auxiliares.
+
+
+# Resultado de planificar_spt. finalizaciones y maquinas están en el orden original de las tareas;
+# promedio es el tiempo promedio de finalización (ponderado por los pesos, si los hay).
+Planificacion = namedtuple("Planificacion", "finalizaciones maquinas promedio")
+
+
+def minimizar_tiempo_promedio_non_preemptive(tiempos):
+    """
+    Minimiza el tiempo promedio de finalización bajo asignación no preemptiva.
+    :param tiempos: Lista de tiempos de ejecución de las tareas [p1, p2, ..., pn]
+    :return: Tiempo promedio de finalización
+    """
+    # Shortest Job First en una sola máquina; planificar_spt no modifica la lista recibida
+    return planificar_spt(tiempos).promedio
+
+
+def planificar_spt(tiempos, pesos=None, maquinas=1, usar_numpy=True):
+    """
+    Planificación no preemptiva SPT (o regla de Smith con pesos) en 'maquinas' máquinas idénticas.
+
+    Complejidad temporal:
+    - O(n log n) por el ordenamiento (argsort estable); los tiempos de finalización se obtienen
+      con una suma acumulada por máquina en O(n).
+
+    Complejidad espacial:
+    - O(n) para el orden, las finalizaciones y la máquina de cada tarea. La entrada no se modifica.
+
+    Justificación:
+    - Sin pesos, las tareas se ordenan por duración y la tarea de rango r va a la máquina r mod m
+      (round-robin). Las últimas tareas de cada máquina son las más largas, lo cual minimiza la suma
+      de tiempos de finalización en m máquinas idénticas (para m = 1 es SJF).
+    - Con pesos se ordena por p/w (regla de Smith), que es óptima en una máquina para la suma
+      ponderada. Con m > 1 el problema ponderado es NP-difícil y el round-robin por p/w es una
+      heurística.
+    - Con NumPy, el rango r de la tarea ordenada se ve como la celda (r // m, r mod m) de una
+      matriz de m columnas: la suma acumulada por columnas da el tiempo de finalización de cada
+      tarea en su máquina, sin ciclos en Python.
+    - Los empates se resuelven por el orden original de las tareas.
+    - Los tiempos enteros cuyas sumas podrían salir del rango de int64 (|p| · n > 2^63 - 1), o que
+      NumPy no puede representar como números, se planifican con enteros de Python, que no desbordan.
+
+    :param tiempos: Secuencia (o arreglo de NumPy) de duraciones p_j
+    :param pesos: Secuencia opcional de pesos w_j > 0
+    :param maquinas: Número de máquinas idénticas
+    :return: Planificacion(finalizaciones, maquinas, promedio); con NumPy las dos primeras son
+             arreglos de NumPy, si no, listas. promedio siempre es un float de Python
+    """
+    if maquinas < 1:
+        raise ValueError("Se necesita al menos una máquina")
+    if not hasattr(tiempos, "__getitem__"):
+        tiempos = list(tiempos)  # Iteradores y generadores
+    if pesos is not None and len(pesos) != len(tiempos):
+        raise ValueError("tiempos y pesos deben tener la misma longitud")
+    if usar_numpy and np is not None:
+        p = np.asarray(tiempos)
+        if _cabe_en_numpy(p):
+            return _planificar_spt_numpy(p, pesos, maquinas)
+        tiempos = p.tolist()  # Enteros de Python: las sumas son exactas
+
+    n = len(tiempos)
+    if pesos is None:
+        orden = sorted(range(n), key=tiempos.__getitem__)
+    else:
+        if any(w <= 0 for w in pesos):
+            raise ValueError("Los pesos deben ser positivos")
+        orden = sorted(range(n), key=lambda j: tiempos[j] / pesos[j])
+
+    finalizaciones = [0] * n
+    asignacion = [0] * n
+    for m in range(maquinas):
+        # Tareas de la máquina m: rangos m, m + maquinas, m + 2·maquinas, ...
+        tareas = orden[m::maquinas]
+        for j, fin in zip(tareas, accumulate(tiempos[j] for j in tareas)):
+            finalizaciones[j] = fin
+            asignacion[j] = m
+
+    if pesos is None:
+        promedio = sum(finalizaciones) / n
+    else:
+        promedio = sum(w * c for w, c in zip(pesos, finalizaciones)) / sum(pesos)
+    return Planificacion(finalizaciones, asignacion, promedio)
+
+
+def _cabe_en_numpy(p):
+    # Los flotantes no desbordan; los enteros sólo si ninguna suma acumulada puede pasar de int64
+    if p.dtype.kind == "f" or len(p) == 0:
+        return True
+    if p.dtype.kind not in "iu":
+        return False  # Por ejemplo dtype=object con enteros de más de 64 bits
+    mayor = max(abs(int(p.max())), abs(int(p.min())))
+    return mayor * len(p) <= np.iinfo(np.int64).max
+
+
+def _planificar_spt_numpy(tiempos, pesos, maquinas):
+    p = np.asarray(tiempos)
+    n = len(p)
+    if pesos is None:
+        orden = np.argsort(p, kind="stable")
+    else:
+        w = np.asarray(pesos, dtype=float)
+        if (w <= 0).any():
+            raise ValueError("Los pesos deben ser positivos")
+        orden = np.argsort(p / w, kind="stable")
+
+    # Rellenamos con ceros hasta un múltiplo de m y acumulamos por columnas (una por máquina)
+    filas = -(-n // maquinas)
+    matriz = np.zeros(filas * maquinas, dtype=p.dtype)
+    matriz[:n] = p[orden]
+    acumulado = matriz.reshape(filas, maquinas).cumsum(axis=0).ravel()[:n]
+
+    finalizaciones = np.empty_like(acumulado)
+    finalizaciones[orden] = acumulado
+    asignacion = np.empty(n, dtype=np.int64)
+    asignacion[orden] = np.arange(n) % maquinas
+
+    if pesos is None:
+        promedio = float(finalizaciones.sum(dtype=float) / n)
+    else:
+        promedio = float(np.dot(w, finalizaciones) / w.sum())
+    return Planificacion(finalizaciones, asignacion, promedio)
+
+
+# Ejemplo de uso:
+if __name__ == "__main__":
+    tareas = [4, 2, 1, 3]  # Puedes cambiar los valores
+    promedio = minimizar_tiempo_promedio_non_preemptive(tareas)
+    print(f"Tiempo promedio de finalización (non-preemptive): {promedio}")
+
+    # Dos máquinas, con prioridades (regla de Smith)
+    plan = planificar_spt([4, 2, 1, 3], pesos=[1, 1, 3, 2], maquinas=2)
+    print(f"Finalizaciones: {plan.finalizaciones}, máquinas: {plan.maquinas}, promedio ponderado: {plan.promedio}")
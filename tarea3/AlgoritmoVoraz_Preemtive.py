@@ -0,0 +1,88 @@
+import heapq
+
+from .instrumentacion import sonda
+
+# Tiempo de ejecución: O(n log n), independiente de la duración de las tareas
+# Uso de memoria: O(n) para heap y almacenamiento de tareas
+# Justificación: Se usa heap para acceder rápidamente a la tarea con menor tiempo restante,
+# y la simulación salta directamente al siguiente evento (llegada o terminación)
+
+def simular_srpt(tareas):
+    """
+    Simula la política SRPT (Shortest Remaining Processing Time) dirigida por eventos.
+    :param tareas: Lista de tuplas (ri, pi) con tiempo de llegada y duración (enteros o flotantes)
+    :return: Tupla (promedio, finalizaciones, esperas, respuestas), donde las tres listas
+             están en el orden original de las tareas:
+             - finalizaciones[j]: instante en que termina la tarea j
+             - esperas[j]: tiempo total que la tarea j estuvo lista sin ejecutarse
+             - respuestas[j]: tiempo desde la llegada hasta su primera ejecución
+    Dentro de tarea3.instrumentacion.instrumentar() se cuentan las operaciones del heap y su tamaño
+    máximo; heap_push - n es el número de expropiaciones.
+    """
+    medicion = sonda("AlgoritmoVoraz_Preemtive.simular_srpt")
+    heappush, heappop = medicion.heap(heapq.heappush, heapq.heappop)
+    medicion.fase("ordenar")
+    n = len(tareas)
+    # Ordenamos una copia por tiempo de llegada (no se modifica la lista original)
+    orden = sorted(range(n), key=lambda j: tareas[j])
+
+    finalizaciones = [0] * n
+    respuestas = [None] * n
+    heap = []  # Min-heap por (tiempo restante, ri, id)
+    tiempo = 0
+    i = 0
+    medicion.fase("simular")
+
+    while i < n or heap:
+        if not heap:
+            # No hay tareas disponibles, saltamos a la siguiente llegada
+            tiempo = max(tiempo, tareas[orden[i]][0])
+
+        # Agregar tareas disponibles al heap
+        while i < n and tareas[orden[i]][0] <= tiempo:
+            idx = orden[i]
+            ri, pi = tareas[idx]
+            heappush(heap, (pi, ri, idx))
+            i += 1
+
+        tiempo_restante, ri, idx = heappop(heap)
+        if respuestas[idx] is None:
+            respuestas[idx] = tiempo - ri
+
+        # Ejecutamos hasta que termine o llegue otra tarea (lo que ocurra primero)
+        siguiente_llegada = tareas[orden[i]][0] if i < n else None
+        if siguiente_llegada is None or tiempo + tiempo_restante <= siguiente_llegada:
+            tiempo += tiempo_restante
+            finalizaciones[idx] = tiempo
+        else:
+            ejecutado = siguiente_llegada - tiempo
+            tiempo = siguiente_llegada
+            heappush(heap, (tiempo_restante - ejecutado, ri, idx))
+
+    medicion.fase("estadisticas")
+    esperas = [finalizaciones[j] - tareas[j][0] - tareas[j][1] for j in range(n)]
+    promedio = sum(finalizaciones) / n
+    medicion.terminar()
+    return promedio, finalizaciones, esperas, respuestas
+
+
+def minimizar_tiempo_promedio_preemptive(tareas):
+    """
+    Minimiza el tiempo promedio de finalización bajo asignación preemptive.
+    :param tareas: Lista de tuplas (ri, pi) donde ri es el tiempo de llegada y pi el tiempo total de ejecución
+    :return: Tiempo promedio de finalización
+    """
+    promedio, _, _, _ = simular_srpt(tareas)
+    return promedio
+
+
+# Ejemplo de uso
+if __name__ == "__main__":
+    tareas = [(0, 3), (1, 9), (2, 6)]  # (ri, pi)
+    promedio = minimizar_tiempo_promedio_preemptive(tareas)
+    print(f"Tiempo promedio de finalización (preemptive): {promedio}")
+
+    promedio, finalizaciones, esperas, respuestas = simular_srpt([(0, 3.5e6), (1.5, 9e6), (2, 6e6)])
+    print(f"Finalizaciones: {finalizaciones}")
+    print(f"Esperas: {esperas}")
+    print(f"Respuestas: {respuestas}")
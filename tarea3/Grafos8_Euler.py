@@ -0,0 +1,262 @@
+from array import array
+from collections import Counter, defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+
+from .grafo_compacto import como_compacto, leer_aristas
+
+# Tiempo de ejecución: O(E)
+# Uso de memoria: O(E + V)
+# Justificación: Se recorre cada arista una sola vez, y se almacenan en estructuras auxiliares
+
+def tiene_ciclo_euleriano(grafo):
+    """
+    Verifica si el grafo dirigido tiene un ciclo de Euler.
+    :param grafo: Diccionario de adyacencia {u: [v1, v2, ...]}
+    :return: True si existe un ciclo de Euler
+    """
+    in_degree = defaultdict(int)
+    out_degree = defaultdict(int)
+
+    for u in grafo:
+        for v in grafo[u]:
+            out_degree[u] += 1
+            in_degree[v] += 1
+
+    vertices = set(grafo.keys()) | set(in_degree.keys())
+    for v in vertices:
+        if in_degree[v] != out_degree[v]:
+            return False
+    return True
+
+
+def _balance_de_shard(ruta):
+    # Balance salida - entrada de cada vértice en un shard "u v" (sólo los distintos de cero)
+    balance = Counter()
+    with open(ruta) as archivo:
+        for u, v, *_ in leer_aristas(archivo):
+            balance[u] += 1
+            balance[v] -= 1
+    return Counter({v: b for v, b in balance.items() if b})
+
+
+def tiene_ciclo_euleriano_shards(rutas, procesos=None):
+    """
+    Verifica la condición de grados del ciclo de Euler sobre un grafo guardado en varios
+    archivos de aristas ("u v" por línea), contando cada archivo en un proceso distinto.
+
+    Tiempo de ejecución: O(E / P + U) con P procesos y U vértices desbalanceados por shard
+    Uso de memoria: O(V_shard) por proceso; nunca se carga la adyacencia completa
+    Justificación: Basta el balance salida - entrada de cada vértice, que es una suma y se puede
+    calcular por partes. Cada proceso devuelve sólo los vértices con balance distinto de cero
+    en su shard, y al sumar los parciales quedan exactamente los vértices desbalanceados.
+    Los parciales son Counter y no arreglos de NumPy porque las etiquetas de los vértices de un
+    shard son arbitrarias, no ids enteros densos: un arreglo exigiría que todos los procesos
+    internaran las etiquetas con la misma numeración antes de contar.
+
+    :param rutas: Lista de rutas de los shards
+    :param procesos: Número de procesos (por defecto, los núcleos disponibles); 1 = sin pool
+    :return: Tupla (True si todos los vértices están balanceados, lista de vértices desbalanceados)
+    """
+    total = Counter()  # update suma también los balances negativos (a diferencia de +)
+    if procesos == 1 or len(rutas) <= 1:
+        for parcial in map(_balance_de_shard, rutas):
+            total.update(parcial)
+    else:
+        with ProcessPoolExecutor(max_workers=procesos) as pool:
+            for parcial in pool.map(_balance_de_shard, rutas):
+                total.update(parcial)
+
+    desbalanceados = [v for v, b in total.items() if b]
+    return not desbalanceados, desbalanceados
+
+
+def recorrido_euleriano(grafo):
+    """
+    Encuentra un ciclo de Euler en un grafo dirigido si existe.
+    :param grafo: Diccionario de adyacencia {u: [v1, v2, ...]}
+    :return: Lista de nodos en orden de recorrido euleriano o None
+    """
+    if not tiene_ciclo_euleriano(grafo):
+        return None
+
+    grafo_copia = {u: deque(vs) for u, vs in grafo.items()}  # Copia con deque para O(1) pop
+    circuito = []
+    stack = []
+    
+    # Elegimos un vértice con al menos una arista saliente como inicio
+    actual = next((v for v in grafo if grafo[v]), None)
+    stack.append(actual)
+
+    while stack:
+        while grafo_copia[actual]:
+            stack.append(actual)
+            siguiente = grafo_copia[actual].popleft()
+            actual = siguiente
+        circuito.append(actual)
+        actual = stack.pop()
+
+    # Si quedaron aristas sin recorrer, no todas están en una misma componente
+    if len(circuito) != sum(len(vs) for vs in grafo.values()) + 1:
+        return None
+
+    return circuito[::-1]  # Invertimos para obtener orden correcto
+
+
+def _grados_y_componentes(grafo):
+    # Grados de entrada de un GrafoCompacto y verificación de que todas las aristas estén
+    # en una sola componente débilmente conexa (union-find con compresión de caminos)
+    n = grafo.num_nodos
+    desplazamientos, destinos = grafo.desplazamientos, grafo.destinos
+    in_degree = array("q", bytes(8 * n))
+    padre = array("q", range(n))
+
+    def raiz(x):
+        r = x
+        while padre[r] != r:
+            r = padre[r]
+        while padre[x] != r:
+            padre[x], x = r, padre[x]
+        return r
+
+    for u in range(n):
+        ru = None
+        for e in range(desplazamientos[u], desplazamientos[u + 1]):
+            v = destinos[e]
+            in_degree[v] += 1
+            ru = raiz(u) if ru is None else raiz(ru)
+            rv = raiz(v)
+            if ru != rv:
+                padre[rv] = ru
+
+    raices = {raiz(u) for u in range(n)
+              if desplazamientos[u + 1] > desplazamientos[u] or in_degree[u]}
+    return in_degree, len(raices) <= 1
+
+
+def _inicio_euleriano(grafo, in_degree, permitir_camino):
+    # Vértice de inicio de un ciclo (o camino) de Euler, o None si no existe
+    desplazamientos = grafo.desplazamientos
+    inicio = fin = None
+    primero = None
+    for u in range(grafo.num_nodos):
+        salida = desplazamientos[u + 1] - desplazamientos[u]
+        balance = salida - in_degree[u]
+        if primero is None and salida:
+            primero = u
+        if balance == 0:
+            continue
+        if not permitir_camino:
+            return None
+        if balance == 1 and inicio is None:
+            inicio = u
+        elif balance == -1 and fin is None:
+            fin = u
+        else:
+            return None
+    return primero if inicio is None else inicio
+
+
+def recorrido_euleriano_csr(grafo, permitir_camino=True):
+    """
+    Hierholzer sobre el CSR de un GrafoCompacto (los diccionarios se adaptan con como_compacto).
+
+    Tiempo de ejecución: O(V + E)
+    Uso de memoria: O(V) para cursores y grados, más el arreglo de salida de E + 1 enteros
+    y la pila de trabajo (hasta E + 1 enteros en el peor caso)
+    Justificación: En lugar de copiar cada lista de adyacencia, se avanza un cursor por vértice
+    sobre el arreglo de destinos; el circuito se escribe de atrás hacia adelante en un arreglo
+    preasignado, así que no hace falta invertirlo.
+
+    :param permitir_camino: Si es True, también acepta caminos de Euler (un vértice con una
+                            salida de más y otro con una entrada de más)
+    :return: array('q') con los ids de los nodos en orden de recorrido (grafo.etiqueta_de
+             los traduce), o None si no existe ciclo ni camino de Euler
+    """
+    grafo = como_compacto(grafo)
+    in_degree, conexo = _grados_y_componentes(grafo)
+    inicio = _inicio_euleriano(grafo, in_degree, permitir_camino)
+    if not conexo or inicio is None:
+        return None
+
+    desplazamientos, destinos = grafo.desplazamientos, grafo.destinos
+    cursor = array("q", desplazamientos[:-1])  # Siguiente arista sin usar de cada vértice
+    recorrido = array("q", bytes(8 * (grafo.num_aristas + 1)))
+    pos = grafo.num_aristas
+    stack = array("q", [inicio])
+
+    while stack:
+        actual = stack[-1]
+        if cursor[actual] < desplazamientos[actual + 1]:
+            stack.append(destinos[cursor[actual]])
+            cursor[actual] += 1
+        else:
+            recorrido[pos] = stack.pop()
+            pos -= 1
+
+    return recorrido
+
+
+def iterar_recorrido_euleriano(grafo, permitir_camino=True):
+    """
+    Versión generadora de recorrido_euleriano_csr: entrega las etiquetas de los nodos en orden,
+    sin arreglo de salida.
+
+    Justificación: Hierholzer produce el recorrido al revés. Si se ejecuta sobre el grafo
+    transpuesto empezando por el vértice final, el orden en que se sacan los vértices de la
+    pila es justamente el recorrido del grafo original de inicio a fin.
+
+    :raises ValueError: Si no existe ciclo ni camino de Euler (se verifica antes de entregar nada)
+    """
+    grafo = como_compacto(grafo)
+    in_degree, conexo = _grados_y_componentes(grafo)
+    inicio = _inicio_euleriano(grafo, in_degree, permitir_camino)
+    if not conexo or inicio is None:
+        raise ValueError("El grafo no tiene ciclo ni camino de Euler")
+
+    # CSR transpuesto por conteo
+    n = grafo.num_nodos
+    desplazamientos, destinos = grafo.desplazamientos, grafo.destinos
+    inversos = array("q", bytes(8 * (n + 1)))
+    for v in range(n):
+        inversos[v + 1] = inversos[v] + in_degree[v]
+    cursor = array("q", inversos[:-1])
+    origenes = array("q", bytes(8 * grafo.num_aristas))
+    for u in range(n):
+        for e in range(desplazamientos[u], desplazamientos[u + 1]):
+            v = destinos[e]
+            origenes[cursor[v]] = u
+            cursor[v] += 1
+
+    # El vértice final del recorrido original: el de entrada de más, o el inicio si es ciclo
+    final = inicio
+    for v in range(n):
+        if in_degree[v] - (desplazamientos[v + 1] - desplazamientos[v]) == 1:
+            final = v
+            break
+
+    cursor = array("q", inversos[:-1])
+    stack = array("q", [final])
+    while stack:
+        actual = stack[-1]
+        if cursor[actual] < inversos[actual + 1]:
+            stack.append(origenes[cursor[actual]])
+            cursor[actual] += 1
+        else:
+            yield grafo.etiqueta_de(stack.pop())
+
+
+# Ejemplo de uso
+if __name__ == "__main__":
+    # Grafo dirigido representado como lista de adyacencia
+    grafo = {
+        'A': ['B'],
+        'B': ['C'],
+        'C': ['A']
+    }
+
+    camino = recorrido_euleriano(grafo)
+    if camino:
+        print("Recorrido de Euler encontrado:")
+        print(" -> ".join(camino))
+    else:
+        print("No existe un recorrido de Euler en este grafo.")
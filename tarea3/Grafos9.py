@@ -0,0 +1,385 @@
+import math
+import heapq
+import random
+import time
+import tracemalloc
+from collections import OrderedDict, defaultdict
+
+from .grafo_compacto import GrafoCompacto
+from .instrumentacion import sonda
+
+def camino_mas_confiable(grafo, inicio, fin):
+    """
+    Encuentra el camino más confiable (máximo producto de probabilidades) entre dos nodos en un grafo dirigido.
+
+    Complejidad temporal:
+    - O((V + E) log V), Dijkstra con heap; sólo se insertan entradas que mejoran la distancia.
+
+    Complejidad espacial:
+    - O(V + E') para distancias, predecesores y el heap, con E' <= E las inserciones que mejoran.
+      Ya no se copia el camino en cada inserción.
+
+    Justificación:
+    - Usamos logaritmos negativos para transformar multiplicación en suma.
+    - Aplicamos Dijkstra para minimizar el costo total de -log(probabilidad),
+      lo cual equivale a maximizar el producto original de probabilidades.
+    - Se guarda la mejor distancia conocida y el predecesor de cada nodo; una arista sólo
+      se inserta en el heap si mejora esa distancia, y las entradas obsoletas se descartan.
+    - Cada nodo se expande una sola vez, así que -log(prob) se calcula una vez por arista.
+    - El camino se reconstruye siguiendo los predecesores sólo para el nodo destino.
+    - Dentro de tarea3.instrumentacion.instrumentar() se cuentan inserciones y extracciones del heap,
+      entradas obsoletas, nodos expandidos, aristas relajadas y el tamaño máximo del heap.
+    """
+    medicion = sonda("Grafos9.camino_mas_confiable")
+    heappush, heappop = medicion.heap(heapq.heappush, heapq.heappop)
+
+    distancia = {inicio: 0.0}
+    predecesor = {inicio: None}
+    heap = [(0.0, inicio)]  # (neg_log_prob, nodo_actual)
+    visitado = set()
+    relajadas = 0  # Aristas que mejoraron una distancia
+
+    while heap:
+        neg_log_prob, nodo = heappop(heap)
+        if nodo in visitado:
+            continue  # Entrada obsoleta: ya se encontró una mejor
+        visitado.add(nodo)
+
+        if nodo == fin:
+            camino = [nodo]
+            while predecesor[camino[-1]] is not None:
+                camino.append(predecesor[camino[-1]])
+            camino.reverse()
+            prob_total = math.exp(-neg_log_prob)  # Convertimos log negativo a probabilidad real
+            medicion.terminar(heap_perezoso=True, expandidos=len(visitado), aristas_relajadas=relajadas)
+            return prob_total, camino
+
+        for vecino, prob in grafo.get(nodo, ()):
+            if prob > 0 and vecino not in visitado:
+                nuevo_costo = neg_log_prob - math.log(prob)
+                if nuevo_costo < distancia.get(vecino, math.inf):
+                    distancia[vecino] = nuevo_costo
+                    predecesor[vecino] = nodo
+                    heappush(heap, (nuevo_costo, vecino))
+                    relajadas += 1
+
+    medicion.terminar(heap_perezoso=True, expandidos=len(visitado), aristas_relajadas=relajadas)
+    return 0.0, "No hay camino confiable"
+
+
+def camino_mas_confiable_referencia(grafo, inicio, fin):
+    """
+    Implementación original, que copia el camino en cada inserción al heap.
+    Se conserva como referencia para validar y comparar rendimiento.
+
+    Complejidad temporal:
+    - O(E log E), con una entrada en el heap por cada arista relajada.
+
+    Complejidad espacial:
+    - O(E * L), siendo L la longitud de los caminos copiados en el heap.
+    """
+
+    heap = [(-0.0, inicio, [])]  # (neg_log_prob, nodo_actual, camino)
+    visitado = set()
+
+    while heap:
+        neg_log_prob, nodo, camino = heapq.heappop(heap)
+        if nodo in visitado:
+            continue
+        visitado.add(nodo)
+        camino = camino + [nodo]
+
+        if nodo == fin:
+            prob_total = math.exp(-neg_log_prob)  # Convertimos log negativo a probabilidad real
+            return prob_total, camino
+
+        for vecino, prob in grafo[nodo]:
+            if prob > 0:
+                nuevo_costo = neg_log_prob - math.log(prob)
+                heapq.heappush(heap, (nuevo_costo, vecino, camino))
+
+    return 0.0, "No hay camino confiable"
+
+
+def _dijkstra_completo(adyacencia, fuente):
+    # Árbol de caminos mínimos de una fuente a todos los nodos: (distancia, predecesor)
+    distancia = {fuente: 0.0}
+    predecesor = {fuente: None}
+    heap = [(0.0, fuente)]
+    while heap:
+        d, u = heapq.heappop(heap)
+        if d > distancia[u]:
+            continue
+        for v, w in adyacencia.get(u, ()):
+            nd = d + w
+            if nd < distancia.get(v, math.inf):
+                distancia[v] = nd
+                predecesor[v] = u
+                heapq.heappush(heap, (nd, v))
+    return distancia, predecesor
+
+
+def _aristas_con_peso(grafo):
+    # Pares (u, aristas (v, prob)) del diccionario, o leídos de las columnas de un GrafoCompacto
+    if not isinstance(grafo, GrafoCompacto):
+        return grafo.items()
+    d, destinos, pesos, nombre = grafo.desplazamientos, grafo.destinos, grafo.pesos, grafo.etiqueta_de
+    return ((nombre(u), zip(map(nombre, destinos[d[u]:d[u + 1]]), pesos[d[u]:d[u + 1]]))
+            for u in range(grafo.num_nodos))
+
+
+class ReliabilityIndex:
+    """
+    Índice para responder muchas consultas de camino más confiable sobre el mismo grafo.
+
+    Complejidad temporal:
+    - Preprocesamiento: O(L (V + E) log V) para las distancias desde y hacia L landmarks.
+    - Consulta sin caché: búsqueda bidireccional A* con cotas ALT; en el peor caso O((V + E) log V),
+      pero en la práctica explora una fracción pequeña del grafo.
+    - Consulta con el árbol de la fuente en caché: O(largo del camino).
+
+    Complejidad espacial:
+    - O(L V) para las distancias de los landmarks, O(V + E) para las aristas con peso -log(p)
+      y a lo más max_nodos_cache entradas entre todos los árboles guardados.
+
+    Justificación:
+    - Los pesos -log(prob) se calculan una sola vez al construir el índice. Con un GrafoCompacto
+      se leen directamente las columnas destinos y pesos del CSR, sin armar listas por nodo.
+    - Por la desigualdad del triángulo, para cada landmark L:
+      d(v, t) >= d(L, t) - d(L, v)  y  d(v, t) >= d(v, L) - d(t, L),
+      lo que da una cota inferior admisible y consistente para guiar A*.
+    - La búsqueda bidireccional usa el promedio de las cotas hacia el destino y desde el origen
+      como potencial, para que ambas direcciones vean costos reducidos no negativos.
+    - Las fuentes consultadas al menos umbral_caliente veces obtienen su árbol completo, que se
+      guarda en una caché LRU acotada por el número total de nodos almacenados.
+    - Si el árbol de una fuente no cabe en la caché, la fuente se marca y sus consultas siguientes
+      usan la búsqueda bidireccional en vez de repetir el Dijkstra completo.
+    - Los contadores de consultas por fuente (y las marcas) también son LRU, con a lo más
+      max_fuentes_contadas entradas; las fuentes que dejan de consultarse se olvidan.
+    """
+
+    def __init__(self, grafo, num_landmarks=8, max_nodos_cache=1_000_000, umbral_caliente=2,
+                 max_fuentes_contadas=100_000):
+        self.adyacencia = {}
+        self.inversa = defaultdict(list)
+        nodos = set(grafo)
+        for u, aristas in _aristas_con_peso(grafo):
+            salientes = []
+            for v, prob in aristas:
+                if prob > 0:
+                    w = -math.log(prob)
+                    salientes.append((v, w))
+                    self.inversa[v].append((u, w))
+                    nodos.add(v)
+            self.adyacencia[u] = salientes
+        self.inversa = dict(self.inversa)
+        self.nodos = nodos
+
+        self.max_nodos_cache = max_nodos_cache
+        self.umbral_caliente = umbral_caliente
+        self._cache = OrderedDict()  # fuente -> (distancia, predecesor)
+        self._nodos_en_cache = 0
+        self.max_fuentes_contadas = max_fuentes_contadas
+        self._consultas_por_fuente = OrderedDict()  # fuente -> consultas, o None si su árbol no cabe
+        self.aciertos = 0
+        self.fallos = 0
+
+        self.landmarks = []
+        self._desde_landmark = []  # d(L, v)
+        self._hacia_landmark = []  # d(v, L)
+        self._elegir_landmarks(num_landmarks)
+
+    def _elegir_landmarks(self, num_landmarks):
+        # Selección "más lejano primero": cada landmark nuevo es el nodo más alejado de los anteriores
+        if not self.nodos or num_landmarks <= 0:
+            return
+        candidato = min(self.nodos, key=repr)
+        cercania = {}
+        for _ in range(min(num_landmarks, len(self.nodos))):
+            self.landmarks.append(candidato)
+            desde, _ = _dijkstra_completo(self.adyacencia, candidato)
+            hacia, _ = _dijkstra_completo(self.inversa, candidato)
+            self._desde_landmark.append(desde)
+            self._hacia_landmark.append(hacia)
+            for v in self.nodos:
+                d = min(desde.get(v, math.inf), hacia.get(v, math.inf))
+                cercania[v] = min(cercania.get(v, math.inf), d)
+            # Preferimos el más lejano alcanzable; los inalcanzables sólo si no queda otro
+            restantes = [v for v in self.nodos if cercania[v] > 0]
+            if not restantes:
+                break
+            finitos = [v for v in restantes if cercania[v] < math.inf]
+            candidato = max(finitos, key=cercania.get) if finitos else restantes[0]
+
+    def _cota(self, v, t):
+        # Cota inferior ALT de d(v, t); se ignoran los términos con distancias infinitas
+        cota = 0.0
+        for desde, hacia in zip(self._desde_landmark, self._hacia_landmark):
+            lt, lv = desde.get(t), desde.get(v)
+            if lt is not None and lv is not None and lt - lv > cota:
+                cota = lt - lv
+            vl, tl = hacia.get(v), hacia.get(t)
+            if vl is not None and tl is not None and vl - tl > cota:
+                cota = vl - tl
+        return cota
+
+    @property
+    def estadisticas_cache(self):
+        """Contadores de la caché de árboles: aciertos, fallos, árboles y nodos almacenados."""
+        return {
+            "aciertos": self.aciertos,
+            "fallos": self.fallos,
+            "arboles": len(self._cache),
+            "nodos": self._nodos_en_cache,
+        }
+
+    def camino_mas_confiable(self, inicio, fin):
+        """
+        Mismo contrato que camino_mas_confiable(grafo, inicio, fin):
+        :return: (probabilidad, camino) o (0.0, "No hay camino confiable")
+        """
+        arbol = self._cache.get(inicio)
+        if arbol is not None:
+            self.aciertos += 1
+            self._cache.move_to_end(inicio)
+            return self._desde_arbol(arbol, fin)
+
+        self.fallos += 1
+        consultas = self._consultas_por_fuente.pop(inicio, 0)
+        if consultas is not None and consultas + 1 >= self.umbral_caliente:
+            arbol = _dijkstra_completo(self.adyacencia, inicio)
+            if not self._guardar_arbol(inicio, arbol):
+                self._contar(inicio, None)  # No cabe: las próximas consultas van por _bidireccional
+            return self._desde_arbol(arbol, fin)
+        self._contar(inicio, None if consultas is None else consultas + 1)
+        return self._bidireccional(inicio, fin)
+
+    def _contar(self, fuente, consultas):
+        # Contadores LRU: la fuente queda como la más reciente y se olvidan las más antiguas
+        self._consultas_por_fuente[fuente] = consultas
+        if len(self._consultas_por_fuente) > self.max_fuentes_contadas:
+            self._consultas_por_fuente.popitem(last=False)
+
+    def _guardar_arbol(self, fuente, arbol):
+        # Devuelve False si el árbol no cabe ni solo en la caché
+        tam = len(arbol[0])
+        if tam > self.max_nodos_cache:
+            return False
+        self._cache[fuente] = arbol
+        self._nodos_en_cache += tam
+        while self._nodos_en_cache > self.max_nodos_cache:
+            _, (distancia, _) = self._cache.popitem(last=False)
+            self._nodos_en_cache -= len(distancia)
+        return True
+
+    @staticmethod
+    def _desde_arbol(arbol, fin):
+        distancia, predecesor = arbol
+        if fin not in distancia:
+            return 0.0, "No hay camino confiable"
+        camino = [fin]
+        while predecesor[camino[-1]] is not None:
+            camino.append(predecesor[camino[-1]])
+        camino.reverse()
+        return math.exp(-distancia[fin]), camino
+
+    def _bidireccional(self, inicio, fin):
+        if inicio == fin:
+            return 1.0, [inicio]
+
+        # Potencial promedio: p(v) = (cota(v, fin) - cota(inicio, v)) / 2
+        potenciales = {}
+
+        def potencial(v):
+            p = potenciales.get(v)
+            if p is None:
+                p = (self._cota(v, fin) - self._cota(inicio, v)) / 2
+                potenciales[v] = p
+            return p
+
+        dist = ({inicio: 0.0}, {fin: 0.0})
+        enlace = ({inicio: None}, {fin: None})  # predecesor hacia adelante, sucesor hacia atrás
+        heaps = ([(potencial(inicio), inicio)], [(-potencial(fin), fin)])
+        cerrados = (set(), set())
+        grafos = (self.adyacencia, self.inversa)
+        signos = (1, -1)
+        mejor, encuentro = math.inf, None
+
+        while heaps[0] and heaps[1]:
+            # Criterio de parada: las claves mínimas de ambos lados ya no pueden mejorar
+            if heaps[0][0][0] + heaps[1][0][0] >= mejor:
+                break
+            lado = 0 if heaps[0][0][0] <= heaps[1][0][0] else 1
+            otro = 1 - lado
+            clave, u = heapq.heappop(heaps[lado])
+            if u in cerrados[lado]:
+                continue
+            cerrados[lado].add(u)
+            du = dist[lado][u]
+            for v, w in grafos[lado].get(u, ()):
+                nd = du + w
+                if nd < dist[lado].get(v, math.inf):
+                    dist[lado][v] = nd
+                    enlace[lado][v] = u
+                    heapq.heappush(heaps[lado], (nd + signos[lado] * potencial(v), v))
+                    if v in dist[otro] and nd + dist[otro][v] < mejor:
+                        mejor, encuentro = nd + dist[otro][v], v
+
+        if encuentro is None:
+            return 0.0, "No hay camino confiable"
+
+        camino = [encuentro]
+        while enlace[0][camino[-1]] is not None:
+            camino.append(enlace[0][camino[-1]])
+        camino.reverse()
+        while enlace[1][camino[-1]] is not None:
+            camino.append(enlace[1][camino[-1]])
+        return math.exp(-mejor), camino
+
+
+def grafo_confiabilidad_aleatorio(n, grado, semilla=0):
+    """
+    Genera un grafo dirigido aleatorio con n nodos enteros y 'grado' aristas salientes por nodo,
+    con probabilidades en (0, 1]. Se usa para las comparaciones de rendimiento.
+    """
+    rng = random.Random(semilla)
+    return {u: [(rng.randrange(n), 1.0 - rng.random() * 0.5) for _ in range(grado)] for u in range(n)}
+
+
+def comparar_rendimiento(n=20000, grado=10, semilla=0):
+    """
+    Compara tiempo y memoria pico (tracemalloc) de la implementación original contra la actual
+    sobre un grafo aleatorio, buscando el camino más confiable de 0 a n - 1.
+    :return: Diccionario {nombre: (segundos, bytes_pico)}
+    """
+    grafo = grafo_confiabilidad_aleatorio(n, grado, semilla)
+    resultados = {}
+    for nombre, funcion in (("referencia", camino_mas_confiable_referencia),
+                            ("actual", camino_mas_confiable)):
+        tracemalloc.start()
+        t0 = time.perf_counter()
+        funcion(grafo, 0, n - 1)
+        segundos = time.perf_counter() - t0
+        _, pico = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        resultados[nombre] = (segundos, pico)
+    return resultados
+
+
+# Ejemplo de uso
+if __name__ == "__main__":
+    grafo = {
+    'A': [('B', 0.9), ('C', 0.5)],
+    'B': [('D', 0.7), ('E', 0.6)],
+    'C': [('E', 0.9)],
+    'D': [('F', 0.8)],
+    'E': [('F', 0.9)],
+    'F': []
+    }
+
+    prob, camino = camino_mas_confiable(grafo, 'A', 'F')
+    print("Probabilidad máxima:", prob)
+    print("Camino más confiable:", camino)
+
+    for nombre, (segundos, pico) in comparar_rendimiento().items():
+        print(f"{nombre}: {segundos:.3f} s, memoria pico {pico / 1024:.0f} KiB")
\ No newline at end of file
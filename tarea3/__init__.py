@@ -0,0 +1,78 @@
+"""
+Algoritmos de la Tarea 3: planificación voraz, asignación de salones, grafos, Viterbi y palíndromos.
+
+Los submódulos se cargan de forma perezosa (PEP 562): importar el paquete no importa ningún
+algoritmo, y pedir uno (tarea3.camino_mas_confiable o tarea3.Grafos9) sólo carga su módulo.
+"""
+
+import importlib
+
+# Nombre público -> submódulo que lo define
+_EXPORTADOS = {
+    "minimizar_tiempo_promedio_non_preemptive": "AlgoritmoVoraz_NonPreemtive",
+    "planificar_spt": "AlgoritmoVoraz_NonPreemtive",
+    "minimizar_tiempo_promedio_preemptive": "AlgoritmoVoraz_Preemtive",
+    "simular_srpt": "AlgoritmoVoraz_Preemtive",
+    "PlanificadorOnline": "planificador_online",
+    "tiene_ciclo_euleriano": "Grafos8_Euler",
+    "tiene_ciclo_euleriano_shards": "Grafos8_Euler",
+    "recorrido_euleriano": "Grafos8_Euler",
+    "recorrido_euleriano_csr": "Grafos8_Euler",
+    "iterar_recorrido_euleriano": "Grafos8_Euler",
+    "camino_mas_confiable": "Grafos9",
+    "ReliabilityIndex": "Grafos9",
+    "weighted_interval_scheduling": "asignacion",
+    "weighted_interval_scheduling_columnar": "asignacion",
+    "weighted_interval_scheduling_batch": "asignacion",
+    "max_k_room_value": "asignacion",
+    "max_dual_room_value": "asignacion",
+    "tiene_ciclo": "ciclos6",
+    "ciclo_en_flujo_de_aristas": "ciclos6",
+    "longest_palindromic_subsequence": "palindromo",
+    "longest_palindromic_subsequence_lineal": "palindromo",
+    "longitud_lps": "palindromo",
+    "longest_palindromic_substring": "palindromo",
+    "manacher": "palindromo",
+    "ArbolPalindromico": "palindromo",
+    "analizar_palindromos": "palindromo",
+    "dfs_iterativa": "stack7",
+    "dfs_perezosa": "stack7",
+    "buscar_dfs": "stack7",
+    "viterbi_find_path": "viterbi",
+    "AutomataEtiquetado": "viterbi",
+    "viterbi_max_path": "viterbi_b",
+    "viterbi_max_path_checkpoints": "viterbi_b",
+    "viterbi_en_linea": "viterbi_b",
+    "viterbi_max_path_beam": "viterbi_b",
+    "viterbi_k_mejores": "viterbi_b",
+    "ModeloViterbi": "viterbi_b",
+    "DecodificadorCorpus": "decodificacion_corpus",
+    "asignar_salones": "voraces4",
+    "asignar_salones_stream": "voraces4",
+    "IndiceSalones": "voraces4",
+    "RoomAllocator": "voraces4",
+    "GrafoCompacto": "grafo_compacto",
+    "como_compacto": "grafo_compacto",
+    "leer_aristas": "grafo_compacto",
+    "instrumentar": "instrumentacion",
+    "Medicion": "instrumentacion",
+}
+
+_SUBMODULOS = frozenset(_EXPORTADOS.values()) | {"benchmark", "cli"}
+
+__all__ = sorted(_EXPORTADOS)
+
+
+def __getattr__(nombre):
+    if nombre in _SUBMODULOS:
+        return importlib.import_module(f".{nombre}", __name__)
+    modulo = _EXPORTADOS.get(nombre)
+    if modulo is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {nombre!r}")
+    valor = getattr(importlib.import_module(f".{modulo}", __name__), nombre)
+    globals()[nombre] = valor  # Las siguientes búsquedas ya no pasan por __getattr__
+    return valor
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__) | _SUBMODULOS)
@@ -0,0 +1,358 @@
+import heapq
+from array import array
+from bisect import bisect_right
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional: sin él se usan array('d') y bisect
+    np = None
+
+def compute_previous(activities):
+    """
+    Para cada actividad, encuentra el índice de la última que no se traslapa con ella.
+
+    Complejidad: O(n log n)
+    - Ordenamos las actividades por hora de finalización.
+    - Luego, para cada actividad usamos búsqueda binaria para encontrar
+      la última que termina antes de que inicie esta.
+    """
+    activities.sort(key=lambda x: x[1])  # Ordenamos por hora de fin
+    fines = [a[1] for a in activities]  # Se construye una sola vez, no en cada iteración
+    prev = []
+    for i in range(len(activities)):
+        j = bisect_right(fines, activities[i][0]) - 1
+        prev.append(j)
+    return prev
+
+
+def weighted_interval_scheduling(activities):
+    """
+    Encuentra el subconjunto de actividades no traslapadas con valor total máximo
+    usando programación dinámica. Solo se usa un salón.
+
+    Complejidad temporal:
+    - O(n log n) para ordenar y buscar actividades compatibles.
+    - O(n) para calcular el valor óptimo.
+    - Total: O(n log n)
+
+    Complejidad espacial:
+    - O(n) para la tabla de programación dinámica y las marcas de inclusión.
+
+    Justificación:
+    - Se modela el problema como una variante del clásico problema del "knapsack".
+    - Cada actividad tiene inicio, fin y valor.
+    - Usamos dp[i] para guardar el valor óptimo usando las primeras i actividades.
+    - Se decide si incluir o excluir cada actividad según cuál da más valor.
+    - En lugar de copiar la lista de seleccionadas en cada celda, se marca si la actividad
+      se incluyó y la selección se reconstruye una sola vez al final en O(n).
+    """
+    n = len(activities)
+    prev = compute_previous(activities)
+    dp = [0] * (n + 1)
+    incluida = [False] * (n + 1)
+
+    for i in range(1, n + 1):
+        act = activities[i - 1]
+        incl_val = act[2] + dp[prev[i - 1] + 1]  # Valor si se incluye esta
+        excl_val = dp[i - 1]                    # Valor si se excluye esta
+        if incl_val > excl_val:
+            dp[i] = incl_val
+            incluida[i] = True
+        else:
+            dp[i] = excl_val
+
+    # Reconstrucción siguiendo los punteros implícitos (prev o i - 1)
+    selected = []
+    i = n
+    while i > 0:
+        if incluida[i]:
+            selected.append(activities[i - 1])
+            i = prev[i - 1] + 1
+        else:
+            i -= 1
+    selected.reverse()
+
+    return dp[n], selected
+
+
+def weighted_interval_scheduling_columnar(starts, ends, values):
+    """
+    Versión columnar de weighted_interval_scheduling: recibe columnas separadas
+    (arreglos de NumPy, array('d') o listas) de inicios, fines y valores.
+
+    Complejidad temporal:
+    - O(n log n) para ordenar por fin y calcular todos los predecesores.
+      Con NumPy los predecesores se obtienen con un solo searchsorted vectorizado.
+    - O(n) para la programación dinámica y la reconstrucción.
+    - Total: O(n log n)
+
+    Complejidad espacial:
+    - O(n) en arreglos compactos: orden, predecesores, tabla dp y marcas de inclusión.
+
+    Justificación:
+    - Es la misma recurrencia que weighted_interval_scheduling, pero sin tuplas por actividad
+      ni copias de listas: solo se guarda si cada actividad se incluyó (puntero al padre implícito).
+    - No modifica las columnas de entrada.
+
+    :return: (valor total, lista de índices originales seleccionados, en orden de fin)
+    """
+    n = len(starts)
+    if not (len(ends) == len(values) == n):
+        raise ValueError("starts, ends y values deben tener la misma longitud")
+
+    if np is not None:
+        inicios = np.asarray(starts, dtype=float)
+        fines = np.asarray(ends, dtype=float)
+        orden = np.argsort(fines, kind="stable")
+        fines_ordenados = fines[orden]
+        # Predecesor de cada actividad: última que termina a más tardar cuando inicia
+        prev = (np.searchsorted(fines_ordenados, inicios[orden], side="right") - 1).tolist()
+        valores = np.asarray(values, dtype=float)[orden].tolist()
+        orden = orden.tolist()
+    else:
+        orden = sorted(range(n), key=ends.__getitem__)
+        fines_ordenados = array("d", (ends[i] for i in orden))
+        prev = array("l", (bisect_right(fines_ordenados, starts[i]) - 1 for i in orden))
+        valores = array("d", (values[i] for i in orden))
+
+    dp = array("d", bytes(8 * (n + 1)))
+    incluida = bytearray(n + 1)
+    for i in range(1, n + 1):
+        incl_val = valores[i - 1] + dp[prev[i - 1] + 1]
+        excl_val = dp[i - 1]
+        if incl_val > excl_val:
+            dp[i] = incl_val
+            incluida[i] = 1
+        else:
+            dp[i] = excl_val
+
+    seleccion = []
+    i = n
+    while i > 0:
+        if incluida[i]:
+            seleccion.append(orden[i - 1])
+            i = prev[i - 1] + 1
+        else:
+            i -= 1
+    seleccion.reverse()
+
+    return dp[n], seleccion
+
+
+def weighted_interval_scheduling_batch(conjuntos):
+    """
+    Resuelve muchos conjuntos independientes de actividades en una sola llamada
+    (por ejemplo, uno por edificio por día).
+
+    Complejidad temporal:
+    - O(sum n_i log n_i), aplicando weighted_interval_scheduling_columnar a cada conjunto.
+
+    Complejidad espacial:
+    - O(max n_i) de trabajo más los resultados.
+
+    :param conjuntos: Iterable de tuplas (starts, ends, values)
+    :return: Lista de resultados (valor total, índices seleccionados), en el mismo orden
+    """
+    return [weighted_interval_scheduling_columnar(s, e, v) for s, e, v in conjuntos]
+
+
+def max_k_room_value(activities, k=2):
+    """
+    Selecciona actividades para k salones maximizando el valor total, de forma exacta.
+
+    Complejidad temporal:
+    - O(n log n) para ordenar los tiempos y construir la red.
+    - O(k * n log n): a lo más k caminos aumentantes, cada uno con Dijkstra sobre O(n) nodos y aristas.
+    - Total: O(k * n log n)
+
+    Complejidad espacial:
+    - O(n) para la red de flujo, los potenciales y la asignación final.
+
+    Justificación:
+    - Un conjunto de intervalos cabe en k salones si y solo si en ningún instante se traslapan
+      más de k (los grafos de intervalos son perfectos).
+    - Se modela como flujo de costo mínimo: un nodo por cada tiempo distinto, una "cadena"
+      t_i -> t_(i+1) con capacidad k y costo 0, y por cada actividad una arista inicio -> fin
+      con capacidad 1 y costo -valor. Cada unidad de flujo es un salón recorriendo el día.
+    - Como todas las aristas originales avanzan en el tiempo, la red es un DAG y los potenciales
+      iniciales se obtienen en O(n); después se usa Dijkstra con costos reducidos (no negativos).
+    - Los costos de los caminos aumentantes son no decrecientes, así que se detiene en cuanto
+      uno deja de mejorar (costo >= 0).
+    - Las actividades con flujo 1 forman la selección óptima; se reparten en salones con el
+      mismo criterio voraz de voraces4 (el salón que se libera antes), que usa a lo más k salones.
+
+    :param activities: Lista de tuplas (inicio, fin, valor) con inicio < fin
+    :param k: Número de salones disponibles
+    :return: (valor total, (salon1, salon2, ..., salonk)); cada salón es una lista de actividades
+    """
+    if k < 0:
+        raise ValueError("k debe ser no negativo")
+    for inicio, fin, _ in activities:
+        if not inicio < fin:
+            raise ValueError(f"Actividad con inicio >= fin: {(inicio, fin)}")
+
+    # Las actividades con valor no positivo nunca mejoran la solución
+    candidatas = [a for a in activities if a[2] > 0]
+    tiempos = sorted({t for a in candidatas for t in a[:2]})
+    indice = {t: i for i, t in enumerate(tiempos)}
+    m = len(tiempos)
+
+    # Red residual en listas paralelas: la arista e y su inversa e ^ 1
+    destino, capacidad, costo = [], [], []
+    adyacencia = [[] for _ in range(m)]
+
+    def agregar_arista(u, v, cap, c):
+        adyacencia[u].append(len(destino))
+        destino.append(v)
+        capacidad.append(cap)
+        costo.append(c)
+        adyacencia[v].append(len(destino))
+        destino.append(u)
+        capacidad.append(0)
+        costo.append(-c)
+
+    for i in range(m - 1):
+        agregar_arista(i, i + 1, k, 0)
+    arista_de = []
+    for inicio, fin, valor in candidatas:
+        arista_de.append(len(destino))
+        agregar_arista(indice[inicio], indice[fin], 1, -valor)
+
+    # Potenciales iniciales: caminos mínimos en el DAG (los índices ya están en orden topológico)
+    potencial = [0] * m
+    for u in range(m):
+        for e in adyacencia[u]:
+            if e % 2 == 0 and potencial[u] + costo[e] < potencial[destino[e]]:
+                potencial[destino[e]] = potencial[u] + costo[e]
+
+    flujo_restante = k
+    while m > 1 and flujo_restante > 0:
+        # Dijkstra con costos reducidos costo[e] + potencial[u] - potencial[v] >= 0
+        distancia = [None] * m
+        padre = [-1] * m
+        distancia[0] = 0
+        heap = [(0, 0)]
+        while heap:
+            d, u = heapq.heappop(heap)
+            if d > distancia[u]:
+                continue
+            for e in adyacencia[u]:
+                if capacidad[e] > 0:
+                    v = destino[e]
+                    nd = d + costo[e] + potencial[u] - potencial[v]
+                    if distancia[v] is None or nd < distancia[v]:
+                        distancia[v] = nd
+                        padre[v] = e
+                        heapq.heappush(heap, (nd, v))
+
+        # Los nodos no alcanzados suben con la mayor distancia para conservar costos reducidos >= 0
+        maxima = max(d for d in distancia if d is not None)
+        for v in range(m):
+            potencial[v] += maxima if distancia[v] is None else distancia[v]
+        costo_camino = potencial[m - 1] - potencial[0]
+        if costo_camino >= 0:
+            break  # Ningún salón adicional aporta valor
+
+        # Cuello de botella del camino aumentante
+        delta = flujo_restante
+        v = m - 1
+        while v != 0:
+            e = padre[v]
+            delta = min(delta, capacidad[e])
+            v = destino[e ^ 1]
+        v = m - 1
+        while v != 0:
+            e = padre[v]
+            capacidad[e] -= delta
+            capacidad[e ^ 1] += delta
+            v = destino[e ^ 1]
+        flujo_restante -= delta
+
+    seleccionadas = [a for a, e in zip(candidatas, arista_de) if capacidad[e] == 0]
+    best = sum(a[2] for a in seleccionadas)
+
+    # Repartir la selección entre salones (a lo más k se traslapan en cada instante)
+    salones = [[] for _ in range(k)]
+    libres = [(tiempos[0] if tiempos else 0, s) for s in range(k)]
+    for act in sorted(seleccionadas, key=lambda a: (a[0], a[1])):
+        _, salon = heapq.heappop(libres)
+        salones[salon].append(act)
+        heapq.heappush(libres, (act[1], salon))
+
+    return best, tuple(salones)
+
+
+def max_dual_room_value(activities):
+    """
+    Divide las actividades entre dos salones para maximizar el valor total.
+
+    Complejidad temporal:
+    - O(n log n), usando el flujo de costo mínimo de max_k_room_value con k = 2.
+
+    Complejidad espacial:
+    - O(n) para la red de flujo y la asignación.
+
+    Justificación:
+    - Es el caso k = 2 de max_k_room_value; la versión por fuerza bruta se conserva en
+      max_dual_room_value_fuerza_bruta como referencia para entradas pequeñas.
+    """
+    return max_k_room_value(activities, 2)
+
+
+def max_dual_room_value_fuerza_bruta(activities):
+    """
+    Divide las actividades entre dos salones para maximizar el valor total.
+
+    Complejidad temporal:
+    - O(2^n * n log n): se prueban todas las particiones posibles de actividades (2^n),
+      y por cada partición se calcula la solución óptima para cada conjunto con programación dinámica.
+
+    Complejidad espacial:
+    - O(n²): por la duplicación de resultados parciales y almacenamiento de soluciones intermedias.
+
+    Justificación:
+    - Se usa fuerza bruta para probar todas las formas de dividir las actividades en dos conjuntos.
+    - Para cada subconjunto, se aplica programación dinámica (Weighted Interval Scheduling).
+    - Se guarda la mejor combinación posible de actividades entre ambos salones.
+    - El resultado es el mayor valor total posible sin traslapes dentro de cada salón.
+    """
+    best = 0
+    best_pair = ([], [])
+    n = len(activities)
+
+    # Probar todas las formas de dividir las actividades
+    for mask in range(1 << n):
+        A1, A2 = [], []
+        for i in range(n):
+            if (mask >> i) & 1:
+                A1.append(activities[i])
+            else:
+                A2.append(activities[i])
+
+        val1, set1 = weighted_interval_scheduling(A1)
+        val2, set2 = weighted_interval_scheduling(A2)
+        if val1 + val2 > best:
+            best = val1 + val2
+            best_pair = (set1, set2)
+
+    return best, best_pair
+
+
+# Caso de prueba
+# Cada actividad tiene: (hora de inicio, hora de fin, valor)
+if __name__ == "__main__":
+    actividades = [
+        (1, 4, 10),
+        (3, 5, 20),
+        (0, 6, 50),
+        (5, 7, 30),
+        (3, 9, 40),
+        (5, 9, 25),
+        (6, 10, 60),
+        (8, 11, 55),
+    ]
+
+    valor_max, (salon1, salon2) = max_dual_room_value(actividades)
+    print("Valor total máximo:", valor_max)
+    print("Actividades en salón 1:", salon1)
+    print("Actividades en salón 2:", salon2)
@@ -0,0 +1,360 @@
+import gc
+import importlib
+import json
+import math
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from collections import namedtuple
+from functools import lru_cache
+
+# Banco de pruebas de rendimiento para todos los algoritmos del paquete.
+# Cada caso toma un generador de entradas con semilla, lo mide en tamaños crecientes (tiempo,
+# memoria pico con tracemalloc y bloques de memoria que siguen vivos al terminar) y ajusta el exponente empírico
+# t ~ n^k para compararlo con la cota documentada en el docstring del algoritmo.
+# Los resultados se guardan como JSON para poder comparar entre versiones:
+#     python -m tarea3 benchmark --salida actual.json --comparar anterior.json
+
+
+# ---------------------------------------------------------------------------
+# Generadores de entradas (todos deterministas dada la semilla)
+# ---------------------------------------------------------------------------
+
+def intervalos_aleatorios(n, semilla=0, duracion_media=10.0):
+    """Intervalos (inicio, fin) con inicios uniformes en [0, n) y duraciones exponenciales."""
+    rng = random.Random(semilla)
+    intervalos = []
+    for _ in range(n):
+        inicio = rng.uniform(0, n)
+        intervalos.append((inicio, inicio + rng.expovariate(1 / duracion_media)))
+    return intervalos
+
+
+def intervalos_adversarios(n, semilla=0):
+    """
+    Intervalos anidados [i, 2n - i]: todos se traslapan entre sí, así que se necesitan n salones
+    (el heap de voraces4 crece hasta n) y ninguna actividad tiene compatibles previas.
+    El orden se baraja para no favorecer al ordenamiento.
+    """
+    intervalos = [(i, 2 * n - i) for i in range(n)]
+    random.Random(semilla).shuffle(intervalos)
+    return intervalos
+
+
+def intervalos_con_valor(n, semilla=0):
+    """Intervalos aleatorios con un valor entero en [1, 100], como (inicio, fin, valor)."""
+    rng = random.Random(semilla)
+    return [(s, e, rng.randint(1, 100)) for s, e in intervalos_aleatorios(n, semilla)]
+
+
+def trazas_de_llegada(n, semilla=0, tasa_llegada=1.0, duracion_media=0.9):
+    """Tareas (ri, pi) con llegadas de Poisson y duraciones exponenciales (carga de 90%)."""
+    rng = random.Random(semilla)
+    tareas, t = [], 0.0
+    for _ in range(n):
+        t += rng.expovariate(tasa_llegada)
+        tareas.append((t, rng.expovariate(1 / duracion_media)))
+    return tareas
+
+
+def trazas_adversarias(n, semilla=0):
+    """
+    Tareas que llegan una por unidad de tiempo con duraciones decrecientes: cada llegada
+    expulsa a la tarea en ejecución, así que el heap de SRPT acumula todas las tareas.
+    """
+    return [(i, 2 * (n - i)) for i in range(n)]
+
+
+def arbol_aleatorio(n, semilla=0):
+    """Árbol no dirigido {u: [vecinos]} con n nodos: es acíclico, así que la DFS lo recorre entero."""
+    rng = random.Random(semilla)
+    grafo = {u: [] for u in range(n)}
+    for v in range(1, n):
+        u = rng.randrange(v)
+        grafo[u].append(v)
+        grafo[v].append(u)
+    return grafo
+
+
+def grafo_disperso(n, grado=4, semilla=0, pesos=False):
+    """
+    Grafo dirigido {u: [v, ...]} con 'grado' aristas salientes por nodo (E = grado · n).
+    Con pesos=True las aristas son (v, prob) con prob en [0.5, 1).
+    """
+    rng = random.Random(semilla)
+    if pesos:
+        return {u: [(rng.randrange(n), 1.0 - rng.random() * 0.5) for _ in range(grado)] for u in range(n)}
+    return {u: [rng.randrange(n) for _ in range(grado)] for u in range(n)}
+
+
+def grafo_denso(n, densidad=0.5, semilla=0):
+    """Grafo dirigido {u: [v, ...]} donde cada par (u, v) es arista con probabilidad 'densidad' (E ~ n²)."""
+    rng = random.Random(semilla)
+    return {u: [v for v in range(n) if rng.random() < densidad] for u in range(n)}
+
+
+def grafo_euleriano(n, ciclos=4, semilla=0):
+    """
+    Grafo dirigido y conexo formado por 'ciclos' ciclos hamiltonianos aleatorios:
+    todo nodo tiene grado de entrada igual al de salida, así que tiene circuito de Euler.
+    """
+    rng = random.Random(semilla)
+    grafo = {u: [] for u in range(n)}
+    for _ in range(ciclos):
+        orden = list(range(n))
+        rng.shuffle(orden)
+        for i, u in enumerate(orden):
+            grafo[u].append(orden[i - 1])
+    return grafo
+
+
+def automata_aleatorio(n, grado=4, alfabeto=4, semilla=0, probabilidades=False):
+    """
+    Autómata etiquetado {u: [(v, sigma), ...]} con 'grado' aristas salientes por nodo,
+    o {u: [(v, sigma, prob), ...]} con probabilidades=True.
+    """
+    rng = random.Random(semilla)
+    if probabilidades:
+        return {u: [(rng.randrange(n), rng.randrange(alfabeto), rng.uniform(0.05, 1.0))
+                    for _ in range(grado)] for u in range(n)}
+    return {u: [(rng.randrange(n), rng.randrange(alfabeto)) for _ in range(grado)] for u in range(n)}
+
+
+def secuencia_aceptada(graph, start, longitud, semilla=0):
+    """Secuencia de símbolos obtenida caminando al azar por el autómata, para que tenga solución."""
+    rng = random.Random(semilla)
+    u, secuencia = start, []
+    for _ in range(longitud):
+        if not graph.get(u):
+            break
+        arista = rng.choice(graph[u])
+        u = arista[0]
+        secuencia.append(arista[1])
+    return secuencia
+
+
+def cadena_aleatoria(n, semilla=0, alfabeto="acgt"):
+    """Cadena de longitud n con caracteres uniformes del alfabeto."""
+    rng = random.Random(semilla)
+    return "".join(rng.choice(alfabeto) for _ in range(n))
+
+
+def cadena_adversaria(n, semilla=0):
+    """Cadena 'aaa...a': todas sus subcadenas son palíndromos (máximo de expansiones)."""
+    return "a" * n
+
+
+# ---------------------------------------------------------------------------
+# Casos de prueba
+# ---------------------------------------------------------------------------
+
+# generar(n, semilla) devuelve la tupla de argumentos de la función.
+# 'exponente' es el exponente de n en la cota documentada (los factores log n no se cuentan).
+Caso = namedtuple("Caso", "nombre modulo funcion generar tamanos cota exponente")
+
+
+@lru_cache(maxsize=None)
+def _automata(probabilidades):
+    # Autómata fijo de los casos de Viterbi: se construye la primera vez que se usa, no al importar
+    return automata_aleatorio(500, semilla=1, probabilidades=probabilidades)
+
+
+CASOS = [
+    Caso("salones_aleatorios", "voraces4", "asignar_salones",
+         lambda n, s: (intervalos_aleatorios(n, s),),
+         (5_000, 10_000, 20_000, 40_000), "O(n log n)", 1),
+    Caso("salones_adversarios", "voraces4", "asignar_salones",
+         lambda n, s: (intervalos_adversarios(n, s),),
+         (5_000, 10_000, 20_000, 40_000), "O(n log n)", 1),
+    Caso("compute_previous_aleatorios", "asignacion", "compute_previous",
+         lambda n, s: (intervalos_con_valor(n, s),),
+         (10_000, 20_000, 40_000, 80_000), "O(n log n)", 1),
+    Caso("compute_previous_adversarios", "asignacion", "compute_previous",
+         lambda n, s: ([(a, b, 1) for a, b in intervalos_adversarios(n, s)],),
+         (10_000, 20_000, 40_000, 80_000), "O(n log n)", 1),
+    Caso("weighted_interval_scheduling", "asignacion", "weighted_interval_scheduling",
+         lambda n, s: (intervalos_con_valor(n, s),),
+         (5_000, 10_000, 20_000, 40_000), "O(n log n)", 1),
+    Caso("spt_no_expropiativo", "AlgoritmoVoraz_NonPreemtive", "minimizar_tiempo_promedio_non_preemptive",
+         lambda n, s: ([p for _, p in trazas_de_llegada(n, s)],),
+         (20_000, 40_000, 80_000, 160_000), "O(n log n)", 1),
+    Caso("srpt_poisson", "AlgoritmoVoraz_Preemtive", "minimizar_tiempo_promedio_preemptive",
+         lambda n, s: (trazas_de_llegada(n, s),),
+         (5_000, 10_000, 20_000, 40_000), "O(n log n)", 1),
+    Caso("srpt_adversario", "AlgoritmoVoraz_Preemtive", "minimizar_tiempo_promedio_preemptive",
+         lambda n, s: (trazas_adversarias(n, s),),
+         (5_000, 10_000, 20_000, 40_000), "O(n log n)", 1),
+    Caso("camino_mas_confiable_disperso", "Grafos9", "camino_mas_confiable",
+         lambda n, s: (grafo_disperso(n, 8, s, pesos=True), 0, n - 1),
+         (5_000, 10_000, 20_000, 40_000), "O((V + E) log V)", 1),
+    Caso("tiene_ciclo_arbol", "ciclos6", "tiene_ciclo",
+         lambda n, s: (arbol_aleatorio(n, s),),
+         (10_000, 20_000, 40_000, 80_000), "O(V + E)", 1),
+    Caso("dfs_disperso", "stack7", "dfs_iterativa",
+         lambda n, s: (grafo_disperso(n, 4, s), 0),
+         (10_000, 20_000, 40_000, 80_000), "O(V + E)", 1),
+    Caso("dfs_denso", "stack7", "dfs_iterativa",
+         lambda n, s: (grafo_denso(n, 0.5, s), 0),
+         (200, 400, 800, 1_600), "O(V + E), E ~ V²", 2),
+    Caso("euler", "Grafos8_Euler", "tiene_ciclo_euleriano",
+         lambda n, s: (grafo_euleriano(n, 4, s),),
+         (10_000, 20_000, 40_000, 80_000), "O(V + E)", 1),
+    Caso("viterbi_longitud", "viterbi", "viterbi_find_path",
+         lambda n, s: (_automata(False), 0, secuencia_aceptada(_automata(False), 0, n, s)),
+         (50, 100, 200, 400), "O(k · E)", 1),
+    Caso("viterbi_max_longitud", "viterbi_b", "viterbi_max_path",
+         lambda n, s: (_automata(True), 0, secuencia_aceptada(_automata(True), 0, n, s)),
+         (50, 100, 200, 400), "O(k · E)", 1),
+    Caso("lps_cuadratica", "palindromo", "longest_palindromic_subsequence",
+         lambda n, s: (cadena_aleatoria(n, s),),
+         (200, 400, 800, 1_600), "O(n²)", 2),
+    Caso("lps_bits", "palindromo", "longitud_lps",
+         lambda n, s: (cadena_aleatoria(n, s),),
+         (2_000, 4_000, 8_000, 16_000), "O(n² / w)", 2),
+    Caso("manacher_adversario", "palindromo", "manacher",
+         lambda n, s: (cadena_adversaria(n, s),),
+         (50_000, 100_000, 200_000, 400_000), "O(n)", 1),
+]
+
+
+# ---------------------------------------------------------------------------
+# Medición y ajuste
+# ---------------------------------------------------------------------------
+
+def medir(funcion, generar, n, repeticiones=3, semilla=0):
+    """
+    Mide una llamada funcion(*generar(n, semilla)).
+    Las entradas se generan fuera de la medición y de nuevo en cada repetición,
+    porque algunas funciones (compute_previous) ordenan su entrada en su lugar.
+    :return: Diccionario con el mejor tiempo en segundos, la memoria pico en bytes (tracemalloc)
+             y bloques_vivos: cuántos bloques más hay vivos al terminar que al empezar (resultado y
+             estructuras retenidas). Es un saldo neto, no el número de asignaciones: los bloques
+             temporales que se liberan durante la llamada no se cuentan.
+    """
+    segundos = math.inf
+    for r in range(repeticiones):
+        args = generar(n, semilla + r)
+        gc.collect()
+        t0 = time.perf_counter()
+        funcion(*args)
+        segundos = min(segundos, time.perf_counter() - t0)
+        del args
+
+    # La memoria se mide en una corrida aparte: tracemalloc hace mucho más lenta cada asignación
+    args = generar(n, semilla)
+    gc.collect()
+    tracemalloc.start()
+    antes = tracemalloc.take_snapshot()
+    resultado = funcion(*args)
+    _, pico = tracemalloc.get_traced_memory()
+    despues = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    # Se excluyen los bloques del propio tracemalloc y de este módulo
+    filtros = [tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, __file__)]
+    diferencias = despues.filter_traces(filtros).compare_to(antes.filter_traces(filtros), "filename")
+    bloques = sum(d.count_diff for d in diferencias)
+    del resultado, args
+
+    return {"n": n, "segundos": segundos, "pico_bytes": pico, "bloques_vivos": bloques}
+
+
+def ajustar_exponente(tamanos, valores):
+    """
+    Pendiente de la recta de mínimos cuadrados de log(valor) contra log(n): si valor ~ c · n^k,
+    la pendiente estima k. Devuelve None si hay menos de dos puntos positivos.
+    """
+    puntos = [(math.log(n), math.log(v)) for n, v in zip(tamanos, valores) if n > 0 and v > 0]
+    if len(puntos) < 2:
+        return None
+    mx = sum(x for x, _ in puntos) / len(puntos)
+    my = sum(y for _, y in puntos) / len(puntos)
+    sxx = sum((x - mx) ** 2 for x, _ in puntos)
+    if sxx == 0:
+        return None
+    return sum((x - mx) * (y - my) for x, y in puntos) / sxx
+
+
+def ejecutar_benchmark(nombres=None, escala=1.0, repeticiones=3, semilla=0, tolerancia=0.35):
+    """
+    Corre los casos pedidos (todos por defecto) y ajusta sus exponentes de escalamiento.
+
+    Complejidad temporal:
+    - La de cada algoritmo sobre sus tamaños, multiplicada por (repeticiones + 1);
+      la corrida con tracemalloc es varias veces más lenta que las demás.
+
+    Justificación:
+    - Se usa el mejor de varios tiempos para reducir el ruido del sistema.
+    - Un caso está "dentro de la cota" si su exponente de tiempo no supera al de la cota
+      documentada más 'tolerancia' (los factores log n y el ruido suben un poco la pendiente).
+
+    :param nombres: Nombres de casos a correr, o None para todos
+    :param escala: Factor que multiplica los tamaños de cada caso
+    :return: Diccionario serializable a JSON con metadatos y resultados por caso
+    """
+    casos = CASOS if nombres is None else [c for c in CASOS if c.nombre in set(nombres)]
+    resultados = {}
+    for caso in casos:
+        modulo = importlib.import_module(f".{caso.modulo}", __package__)
+        funcion = getattr(modulo, caso.funcion)
+        tamanos = [max(1, int(n * escala)) for n in caso.tamanos]
+        mediciones = [medir(funcion, caso.generar, n, repeticiones, semilla) for n in tamanos]
+        exponente = ajustar_exponente(tamanos, [m["segundos"] for m in mediciones])
+        resultados[caso.nombre] = {
+            "funcion": f"{caso.modulo}.{caso.funcion}",
+            "cota": caso.cota,
+            "exponente_cota": caso.exponente,
+            "mediciones": mediciones,
+            "exponente_tiempo": exponente,
+            "exponente_memoria": ajustar_exponente(tamanos, [m["pico_bytes"] for m in mediciones]),
+            "dentro_de_cota": exponente is not None and exponente <= caso.exponente + tolerancia,
+        }
+    return {
+        "metadatos": {
+            "fecha": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": sys.version.split()[0],
+            "plataforma": platform.platform(),
+            "numpy": getattr(sys.modules.get("numpy"), "__version__", None),
+            "escala": escala,
+            "repeticiones": repeticiones,
+            "semilla": semilla,
+        },
+        "casos": resultados,
+    }
+
+
+def guardar_resultados(resultados, ruta):
+    with open(ruta, "w", encoding="utf-8") as archivo:
+        json.dump(resultados, archivo, indent=2, ensure_ascii=False)
+
+
+def cargar_resultados(ruta):
+    with open(ruta, encoding="utf-8") as archivo:
+        return json.load(archivo)
+
+
+def comparar_resultados(anterior, actual):
+    """
+    Compara dos corridas (por ejemplo, de dos versiones) caso por caso.
+    :return: Diccionario {caso: {n: tiempo_actual / tiempo_anterior}} para los casos y tamaños
+             presentes en ambas; un valor mayor que 1 es una regresión
+    """
+    razones = {}
+    for nombre, caso in actual["casos"].items():
+        previo = anterior["casos"].get(nombre)
+        if previo is None:
+            continue
+        tiempos_previos = {m["n"]: m["segundos"] for m in previo["mediciones"]}
+        razones[nombre] = {m["n"]: m["segundos"] / tiempos_previos[m["n"]]
+                           for m in caso["mediciones"]
+                           if tiempos_previos.get(m["n"])}
+    return razones
+
+
+# Ejemplo de uso
+if __name__ == "__main__":
+    resultados = ejecutar_benchmark(escala=0.25, repeticiones=1)
+    for nombre, caso in resultados["casos"].items():
+        print(f"{nombre:32s} {caso['cota']:18s} k = {caso['exponente_tiempo']:.2f}",
+              "" if caso["dentro_de_cota"] else "(fuera de la cota)")
@@ -0,0 +1,180 @@
+from array import array
+from collections import defaultdict, deque
+
+from .grafo_compacto import GrafoCompacto, leer_aristas
+
+
+def tiene_ciclo(grafo):
+    """
+    Determina si un grafo no dirigido contiene al menos un ciclo.
+
+    Complejidad temporal:
+    O(V + E), donde V es el número de vértices y E el número de aristas.
+    - Se visita cada nodo una sola vez (O(V)).
+    - Se recorren todas las aristas una sola vez (O(E)).
+
+    Complejidad espacial:
+    O(V), ya que:
+    - Se almacena un conjunto `visitado` con los vértices visitados.
+    - La pila explícita de DFS puede ocupar hasta O(V) marcos (uno por nodo del camino actual).
+
+    Con un GrafoCompacto se recorre el CSR por ids enteros: visitado es un bytearray y los
+    vecinos son vistas sin copia sobre destinos.
+    """
+    if isinstance(grafo, GrafoCompacto):
+        return _tiene_ciclo_csr(grafo)
+
+    visitado = set()  # Para registrar los nodos ya visitados
+
+    # DFS iterativa: cada marco de la pila es (nodo, padre, iterador de vecinos),
+    # equivalente a la versión recursiva pero sin límite de profundidad de recursión
+    for nodo in grafo:
+        if nodo in visitado:
+            continue
+        visitado.add(nodo)
+        pila = [(nodo, None, iter(grafo[nodo]))]
+        while pila:
+            v, padre, vecinos = pila[-1]
+            for vecino in vecinos:
+                if vecino not in visitado:
+                    visitado.add(vecino)
+                    pila.append((vecino, v, iter(grafo[vecino])))
+                    break
+                elif vecino != padre:
+                    # Si el vecino ya fue visitado y no es el padre, hay un ciclo
+                    return True
+            else:
+                pila.pop()  # Se agotaron los vecinos de v
+
+    return False
+
+
+def _tiene_ciclo_csr(grafo):
+    # Misma DFS que tiene_ciclo sobre los ids enteros del grafo compacto
+    visitado = bytearray(grafo.num_nodos)
+    vecinos_ids = grafo.vecinos_ids
+    for nodo in range(grafo.num_nodos):
+        if visitado[nodo]:
+            continue
+        visitado[nodo] = 1
+        pila = [(nodo, -1, iter(vecinos_ids(nodo)))]
+        while pila:
+            v, padre, vecinos = pila[-1]
+            for vecino in vecinos:
+                if not visitado[vecino]:
+                    visitado[vecino] = 1
+                    pila.append((vecino, v, iter(vecinos_ids(vecino))))
+                    break
+                elif vecino != padre:
+                    return True
+            else:
+                pila.pop()
+    return False
+
+
+def aristas_desde_archivo(ruta):
+    """
+    Lee perezosamente un archivo de aristas "u v" (una por línea; '#' para comentarios), con el
+    formato de grafo_compacto.leer_aristas. Los nombres que son enteros se convierten a int.
+    """
+    with open(ruta) as archivo:
+        for campos in leer_aristas(archivo):
+            yield campos[0], campos[1]
+
+
+def ciclo_en_flujo_de_aristas(aristas, num_nodos=None, reconstruir=False):
+    """
+    Detecta un ciclo en un grafo no dirigido leyendo sus aristas una sola vez (union-find).
+
+    Complejidad temporal:
+    O(E α(V)), con compresión de caminos y unión por rango; α es la inversa de Ackermann.
+    Si se pide reconstruir el ciclo, se agrega O(V) una única vez al encontrarlo.
+
+    Complejidad espacial:
+    O(V) para los padres y rangos; no se construye la lista de adyacencia.
+    Con reconstruir=True se guardan además las aristas del bosque generador (a lo más V - 1).
+
+    Justificación:
+    - Cada arista (u, v) une las componentes de u y v. Si ya estaban en la misma componente,
+      esa arista cierra un ciclo.
+    - Cada arista no dirigida debe aparecer una sola vez en el flujo; una arista repetida
+      (o un lazo u-u) se reporta como ciclo.
+
+    :param aristas: Iterable de pares (u, v), o ruta a un archivo de aristas
+    :param num_nodos: Si los nodos son enteros 0..n-1, usar arreglos compactos en vez de diccionarios
+    :param reconstruir: Si es True, también devuelve la lista de nodos del ciclo
+    :return: None si no hay ciclo; si lo hay, la primera arista que lo cierra (u, v),
+             o la tupla ((u, v), ciclo) con reconstruir=True, donde ciclo va de u a v
+    """
+    if isinstance(aristas, str):
+        aristas = aristas_desde_archivo(aristas)
+
+    if num_nodos is None:
+        padre, rango = {}, {}
+    else:
+        padre, rango = array("q", range(num_nodos)), bytearray(num_nodos)
+    bosque = [] if reconstruir else None
+
+    def raiz(x):
+        if num_nodos is None and x not in padre:
+            padre[x] = x
+            rango[x] = 0
+            return x
+        r = x
+        while padre[r] != r:
+            r = padre[r]
+        while padre[x] != r:  # Compresión de caminos
+            padre[x], x = r, padre[x]
+        return r
+
+    for u, v in aristas:
+        ru, rv = raiz(u), raiz(v)
+        if ru == rv:
+            if not reconstruir:
+                return u, v
+            return (u, v), _camino_en_bosque(bosque, u, v)
+        # Unión por rango
+        if rango[ru] < rango[rv]:
+            ru, rv = rv, ru
+        padre[rv] = ru
+        if rango[ru] == rango[rv]:
+            rango[ru] += 1
+        if reconstruir:
+            bosque.append((u, v))
+
+    return None
+
+
+def _camino_en_bosque(bosque, u, v):
+    # Camino de u a v dentro del bosque generador (BFS con predecesores)
+    adyacencia = defaultdict(list)
+    for a, b in bosque:
+        adyacencia[a].append(b)
+        adyacencia[b].append(a)
+    predecesor = {u: None}
+    cola = deque([u])
+    while cola:
+        x = cola.popleft()
+        if x == v:
+            break
+        for y in adyacencia[x]:
+            if y not in predecesor:
+                predecesor[y] = x
+                cola.append(y)
+    camino = [v]
+    while predecesor[camino[-1]] is not None:
+        camino.append(predecesor[camino[-1]])
+    camino.reverse()
+    return camino
+
+
+# Ejemplo de uso
+if __name__ == "__main__":
+    grafo = {
+        0: [1],
+        1: [0, 2],
+        2: [1, 3],
+        3: [2, 0]  # ciclo: 0-1-2-3-0
+    }
+
+    print(tiene_ciclo(grafo))  # Salida: True
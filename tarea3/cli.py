@@ -0,0 +1,273 @@
+"""
+Punto de entrada único para correr los algoritmos de tarea3 sobre flujos de entrada.
+
+Cada comando lee su entrada línea por línea (archivo o stdin) y escribe una línea JSON por
+resultado, así un trabajo por lotes paga el arranque del intérprete una sola vez. Las listas de
+aristas usan el formato "u v [etiqueta] [peso]", separado por espacios o comas.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+
+# Los módulos de cada algoritmo se importan dentro de su comando, para no cargar los demás.
+
+
+def _lineas(archivo):
+    # Líneas no vacías y que no son comentarios
+    for linea in archivo:
+        linea = linea.strip()
+        if linea and not linea.startswith("#"):
+            yield linea
+
+
+def _campos(linea):
+    return linea.replace(",", " ").split()
+
+
+def _escribir(salida, valor):
+    salida.write(json.dumps(valor, ensure_ascii=False) + "\n")
+
+
+def _lee_su_ruta(args):
+    # 'salones' recibe la ruta de los CSV y de los binarios "<dd" (con --binario o extensión .bin),
+    # que lee el propio algoritmo; cualquier otro archivo se lee como texto, igual que stdin
+    return args.comando == "salones" and bool(args.archivo) and (
+        args.binario or args.archivo.endswith((".bin", ".csv")))
+
+
+def _salones(args, entrada, salida):
+    from .voraces4 import asignar_salones_stream
+
+    if _lee_su_ruta(args):
+        fuente = args.archivo
+    else:
+        fuente = ((float(c[0]), float(c[1])) for c in map(_campos, _lineas(entrada)))
+    for actividad, salon in asignar_salones_stream(fuente, tam_bloque=args.tam_bloque):
+        _escribir(salida, {"actividad": actividad, "salon": salon})
+
+
+def _ciclo(args, entrada, salida):
+    from .ciclos6 import ciclo_en_flujo_de_aristas
+    from .grafo_compacto import leer_aristas
+
+    aristas = (tuple(campos[:2]) for campos in leer_aristas(entrada))
+    resultado = ciclo_en_flujo_de_aristas(aristas, reconstruir=args.reconstruir)
+    if resultado is None:
+        _escribir(salida, {"ciclo": False})
+    elif args.reconstruir:
+        _escribir(salida, {"ciclo": True, "arista": resultado[0], "nodos": resultado[1]})
+    else:
+        _escribir(salida, {"ciclo": True, "arista": resultado})
+
+
+def _euler(args, entrada, salida):
+    from .Grafos8_Euler import recorrido_euleriano_csr
+    from .grafo_compacto import GrafoCompacto
+
+    grafo = GrafoCompacto.cargar_lista_aristas(entrada)
+    recorrido = recorrido_euleriano_csr(grafo, permitir_camino=not args.solo_ciclo)
+    _escribir(salida, None if recorrido is None else [grafo.etiqueta_de(u) for u in recorrido])
+
+
+def _confiable(args, entrada, salida):
+    from .Grafos9 import ReliabilityIndex
+    from .grafo_compacto import GrafoCompacto, campos_de_arista
+
+    grafo = GrafoCompacto.cargar_lista_aristas(args.grafo, pesos=True)
+    indice = ReliabilityIndex(grafo, num_landmarks=args.landmarks)
+    for linea in _lineas(entrada):
+        if linea.startswith("{"):
+            consulta = json.loads(linea)
+            inicio, fin = consulta["inicio"], consulta["fin"]
+        else:
+            inicio, fin = campos_de_arista(linea)[:2]
+        prob, camino = indice.camino_mas_confiable(inicio, fin)
+        _escribir(salida, {"inicio": inicio, "fin": fin, "prob": prob,
+                           "camino": camino if isinstance(camino, list) else None})
+
+
+def _viterbi(args, entrada, salida):
+    from .grafo_compacto import GrafoCompacto, nombre_de_nodo
+
+    # El grafo se lee como "u v sigma [prob]"; se convierte al diccionario de viterbi/viterbi_b
+    grafo = GrafoCompacto.cargar_lista_aristas(args.grafo, pesos=args.max, etiquetas=True)
+    diccionario = grafo.a_diccionario()
+    inicio = nombre_de_nodo(args.inicio)
+    secuencias = (l.split() for l in _lineas(entrada))
+
+    if args.procesos > 1:
+        from .decodificacion_corpus import DecodificadorCorpus
+
+        modo = "max" if args.max else "camino"
+        with DecodificadorCorpus(diccionario, modo=modo, procesos=args.procesos) as decodificador:
+            for camino in decodificador.decodificar(inicio, secuencias):
+                _escribir(salida, camino if isinstance(camino, list) else None)
+        return
+
+    if args.max:
+        from .viterbi_b import ModeloViterbi
+
+        decodificar = ModeloViterbi(diccionario).decodificar
+    else:
+        from .viterbi import AutomataEtiquetado
+
+        decodificar = AutomataEtiquetado(diccionario).buscar_camino
+    for secuencia in secuencias:
+        camino = decodificar(inicio, secuencia)
+        _escribir(salida, camino if isinstance(camino, list) else None)
+
+
+def _planificar(args, entrada, salida):
+    from .planificador_online import PlanificadorOnline
+
+    async def correr():
+        planificador = PlanificadorOnline(args.politica)
+
+        async def productor():
+            for linea in _lineas(entrada):
+                ri, pi = map(float, _campos(linea)[:2])
+                planificador.enviar(ri, pi)
+            planificador.cerrar()
+
+        tarea = asyncio.create_task(productor())
+        async for despacho in planificador.despachos():
+            _escribir(salida, despacho._asdict())
+        await tarea
+        _escribir(salida, {"completadas": planificador.completadas,
+                           "promedio_finalizacion": planificador.promedio_finalizacion,
+                           "promedio_espera": planificador.promedio_espera})
+
+    asyncio.run(correr())
+
+
+def _palindromos(args, entrada, salida):
+    from .palindromo import analizar_palindromos
+
+    for resultado in analizar_palindromos(linea.rstrip("\n") for linea in entrada):
+        _escribir(salida, resultado)
+
+
+def _intervalos(args, entrada, salida):
+    from .asignacion import weighted_interval_scheduling_columnar
+
+    # Cada línea: {"starts": [...], "ends": [...], "values": [...]} o [[inicio, fin, valor], ...]
+    for linea in _lineas(entrada):
+        datos = json.loads(linea)
+        if isinstance(datos, list):
+            datos = {"starts": [a[0] for a in datos], "ends": [a[1] for a in datos],
+                     "values": [a[2] for a in datos]}
+        valor, seleccion = weighted_interval_scheduling_columnar(
+            datos["starts"], datos["ends"], datos["values"])
+        _escribir(salida, {"valor": valor, "seleccion": seleccion})
+
+
+def medir_importacion(modulo):
+    """
+    Mide el costo de importar 'modulo' en un intérprete nuevo con -X importtime.
+    :return: Diccionario con el tiempo acumulado del import (microsegundos) y los módulos cargados
+    """
+    raiz = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    entorno = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [raiz, os.environ.get("PYTHONPATH")])))
+    proceso = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {modulo}"],
+                             capture_output=True, text=True, env=entorno, check=True)
+    acumulado, cargados = 0, 0
+    for linea in proceso.stderr.splitlines():
+        if not linea.startswith("import time:") or "cumulative" in linea:
+            continue
+        _, acum, nombre = linea[len("import time:"):].split("|")
+        cargados += 1
+        if nombre.strip() == modulo:
+            acumulado = int(acum)
+    return {"modulo": modulo, "acumulado_us": acumulado, "modulos_cargados": cargados}
+
+
+def _importtime(args, entrada, salida):
+    from . import _SUBMODULOS
+
+    modulos = args.modulos or ["tarea3"] + [f"tarea3.{m}" for m in sorted(_SUBMODULOS)]
+    for modulo in modulos:
+        _escribir(salida, medir_importacion(modulo))
+
+
+def _benchmark(args, entrada, salida):
+    from .benchmark import cargar_resultados, comparar_resultados, ejecutar_benchmark, guardar_resultados
+
+    resultados = ejecutar_benchmark(args.casos or None, escala=args.escala, repeticiones=args.repeticiones,
+                                    semilla=args.semilla)
+    if args.salida:
+        guardar_resultados(resultados, args.salida)
+    razones = comparar_resultados(cargar_resultados(args.comparar), resultados) if args.comparar else {}
+    for nombre, caso in resultados["casos"].items():
+        linea = {k: caso[k] for k in ("cota", "exponente_tiempo", "exponente_memoria", "dentro_de_cota")}
+        if nombre in razones:
+            linea["razon_contra_anterior"] = razones[nombre]
+        _escribir(salida, dict(caso=nombre, **linea))
+
+
+def _analizador():
+    analizador = argparse.ArgumentParser(prog="python -m tarea3", description=__doc__)
+    comandos = analizador.add_subparsers(dest="comando", required=True)
+
+    def comando(nombre, funcion, ayuda, archivo=True):
+        sub = comandos.add_parser(nombre, help=ayuda)
+        if archivo:
+            sub.add_argument("archivo", nargs="?", help="archivo de entrada (por defecto stdin)")
+        sub.set_defaults(funcion=funcion)
+        return sub
+
+    sub = comando("salones", _salones, "asignar salones a intervalos 'inicio fin' (texto, CSV o binario)")
+    sub.add_argument("--tam-bloque", type=int, default=1_000_000)
+    sub.add_argument("--binario", action="store_true",
+                     help="el archivo son pares de doubles '<dd' (implícito con extensión .bin)")
+    sub = comando("ciclo", _ciclo, "detectar un ciclo en una lista de aristas no dirigidas")
+    sub.add_argument("--reconstruir", action="store_true")
+    sub = comando("euler", _euler, "ciclo o camino de Euler de una lista de aristas dirigidas")
+    sub.add_argument("--solo-ciclo", action="store_true")
+    sub = comando("confiable", _confiable, "consultas 'inicio fin' de camino más confiable")
+    sub.add_argument("--grafo", required=True, help="aristas 'u v prob'")
+    sub.add_argument("--landmarks", type=int, default=8)
+    sub = comando("viterbi", _viterbi, "decodificar secuencias (una por línea)")
+    sub.add_argument("--grafo", required=True, help="aristas 'u v sigma' o 'u v sigma prob' con --max")
+    sub.add_argument("--inicio", required=True)
+    sub.add_argument("--max", action="store_true", help="camino más probable (viterbi_b)")
+    sub.add_argument("--procesos", type=int, default=1)
+    sub = comando("planificar", _planificar, "planificación en línea de tareas 'llegada duración'")
+    sub.add_argument("--politica", choices=("sjf", "srpt"), default="srpt")
+    comando("palindromos", _palindromos, "estadísticas de palíndromos por línea")
+    comando("intervalos", _intervalos, "weighted interval scheduling por línea JSON")
+    sub = comando("importtime", _importtime, "medir el costo de importación con -X importtime",
+                  archivo=False)
+    sub.add_argument("modulos", nargs="*")
+    sub = comando("benchmark", _benchmark, "medir tiempo, memoria y escalamiento de los algoritmos",
+                  archivo=False)
+    sub.add_argument("casos", nargs="*", help="casos a correr (por defecto todos)")
+    sub.add_argument("--escala", type=float, default=1.0)
+    sub.add_argument("--repeticiones", type=int, default=3)
+    sub.add_argument("--semilla", type=int, default=0)
+    sub.add_argument("--salida", help="guardar los resultados completos en este JSON")
+    sub.add_argument("--comparar", help="JSON de una corrida anterior")
+    return analizador
+
+
+def main(argv=None):
+    args = _analizador().parse_args(argv)
+    archivo = getattr(args, "archivo", None)
+    try:
+        if archivo and not _lee_su_ruta(args):
+            with open(archivo) as entrada:
+                args.funcion(args, entrada, sys.stdout)
+        else:
+            args.funcion(args, sys.stdin, sys.stdout)
+        sys.stdout.flush()
+    except BrokenPipeError:
+        # La salida se cerró antes de tiempo (por ejemplo '| head'): no es un error
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,205 @@
+import itertools
+import os
+from array import array
+from bisect import bisect_left
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from multiprocessing import shared_memory
+
+from .viterbi import AutomataEtiquetado
+from .viterbi_b import ModeloViterbi, viterbi_por_tablas
+
+# Tiempo de ejecución: O(sum_i (|frontera_i| log V + M_i)) por secuencia, con M_i las aristas del
+# símbolo del paso i que salen de la frontera, repartido entre P procesos
+# Uso de memoria: una sola copia del índice por símbolo en memoria compartida, más a lo más
+# max_en_vuelo lotes de secuencias y resultados pendientes
+# Justificación: El grafo se compila una vez con el índice por símbolo de ModeloViterbi (modo "max")
+# o de AutomataEtiquetado (modo "camino") y se guarda como columnas en un bloque de
+# multiprocessing.shared_memory: para cada símbolo, sus nodos origen ordenados y el segmento de
+# aristas (destino, log_prob) de cada uno. Cada proceso trabajador se conecta al bloque al iniciar
+# y decodifica con viterbi_b.viterbi_por_tablas, el mismo núcleo de ModeloViterbi; las tareas sólo
+# envían las secuencias y nunca el grafo
+
+# Estado de cada proceso trabajador (se llena en _iniciar_trabajador)
+_ESTADO = {}
+
+
+def _leer_secuencias(fuente):
+    # Iterable de secuencias, o ruta de un archivo con una secuencia por línea (símbolos separados por espacios)
+    if isinstance(fuente, str):
+        with open(fuente) as archivo:
+            for linea in archivo:
+                yield linea.split()
+    else:
+        yield from fuente
+
+
+def _columnas_por_simbolo(indice):
+    # indice[s] = {u: [(v, log_prob), ...]} -> columnas (inicio de cada símbolo en 'fuentes',
+    # fuentes ordenadas por símbolo, inicio de las aristas de cada fuente, destinos, log_prob)
+    inicio_simbolo, fuentes, desplazamientos = array("q", [0]), array("q"), array("q", [0])
+    destinos, log_prob = array("q"), array("d")
+    for tabla in indice:
+        for u in sorted(tabla):
+            for v, lp in tabla[u]:
+                destinos.append(v)
+                log_prob.append(lp)
+            fuentes.append(u)
+            desplazamientos.append(len(destinos))
+        inicio_simbolo.append(len(fuentes))
+    return inicio_simbolo, fuentes, desplazamientos, destinos, log_prob
+
+
+class _TablaCompartida:
+    # Transiciones de un símbolo sobre las columnas compartidas, con la interfaz de dict que usa
+    # viterbi_por_tablas: get(u, ()) da los pares (v, log_prob) que salen de u
+    __slots__ = ("columnas", "inicio", "fin")
+
+    def __init__(self, columnas, s):
+        self.columnas = columnas
+        self.inicio, self.fin = columnas[0][s], columnas[0][s + 1]
+
+    def get(self, u, defecto=()):
+        _, fuentes, desplazamientos, destinos, log_prob = self.columnas
+        i = bisect_left(fuentes, u, self.inicio, self.fin)
+        if i == self.fin or fuentes[i] != u:
+            return defecto
+        a, b = desplazamientos[i], desplazamientos[i + 1]
+        return zip(destinos[a:b], log_prob[a:b])
+
+
+def _iniciar_trabajador(nombre, tamanos, nodos, simbolos):
+    bloque = shared_memory.SharedMemory(name=nombre)
+    vista = memoryview(bloque.buf)
+    columnas, pos = [], 0
+    for n, tipo in zip(tamanos, "qqqqd"):
+        columnas.append(vista[pos:pos + 8 * n].cast(tipo))
+        pos += 8 * n
+    _ESTADO["bloque"] = bloque  # Mantener el bloque abierto mientras viva el proceso
+    _ESTADO["nodos"] = nodos
+    _ESTADO["simbolos"] = simbolos
+    _ESTADO["tablas"] = [_TablaCompartida(columnas, s) for s in range(len(simbolos))]
+
+
+def _decodificar_lote(inicio, start, lote):
+    if inicio is None:  # start no es un nodo del grafo
+        return [[start] if not secuencia else "No path found" for secuencia in lote]
+    nodos, simbolos, tablas = _ESTADO["nodos"], _ESTADO["simbolos"], _ESTADO["tablas"]
+    resultados = []
+    for secuencia in lote:
+        ids = (simbolos.get(sigma) for sigma in secuencia)
+        path = viterbi_por_tablas(inicio, (tablas[s] if s is not None else {} for s in ids))
+        resultados.append("No path found" if path is None else [nodos[v] for v in path])
+    return resultados
+
+
+class DecodificadorCorpus:
+    """
+    Decodifica corpus de secuencias independientes en paralelo, con el grafo en memoria compartida.
+
+    modo="camino" reproduce viterbi_find_path sobre grafos {u: [(v, sigma), ...]} y modo="max"
+    reproduce viterbi_max_path sobre grafos {u: [(v, sigma, prob), ...]}; los resultados son los
+    mismos que los de esas funciones.
+
+    Se usa como administrador de contexto para liberar el bloque compartido y el pool:
+
+        with DecodificadorCorpus(graph, modo="max") as decodificador:
+            for camino in decodificador.decodificar("A", secuencias):
+                ...
+    """
+
+    def __init__(self, graph, modo="max", procesos=None, tam_lote=256, max_en_vuelo=None):
+        if modo not in ("camino", "max"):
+            raise ValueError("El modo debe ser 'camino' o 'max'")
+        self.modo = modo
+        self.tam_lote = tam_lote
+        # Índice por símbolo {u: [(v, log_prob), ...]} sobre ids enteros; en modo "camino" todas
+        # las aristas pesan 0, así viterbi_por_tablas reproduce viterbi_find_path
+        if modo == "max":
+            modelo = ModeloViterbi(graph, usar_numpy=False)
+            indice = modelo._indice
+        else:
+            modelo = AutomataEtiquetado(graph, usar_numpy=False)
+            indice = [{u: [(v, 0.0) for v in vs] for u, vs in tabla.items()}
+                      for tabla in modelo._por_simbolo]
+        self._ids = modelo._ids
+        columnas = _columnas_por_simbolo(indice)
+        datos = b"".join(columna.tobytes() for columna in columnas)
+        self._bloque = shared_memory.SharedMemory(create=True, size=max(len(datos), 1))
+        self._bloque.buf[:len(datos)] = datos
+
+        procesos = procesos or os.cpu_count() or 1
+        self._pool = ProcessPoolExecutor(
+            max_workers=procesos,
+            initializer=_iniciar_trabajador,
+            initargs=(self._bloque.name, [len(columna) for columna in columnas],
+                      modelo.nodos, modelo._simbolos),
+        )
+        self.max_en_vuelo = max_en_vuelo or 2 * procesos
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
+
+    def cerrar(self):
+        """Detiene los procesos y libera el bloque de memoria compartida."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+            self._bloque.close()
+            self._bloque.unlink()
+
+    def decodificar(self, start, secuencias, ordenado=True):
+        """
+        Decodifica las secuencias desde el nodo start, enviándolas al pool en lotes de tam_lote.
+        Nunca hay más de max_en_vuelo lotes enviados sin entregar, así que la memoria queda acotada
+        aunque la fuente sea muy grande.
+
+        :param secuencias: Iterable de secuencias, o ruta de un archivo con una secuencia por línea
+        :param ordenado: Si es True, los resultados salen en el orden de entrada; si es False,
+                         salen conforme terminan como tuplas (índice, resultado)
+        """
+        lotes = iter(lambda it=iter(_leer_secuencias(secuencias)):
+                     list(itertools.islice(it, self.tam_lote)), [])
+        pendientes = {}  # futuro -> número de lote
+        listos = {}  # número de lote -> resultados (sólo en modo ordenado)
+        siguiente_envio = siguiente_entrega = 0
+
+        while True:
+            while len(pendientes) + len(listos) < self.max_en_vuelo:
+                lote = next(lotes, None)
+                if lote is None:
+                    break
+                futuro = self._pool.submit(_decodificar_lote, self._ids.get(start), start, lote)
+                pendientes[futuro] = siguiente_envio
+                siguiente_envio += 1
+            if not pendientes:
+                return
+
+            hechos, _ = wait(pendientes, return_when=FIRST_COMPLETED)
+            for futuro in hechos:
+                numero = pendientes.pop(futuro)
+                if ordenado:
+                    listos[numero] = futuro.result()
+                else:
+                    base = numero * self.tam_lote
+                    for j, resultado in enumerate(futuro.result()):
+                        yield base + j, resultado
+            while siguiente_entrega in listos:
+                yield from listos.pop(siguiente_entrega)
+                siguiente_entrega += 1
+
+
+# Ejemplo de uso
+if __name__ == "__main__":
+    graph_b = {
+        'A': [('B', 'a', 0.5), ('C', 'b', 0.5)],
+        'B': [('D', 'b', 0.6)],
+        'C': [('D', 'a', 0.9)],
+        'D': []
+    }
+    with DecodificadorCorpus(graph_b, modo="max", procesos=2, tam_lote=2) as decodificador:
+        secuencias = [['a', 'b'], ['b', 'a'], ['a'], ['b', 'b']]
+        for entrada, camino in zip(secuencias, decodificador.decodificar('A', secuencias)):
+            print(entrada, "->", camino)
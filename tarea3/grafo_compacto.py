@@ -0,0 +1,356 @@
+import json
+import mmap
+import os
+import struct
+from array import array
+from contextlib import nullcontext
+
+# Tiempo de construcción: O(V + E) con ordenamiento por conteo de las aristas por nodo origen
+# Uso de memoria: 8 bytes por nodo más 8 bytes por arista por cada columna (destinos, pesos, etiquetas)
+# Justificación: Las etiquetas de los nodos se internan a enteros y las listas de adyacencia se
+# guardan en formato CSR (desplazamientos + destinos contiguos) dentro de arreglos array,
+# en lugar de listas de tuplas de objetos de Python
+
+_MAGICO = b"GCSR0001"
+# Encabezado binario: mágico, V, E, banderas (1 = pesos, 2 = etiquetas de arista, 4 = nombres de nodos)
+_ENCABEZADO = struct.Struct("<8sqqq")
+
+
+class GrafoCompacto:
+    """
+    Grafo dirigido compacto en formato CSR (compressed sparse row).
+
+    Los nodos se identifican internamente con enteros 0..V-1; las aristas que salen de u
+    ocupan las posiciones desplazamientos[u] .. desplazamientos[u + 1] - 1 de las columnas
+    destinos, pesos (opcional) y simbolos_arista (opcional, ids de la tabla simbolos).
+
+    Además se comporta como el diccionario de adyacencia que usan los demás módulos
+    (grafo[u], grafo.get(u, []), iterar nodos, items()), devolviendo para cada nodo la lista
+    en el mismo formato que su diccionario de origen:
+    - sin pesos ni etiquetas: [v, ...]                 (ciclos6, stack7, Grafos8_Euler)
+    - con pesos: [(v, p), ...]                         (Grafos9)
+    - con etiquetas: [(v, sigma), ...]                 (viterbi)
+    - con etiquetas y pesos: [(v, sigma, p), ...]      (viterbi_b)
+    Así todos los algoritmos lo aceptan directamente, y los que tienen un núcleo sobre enteros
+    pueden usar desplazamientos/destinos sin crear objetos por arista.
+
+    Costo de grafo[u]:
+    - Sin pesos, etiquetas de arista ni nombres de nodos devuelve una vista sin copia (memoryview)
+      sobre destinos: O(1).
+    - En los demás formatos arma la lista de vecinos con sus nombres: O(grado(u)) por consulta.
+
+    Algoritmos que leen el CSR directamente (sin pasar por grafo[u]):
+    - ciclos6.tiene_ciclo, stack7.dfs_iterativa, stack7.dfs_perezosa y Grafos8_Euler.
+    - Grafos9.ReliabilityIndex, viterbi.AutomataEtiquetado y viterbi_b.ModeloViterbi al compilarse.
+    Las funciones de una sola consulta (Grafos9.camino_mas_confiable, viterbi_find_path,
+    viterbi_max_path) usan grafo[u] por cada nodo expandido; para muchas consultas conviene
+    compilar una de las clases anteriores.
+    """
+
+    def __init__(self, etiquetas, desplazamientos, destinos, pesos=None,
+                 simbolos_arista=None, simbolos=None):
+        # etiquetas: secuencia id -> etiqueta del nodo; None si las etiquetas son los propios ids
+        self.num_nodos = len(desplazamientos) - 1
+        self.num_aristas = len(destinos)
+        self.etiquetas = etiquetas
+        self._ids = None if etiquetas is None else {e: i for i, e in enumerate(etiquetas)}
+        self.desplazamientos = desplazamientos
+        self.destinos = destinos
+        self.pesos = pesos
+        self.simbolos_arista = simbolos_arista
+        self.simbolos = simbolos
+
+    # --- Construcción ---
+
+    @classmethod
+    def desde_aristas(cls, origenes, destinos, num_nodos, etiquetas=None, pesos=None,
+                      simbolos_arista=None, simbolos=None):
+        """
+        Construye el CSR a partir de columnas de aristas con ids enteros, conservando el
+        orden relativo de las aristas de cada nodo (ordenamiento por conteo estable).
+        """
+        desplazamientos = array("q", bytes(8 * (num_nodos + 1)))
+        for u in origenes:
+            desplazamientos[u + 1] += 1
+        for u in range(num_nodos):
+            desplazamientos[u + 1] += desplazamientos[u]
+
+        posicion = array("q", desplazamientos[:-1])
+        orden = array("q", bytes(8 * len(origenes)))
+        for e, u in enumerate(origenes):
+            orden[posicion[u]] = e
+            posicion[u] += 1
+
+        return cls(
+            etiquetas,
+            desplazamientos,
+            array("q", (destinos[e] for e in orden)),
+            None if pesos is None else array("d", (pesos[e] for e in orden)),
+            None if simbolos_arista is None else array("q", (simbolos_arista[e] for e in orden)),
+            simbolos,
+        )
+
+    @classmethod
+    def desde_diccionario(cls, grafo, pesos=None, etiquetas=None):
+        """
+        Adaptador desde el diccionario de adyacencia {u: [...]} de los demás módulos.
+        El formato (con o sin pesos/etiquetas) se deduce de la primera arista, salvo que se
+        indique con pesos/etiquetas (necesario si las etiquetas de arista son números).
+        Un grafo sin aristas queda sin tabla de símbolos (simbolos=None); los decodificadores
+        de viterbi y viterbi_b lo tratan como un alfabeto vacío.
+        """
+        if isinstance(grafo, cls):
+            return grafo
+
+        interno = _Internador()
+        for u in grafo:
+            interno.id(u)
+        simbolos = _Internador()
+
+        origenes, destinos, col_pesos, sims = array("q"), array("q"), array("d"), array("q")
+        con_pesos, con_etiquetas = pesos, etiquetas
+        for u, aristas in grafo.items():
+            iu = interno.id(u)
+            for arista in aristas:
+                if not isinstance(arista, tuple):
+                    arista = (arista,)
+                if con_etiquetas is None:
+                    # Se deduce el formato con la primera arista
+                    con_etiquetas = len(arista) == 3 or (
+                        len(arista) == 2 and not isinstance(arista[1], (int, float)))
+                if con_pesos is None:
+                    con_pesos = len(arista) == 3 or (len(arista) == 2 and not con_etiquetas)
+                origenes.append(iu)
+                destinos.append(interno.id(arista[0]))
+                if con_etiquetas:
+                    sims.append(simbolos.id(arista[1]))
+                if con_pesos:
+                    col_pesos.append(arista[-1])
+
+        return cls.desde_aristas(
+            origenes, destinos, len(interno.etiquetas),
+            etiquetas=interno.etiquetas_o_none(),
+            pesos=col_pesos if con_pesos else None,
+            simbolos_arista=sims if con_etiquetas else None,
+            simbolos=simbolos.etiquetas if con_etiquetas else None,
+        )
+
+    @classmethod
+    def cargar_lista_aristas(cls, ruta, pesos=False, etiquetas=False, no_dirigido=False):
+        """
+        Carga un archivo de texto con una arista por línea: "u v [etiqueta] [peso]", separados por
+        espacios o comas (CSV). Las líneas vacías y las que empiezan con '#' se ignoran.
+        'ruta' también puede ser un archivo ya abierto (por ejemplo sys.stdin). Los nombres de nodos que son
+        enteros se convierten a int. Con no_dirigido=True se agrega también la arista v -> u.
+        """
+        interno = _Internador()
+        simbolos = _Internador()
+        origenes, destinos, col_pesos, sims = array("q"), array("q"), array("d"), array("q")
+
+        with open(ruta) if isinstance(ruta, (str, os.PathLike)) else nullcontext(ruta) as archivo:
+            for campos in leer_aristas(archivo):
+                u, v = interno.id(campos[0]), interno.id(campos[1])
+                extra = []
+                if etiquetas:
+                    extra.append(simbolos.id(campos[2]))
+                peso = float(campos[3 if etiquetas else 2]) if pesos else None
+                for a, b in ((u, v), (v, u)) if no_dirigido else ((u, v),):
+                    origenes.append(a)
+                    destinos.append(b)
+                    if etiquetas:
+                        sims.append(extra[0])
+                    if pesos:
+                        col_pesos.append(peso)
+
+        return cls.desde_aristas(
+            origenes, destinos, len(interno.etiquetas),
+            etiquetas=interno.etiquetas_o_none(),
+            pesos=col_pesos if pesos else None,
+            simbolos_arista=sims if etiquetas else None,
+            simbolos=simbolos.etiquetas if etiquetas else None,
+        )
+
+    def guardar_binario(self, ruta):
+        """
+        Guarda el grafo en un archivo binario que cargar_binario puede mapear a memoria.
+        Los nombres de nodos y símbolos, si los hay, se guardan como JSON al final.
+        """
+        banderas = ((1 if self.pesos is not None else 0)
+                    | (2 if self.simbolos_arista is not None else 0)
+                    | (4 if self.etiquetas is not None else 0))
+        with open(ruta, "wb") as archivo:
+            archivo.write(_ENCABEZADO.pack(_MAGICO, self.num_nodos, self.num_aristas, banderas))
+            for columna, tipo in ((self.desplazamientos, "q"), (self.destinos, "q"),
+                                  (self.pesos, "d"), (self.simbolos_arista, "q")):
+                if columna is not None:
+                    archivo.write(array(tipo, columna).tobytes())
+            archivo.write(json.dumps({
+                "etiquetas": None if self.etiquetas is None else list(self.etiquetas),
+                "simbolos": self.simbolos,
+            }).encode())
+
+    @classmethod
+    def cargar_binario(cls, ruta):
+        """
+        Carga un archivo de guardar_binario mapeándolo a memoria: las columnas CSR son vistas
+        sobre el mapa (sin copiar), así que el costo inicial es O(1) salvo por los nombres.
+        """
+        with open(ruta, "rb") as archivo:
+            mapa = mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ)
+        magico, v, e, banderas = _ENCABEZADO.unpack_from(mapa)
+        if magico != _MAGICO:
+            raise ValueError(f"{ruta!r} no es un grafo compacto")
+
+        vista = memoryview(mapa)
+        pos = _ENCABEZADO.size
+
+        def columna(n, tipo):
+            nonlocal pos
+            datos = vista[pos:pos + 8 * n].cast(tipo)
+            pos += 8 * n
+            return datos
+
+        desplazamientos = columna(v + 1, "q")
+        destinos = columna(e, "q")
+        pesos = columna(e, "d") if banderas & 1 else None
+        simbolos_arista = columna(e, "q") if banderas & 2 else None
+        nombres = json.loads(bytes(vista[pos:]).decode() or "{}")
+        grafo = cls(nombres.get("etiquetas"), desplazamientos, destinos, pesos,
+                    simbolos_arista, nombres.get("simbolos"))
+        grafo._mapa = mapa  # Mantener el mapa vivo mientras existan las vistas
+        return grafo
+
+    # --- Acceso por ids enteros ---
+
+    def id_de(self, etiqueta):
+        """Id entero de un nodo a partir de su etiqueta."""
+        if self._ids is None:
+            if isinstance(etiqueta, int) and 0 <= etiqueta < self.num_nodos:
+                return etiqueta
+            raise KeyError(etiqueta)
+        return self._ids[etiqueta]
+
+    def etiqueta_de(self, nodo):
+        """Etiqueta original del nodo con id entero 'nodo'."""
+        return nodo if self.etiquetas is None else self.etiquetas[nodo]
+
+    def vecinos_ids(self, u):
+        """Ids de los destinos de las aristas que salen de u (vista sin copia)."""
+        return memoryview(self.destinos)[self.desplazamientos[u]:self.desplazamientos[u + 1]]
+
+    def grados_salida(self):
+        """Arreglo con el grado de salida de cada nodo."""
+        d = self.desplazamientos
+        return array("q", (d[u + 1] - d[u] for u in range(self.num_nodos)))
+
+    # --- Interfaz de diccionario de adyacencia ---
+
+    def __len__(self):
+        return self.num_nodos
+
+    def __iter__(self):
+        return iter(range(self.num_nodos) if self.etiquetas is None else self.etiquetas)
+
+    def __contains__(self, etiqueta):
+        try:
+            self.id_de(etiqueta)
+        except (KeyError, TypeError):
+            return False
+        return True
+
+    def __getitem__(self, etiqueta):
+        u = self.id_de(etiqueta)
+        if self.etiquetas is None and self.pesos is None and self.simbolos_arista is None:
+            return self.vecinos_ids(u)
+        inicio, fin = self.desplazamientos[u], self.desplazamientos[u + 1]
+        nombre = self.etiqueta_de
+        vecinos = [nombre(v) for v in self.destinos[inicio:fin]]
+        columnas = []
+        if self.simbolos_arista is not None:
+            columnas.append([self.simbolos[s] for s in self.simbolos_arista[inicio:fin]])
+        if self.pesos is not None:
+            columnas.append(list(self.pesos[inicio:fin]))
+        return list(zip(vecinos, *columnas)) if columnas else vecinos
+
+    def get(self, etiqueta, defecto=None):
+        try:
+            return self[etiqueta]
+        except (KeyError, TypeError):
+            return defecto
+
+    def keys(self):
+        return iter(self)
+
+    def items(self):
+        return ((u, self[u]) for u in self)
+
+    def a_diccionario(self):
+        """Convierte de vuelta al diccionario de adyacencia con las etiquetas originales."""
+        return {u: list(aristas) for u, aristas in self.items()}
+
+
+def como_compacto(grafo, pesos=None, etiquetas=None):
+    """Devuelve el grafo en formato compacto; los diccionarios se adaptan con desde_diccionario."""
+    return GrafoCompacto.desde_diccionario(grafo, pesos, etiquetas)
+
+
+class _Internador:
+    # Asigna ids enteros consecutivos a etiquetas arbitrarias
+    def __init__(self):
+        self.ids = {}
+        self.etiquetas = []
+
+    def id(self, etiqueta):
+        i = self.ids.get(etiqueta)
+        if i is None:
+            i = self.ids[etiqueta] = len(self.etiquetas)
+            self.etiquetas.append(etiqueta)
+        return i
+
+    def etiquetas_o_none(self):
+        # Si las etiquetas ya son 0..V-1 en orden no hace falta guardarlas
+        if all(type(e) is int and e == i for i, e in enumerate(self.etiquetas)):
+            return None
+        return self.etiquetas
+
+
+def nombre_de_nodo(campo):
+    """Nombre de un nodo leído de texto: int si el campo es un entero, el mismo texto si no."""
+    try:
+        return int(campo)
+    except ValueError:
+        return campo
+
+
+def campos_de_arista(linea):
+    """
+    Campos de una línea de lista de aristas "u v [etiqueta] [peso]", separados por espacios o comas,
+    con u y v convertidos por nombre_de_nodo. Devuelve None si la línea está vacía o empieza con '#'.
+    """
+    campos = linea.replace(",", " ").split()
+    if not campos or campos[0].startswith("#"):
+        return None
+    campos[:2] = map(nombre_de_nodo, campos[:2])
+    return campos
+
+
+def leer_aristas(archivo):
+    """Campos (ver campos_de_arista) de cada arista de un archivo abierto o iterable de líneas."""
+    for linea in archivo:
+        campos = campos_de_arista(linea)
+        if campos is not None:
+            yield campos
+
+
+# Ejemplo de uso
+if __name__ == "__main__":
+    grafo = {
+        'A': [('B', 0.9), ('C', 0.5)],
+        'B': [('D', 0.7)],
+        'C': [('D', 0.9)],
+    }
+    compacto = como_compacto(grafo)
+    print("Nodos:", list(compacto), "Aristas:", compacto.num_aristas)
+    print("Desplazamientos:", list(compacto.desplazamientos))
+    print("Destinos:", list(compacto.destinos))
+    print("Adyacencia de 'A':", compacto['A'])
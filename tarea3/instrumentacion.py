@@ -0,0 +1,154 @@
+import time
+from contextlib import contextmanager
+
+# Contadores opcionales para los caminos calientes (heaps de voraces4, SRPT y Dijkstra, y los
+# decodificadores de Viterbi). Uso:
+#
+#     with instrumentar() as mediciones:
+#         asignar_salones(actividades)
+#     print(mediciones[0])
+#
+# Sin una sesión activa, sonda() devuelve un objeto nulo cuyo heap() entrega las mismas
+# funciones de heapq que recibe: el ciclo interno corre el mismo código que sin instrumentar y
+# sólo se paga una llamada por invocación del algoritmo (y una por paso en Viterbi).
+# Las sesiones son globales al proceso; no se separan por hilo.
+
+_sesiones = []  # Pila de sesiones activas: (lista de mediciones, callback)
+
+
+class Medicion:
+    """
+    Contadores de una llamada a un algoritmo instrumentado.
+    - heap_push / heap_pop / pico_heap: operaciones sobre el heap y su tamaño máximo.
+    - obsoletas: entradas sacadas del heap que se descartaron por estar desactualizadas.
+    - expandidos: nodos o estados expandidos; aristas_relajadas: aristas que mejoraron una distancia.
+    - estados_por_paso: tamaño de la frontera expandida en cada paso (Viterbi); si el algoritmo no
+      reporta 'expandidos', se toma la suma de estos tamaños.
+    - fases: segundos por fase, en el orden en que ocurrieron.
+    """
+
+    def __init__(self, funcion):
+        self.funcion = funcion
+        self.heap_push = 0
+        self.heap_pop = 0
+        self.pico_heap = 0
+        self.obsoletas = 0
+        self.expandidos = 0
+        self.aristas_relajadas = 0
+        self.estados_por_paso = []
+        self.fases = {}
+        self.segundos = 0.0
+        self._inicio = self._inicio_fase = time.perf_counter()
+        self._fase = None
+
+    @property
+    def pico_frontera(self):
+        return max(self.estados_por_paso, default=0)
+
+    def heap(self, heappush, heappop):
+        """Devuelve versiones de heappush/heappop que cuentan operaciones y el tamaño máximo."""
+        def push(heap, elemento):
+            heappush(heap, elemento)
+            self.heap_push += 1
+            if len(heap) > self.pico_heap:
+                self.pico_heap = len(heap)
+
+        def pop(heap):
+            self.heap_pop += 1
+            return heappop(heap)
+
+        return push, pop
+
+    def fase(self, nombre):
+        """Cierra la fase actual (si hay) y empieza a medir 'nombre'."""
+        ahora = time.perf_counter()
+        if self._fase is not None:
+            self.fases[self._fase] = self.fases.get(self._fase, 0.0) + ahora - self._inicio_fase
+        self._fase, self._inicio_fase = nombre, ahora
+
+    def paso(self, estados):
+        self.estados_por_paso.append(estados)
+
+    def terminar(self, heap_perezoso=False, **contadores):
+        """
+        Cierra la medición, fija contadores calculados al final y la reporta a las sesiones.
+        Con heap_perezoso=True (Dijkstra con borrado perezoso, donde cada arista relajada inserta
+        una entrada) se deducen aristas_relajadas = heap_push y obsoletas = heap_pop - expandidos.
+        """
+        self.fase(None)
+        self.segundos = time.perf_counter() - self._inicio
+        for campo, valor in contadores.items():
+            setattr(self, campo, valor)
+        if self.estados_por_paso and not self.expandidos:
+            self.expandidos = sum(self.estados_por_paso)
+        if heap_perezoso:
+            self.aristas_relajadas = self.heap_push
+            self.obsoletas = self.heap_pop - self.expandidos
+        for mediciones, callback in _sesiones:
+            mediciones.append(self)
+            if callback is not None:
+                callback(self)
+
+    def a_diccionario(self):
+        datos = {k: v for k, v in vars(self).items() if not k.startswith("_")}
+        datos["pico_frontera"] = self.pico_frontera
+        return datos
+
+    def __repr__(self):
+        return (f"Medicion({self.funcion!r}, heap_push={self.heap_push}, heap_pop={self.heap_pop}, "
+                f"pico_heap={self.pico_heap}, obsoletas={self.obsoletas}, expandidos={self.expandidos}, "
+                f"aristas_relajadas={self.aristas_relajadas}, pasos={len(self.estados_por_paso)}, "
+                f"pico_frontera={self.pico_frontera}, segundos={self.segundos:.6f})")
+
+
+class _SondaNula:
+    # Sonda usada cuando no hay sesiones: no mide nada y no cambia las funciones del heap
+
+    def heap(self, heappush, heappop):
+        return heappush, heappop
+
+    def fase(self, nombre):
+        pass
+
+    def paso(self, estados):
+        pass
+
+    def terminar(self, heap_perezoso=False, **contadores):
+        pass
+
+
+_SONDA_NULA = _SondaNula()
+
+
+def sonda(funcion):
+    """
+    Punto de entrada de los algoritmos instrumentados: una Medicion nueva si hay alguna sesión
+    activa, o la sonda nula compartida si no la hay.
+    """
+    return Medicion(funcion) if _sesiones else _SONDA_NULA
+
+
+@contextmanager
+def instrumentar(callback=None):
+    """
+    Activa la instrumentación dentro del bloque 'with'.
+    :param callback: Función opcional que recibe cada Medicion al terminar la llamada medida
+    :return: Lista que se va llenando con las mediciones del bloque, en orden de término
+    """
+    sesion = ([], callback)
+    _sesiones.append(sesion)
+    try:
+        yield sesion[0]
+    finally:
+        _sesiones.remove(sesion)
+
+
+# Ejemplo de uso
+if __name__ == "__main__":
+    # Se importa desde el paquete: con "python -m" este archivo es otro módulo (__main__)
+    from .instrumentacion import instrumentar
+    from .voraces4 import asignar_salones
+
+    with instrumentar(callback=print) as mediciones:
+        asignar_salones([(1, 4), (3, 5), (0, 6), (5, 7), (3, 9), (5, 9), (6, 10), (8, 11)])
+    print(mediciones[0].fases)
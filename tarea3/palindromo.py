@@ -0,0 +1,335 @@
+def longest_palindromic_subsequence(s):
+    """
+    Encuentra la subsecuencia palindrómica más larga en una cadena s.
+
+    Complejidad temporal:
+    - Llenar la tabla dp toma O(n²), donde n es la longitud de la cadena.
+    - Reconstruir el palíndromo también toma O(n), pero está dominado por la fase anterior.
+    - Total: O(n²)
+
+    Complejidad espacial:
+    - O(n²) para almacenar la tabla dp.
+
+    Justificación:
+    - Se utiliza programación dinámica para calcular la longitud del palíndromo más largo en cada subcadena s[i..j].
+    - La tabla dp[i][j] guarda la longitud del palíndromo más largo en ese rango.
+    - Se empieza desde subcadenas pequeñas (longitud 1) hasta subcadenas completas (longitud n).
+    - Si los caracteres en los extremos coinciden, se suman al valor interno (dp[i+1][j-1] + 2).
+    - Si no coinciden, se toma el máximo entre excluir el carácter izquierdo o el derecho.
+    - Finalmente, se reconstruye el palíndromo usando la tabla dp, yendo desde los extremos hacia el centro.
+    - Este enfoque garantiza encontrar la subsecuencia palindrómica más larga sin necesidad de evaluar todas las combinaciones posibles.
+    """
+
+    n = len(s)
+    dp = [[0] * n for _ in range(n)]  # Tabla DP de tamaño n x n
+
+    # Caso base: cada letra sola es un palíndromo de longitud 1
+    for i in range(n):
+        dp[i][i] = 1
+
+    # Evaluar subcadenas de longitud 2 hasta n
+    for cl in range(2, n + 1):
+        for i in range(n - cl + 1):
+            j = i + cl - 1  # Fin de la subcadena
+
+            if s[i] == s[j] and cl == 2:
+                dp[i][j] = 2  # Dos letras iguales seguidas
+            elif s[i] == s[j]:
+                dp[i][j] = dp[i + 1][j - 1] + 2  # Letras iguales en extremos
+            else:
+                dp[i][j] = max(dp[i][j - 1], dp[i + 1][j])  # Excluir una letra
+
+    # Reconstrucción del palíndromo
+    i, j = 0, n - 1
+    res = [""] * dp[0][n - 1]  # Espacio para el resultado
+    start, end = 0, dp[0][n - 1] - 1  # Punteros para rellenar extremos
+
+    while i <= j:
+        if s[i] == s[j]:
+            res[start] = s[i]
+            res[end] = s[j]
+            start += 1
+            end -= 1
+            i += 1
+            j -= 1
+        elif dp[i][j - 1] > dp[i + 1][j]:
+            j -= 1  # Avanzar desde el lado derecho
+        else:
+            i += 1  # Avanzar desde el lado izquierdo
+
+    return "".join(res)  # Convertir lista en string
+
+
+def _mascaras(a):
+    # Para cada carácter, entero cuyo bit i está encendido si a[i] es ese carácter
+    mascaras = {}
+    for i, c in enumerate(a):
+        mascaras[c] = mascaras.get(c, 0) | (1 << i)
+    return mascaras
+
+
+def _lcs_bits(a, b):
+    # LCS bit-paralelo (Allison-Dix / Hyyrö): los ceros de V en las posiciones < k cuentan
+    # LCS(a[:k], b). Cada carácter de b actualiza todas las posiciones de a a la vez.
+    mascara = (1 << len(a)) - 1
+    mascaras = _mascaras(a)
+    V = mascara
+    for c in b:
+        U = V & mascaras.get(c, 0)
+        V = ((V + U) | (V - U)) & mascara
+    return V
+
+
+def longitud_lps(s):
+    """
+    Longitud de la subsecuencia palindrómica más larga, sin tabla dp.
+
+    Complejidad temporal:
+    - O(n² / w), con w el tamaño de palabra: cada carácter actualiza un vector de n bits.
+
+    Complejidad espacial:
+    - O(n) bits para el vector de estado y las máscaras por carácter.
+
+    Justificación:
+    - La subsecuencia palindrómica más larga de s mide lo mismo que la subsecuencia común
+      más larga (LCS) entre s y su reverso.
+    - La LCS se calcula con el algoritmo bit-paralelo: las operaciones sobre enteros de Python
+      procesan una fila completa de la tabla por cada carácter.
+    """
+    V = _lcs_bits(s, s[::-1])
+    return len(s) - bin(V).count("1")
+
+
+def _fila_lcs(a, b):
+    # fila[k] = LCS(a[:k], b) para k = 0..len(a)
+    V = _lcs_bits(a, b)
+    bits = format(V, f"0{len(a)}b")[::-1] if a else ""
+    fila = [0]
+    for bit in bits:
+        fila.append(fila[-1] + (bit == "0"))
+    return fila
+
+
+def _alinear_lcs(a, b, base_a, base_b, pares):
+    # Hirschberg: agrega a 'pares' los índices (i, j) emparejados por una LCS de a y b
+    if not a or not b:
+        return
+    if len(b) == 1:
+        i = a.find(b)
+        if i >= 0:
+            pares.append((base_a + i, base_b))
+        return
+    mitad = len(b) // 2
+    izquierda = _fila_lcs(a, b[:mitad])
+    derecha = _fila_lcs(a[::-1], b[mitad:][::-1])
+    m = len(a)
+    corte = max(range(m + 1), key=lambda k: izquierda[k] + derecha[m - k])
+    _alinear_lcs(a[:corte], b[:mitad], base_a, base_b, pares)
+    _alinear_lcs(a[corte:], b[mitad:], base_a + corte, base_b + mitad, pares)
+
+
+def longest_palindromic_subsequence_lineal(s):
+    """
+    Subsecuencia palindrómica más larga en espacio lineal (Hirschberg sobre la LCS de s y su reverso).
+
+    Complejidad temporal:
+    - O(n² / w) por nivel de la recursión de Hirschberg, con O(log n) niveles en las filas de
+      tamaño decreciente; en total O(n² / w) más O(n log n) para extraer las filas.
+
+    Complejidad espacial:
+    - O(n): sólo se guardan dos filas de LCS a la vez y los pares emparejados.
+
+    Justificación:
+    - Hirschberg parte el reverso a la mitad, encuentra con dos filas de LCS (hacia adelante y hacia
+      atrás) el corte óptimo de s, y resuelve cada mitad por separado.
+    - Una LCS de s y su reverso no siempre es un palíndromo, pero sus pares (i, p) emparejan
+      s[i] con s[p] (p medido en s), con i creciente y p decreciente. Los pares con i < p forman
+      un palíndromo alrededor del centro, lo mismo que los pares con i > p leídos en espejo, y un
+      posible par con i = p es el carácter central. El mayor de los dos lados mide la LCS completa.
+    - La longitud coincide con longest_palindromic_subsequence; si hay varios palíndromos de esa
+      longitud, el elegido puede ser otro.
+    """
+    n = len(s)
+    pares = []
+    _alinear_lcs(s, s[::-1], 0, 0, pares)
+    pares = [(i, n - 1 - j) for i, j in pares]
+
+    antes = [(i, p) for i, p in pares if i < p]  # i creciente, p decreciente
+    despues = [(i, p) for i, p in pares if i > p]
+    centro = [s[i] for i, p in pares if i == p]
+
+    if len(antes) >= len(despues):
+        mitad = "".join(s[i] for i, _ in antes)
+    else:
+        mitad = "".join(s[p] for _, p in reversed(despues))
+    return mitad + "".join(centro) + mitad[::-1]
+
+
+def manacher(s):
+    """
+    Radios de los palíndromos máximos centrados en cada posición (algoritmo de Manacher).
+
+    Complejidad temporal:
+    - O(n): el extremo derecho del palíndromo más lejano sólo avanza.
+
+    Complejidad espacial:
+    - O(n) para los dos arreglos de radios.
+
+    Justificación:
+    - Dentro del palíndromo más a la derecha [l, r], el radio en i es al menos el de su espejo
+      l + r - i (acotado por r), así que sólo se expande lo que sobrepasa r.
+
+    :return: (impares, pares): impares[i] = k si s[i-k+1 .. i+k-1] es el palíndromo impar máximo
+             centrado en i; pares[i] = k si s[i-k .. i+k-1] es el palíndromo par máximo cuyo
+             centro está entre i-1 e i
+    """
+    n = len(s)
+    impares = [0] * n
+    l, r = 0, -1
+    for i in range(n):
+        k = 1 if i > r else min(impares[l + r - i], r - i + 1)
+        while i - k >= 0 and i + k < n and s[i - k] == s[i + k]:
+            k += 1
+        impares[i] = k
+        if i + k - 1 > r:
+            l, r = i - k + 1, i + k - 1
+
+    pares = [0] * n
+    l, r = 0, -1
+    for i in range(n):
+        k = 0 if i > r else min(pares[l + r - i + 1], r - i + 1)
+        while i - k - 1 >= 0 and i + k < n and s[i - k - 1] == s[i + k]:
+            k += 1
+        pares[i] = k
+        if i + k - 1 > r:
+            l, r = i - k, i + k - 1
+
+    return impares, pares
+
+
+def longest_palindromic_substring(s):
+    """
+    Subcadena palindrómica más larga (contigua) en O(n) con los radios de Manacher.
+    Si hay varias de la misma longitud, devuelve la que aparece primero.
+    """
+    impares, pares = manacher(s)
+    inicio, largo = 0, 0
+    for i in range(len(s)):
+        if 2 * impares[i] - 1 > largo or (2 * impares[i] - 1 == largo and i - impares[i] + 1 < inicio):
+            inicio, largo = i - impares[i] + 1, 2 * impares[i] - 1
+        if 2 * pares[i] > largo or (2 * pares[i] == largo and i - pares[i] < inicio):
+            inicio, largo = i - pares[i], 2 * pares[i]
+    return s[inicio:inicio + largo]
+
+
+class ArbolPalindromico:
+    """
+    Árbol palindrómico (eertree) que se actualiza carácter por carácter.
+
+    Complejidad temporal:
+    - O(1) amortizado por append (el sufijo palindrómico más largo crece a lo más 2 por carácter,
+      así que los saltos por enlaces de sufijo se pagan con ese crecimiento).
+
+    Complejidad espacial:
+    - O(n): a lo más un nodo nuevo por carácter (hay a lo más n palíndromos distintos) y el texto.
+
+    Justificación:
+    - Cada nodo es un palíndromo distinto; sus aristas agregan el mismo carácter a ambos lados
+      y su enlace de sufijo apunta al sufijo palindrómico propio más largo.
+    - Al agregar c se busca, siguiendo enlaces desde el sufijo palindrómico más largo actual,
+      el primer X tal que cXc es sufijo del texto; si cXc no existía, es el único palíndromo
+      distinto nuevo.
+    - Cada nodo guarda cuántos sufijos palindrómicos tiene (largo de su cadena de enlaces), lo
+      que da el número total de subcadenas palindrómicas (con repetición) sin recorrer nada.
+
+    Estadísticas disponibles después de cada append:
+    - distintos: número de palíndromos distintos no vacíos.
+    - total: número de subcadenas palindrómicas contando repeticiones.
+    - sufijo: largo del sufijo palindrómico más largo del texto actual.
+    - mas_largo(): la subcadena palindrómica más larga vista hasta ahora.
+    """
+
+    def __init__(self, texto=""):
+        # Nodo 0: raíz imaginaria de largo -1; nodo 1: palíndromo vacío (enlace a la raíz -1)
+        self.largo = [-1, 0]
+        self.enlace = [0, 0]
+        self.hijos = [{}, {}]
+        self.sufijos = [0, 0]
+        self.texto = []
+        self.ultimo = 1
+        self.total = 0
+        self._mejor_largo = 0
+        self._mejor_fin = 0
+        for c in texto:
+            self.append(c)
+
+    def _extender(self, nodo, c):
+        # Sube por los enlaces hasta que c + palíndromo(nodo) + c sea sufijo del texto
+        pos = len(self.texto) - 1
+        while True:
+            inicio = pos - 1 - self.largo[nodo]
+            if inicio >= 0 and self.texto[inicio] == c:
+                return nodo
+            nodo = self.enlace[nodo]
+
+    def append(self, c):
+        """Agrega un carácter al final del texto y actualiza las estadísticas."""
+        self.texto.append(c)
+        actual = self._extender(self.ultimo, c)
+        nuevo = self.hijos[actual].get(c)
+        if nuevo is None:
+            nuevo = len(self.largo)
+            self.largo.append(self.largo[actual] + 2)
+            if self.largo[nuevo] == 1:
+                enlace = 1
+            else:
+                enlace = self.hijos[self._extender(self.enlace[actual], c)][c]
+            self.enlace.append(enlace)
+            self.hijos.append({})
+            self.sufijos.append(self.sufijos[enlace] + 1)
+            self.hijos[actual][c] = nuevo
+        self.ultimo = nuevo
+        self.total += self.sufijos[nuevo]
+        if self.largo[nuevo] > self._mejor_largo:
+            self._mejor_largo = self.largo[nuevo]
+            self._mejor_fin = len(self.texto)
+
+    @property
+    def distintos(self):
+        return len(self.largo) - 2
+
+    @property
+    def sufijo(self):
+        return self.largo[self.ultimo]
+
+    def mas_largo(self):
+        inicio = self._mejor_fin - self._mejor_largo
+        return "".join(self.texto[inicio:self._mejor_fin])
+
+
+def analizar_palindromos(cadenas):
+    """
+    Analiza muchas cadenas en una sola llamada.
+
+    Complejidad temporal:
+    - O(sum n_i): un árbol palindrómico por cadena, en tiempo lineal.
+
+    :return: Lista de diccionarios con "mas_largo" (subcadena palindrómica más larga),
+             "distintos" (palíndromos distintos) y "total" (subcadenas palindrómicas con repetición)
+    """
+    resultados = []
+    for cadena in cadenas:
+        arbol = ArbolPalindromico(cadena)
+        resultados.append({
+            "mas_largo": arbol.mas_largo(),
+            "distintos": arbol.distintos,
+            "total": arbol.total,
+        })
+    return resultados
+
+
+# Ejemplo de uso
+if __name__ == "__main__":
+    cadena = "popocateptl"
+    print("Entrada:", cadena)
+    print("Palíndromo más largo como subsecuencia:", longest_palindromic_subsequence(cadena))
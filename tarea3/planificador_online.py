@@ -0,0 +1,205 @@
+import asyncio
+import heapq
+import math
+import random
+import time
+from collections import namedtuple
+
+# Tiempo de ejecución: O(log n) amortizado por tarea enviada (operaciones de heap)
+# Uso de memoria: O(n) para las tareas pendientes y los despachos aún no consumidos
+# Justificación: Se mantienen vivos el heap de SJF/SRPT y los acumulados de los promedios,
+# de modo que cada llegada sólo avanza la simulación hasta su tiempo de liberación
+
+# Decisión de despacho: la tarea corre de inicio a fin; completada indica si terminó
+# (en SRPT una tarea puede ser interrumpida y reanudada en varios despachos)
+Despacho = namedtuple("Despacho", ["tarea", "inicio", "fin", "completada"])
+
+
+class PlanificadorOnline:
+    """
+    Planificador en línea para las políticas voraces SJF (no preemptive) y SRPT (preemptive).
+
+    Los productores envían tareas (ri, pi) conforme llegan, en orden no decreciente de ri,
+    y los consumidores esperan las decisiones de despacho con siguiente_despacho() o
+    iterando despachos(). Una decisión sólo se emite cuando ya no puede cambiar: como
+    las llegadas son crecientes, todo lo que ocurre antes de la última llegada es definitivo.
+    En SRPT el despacho de la tarea en ejecución sólo se corta cuando una llegada la desplaza
+    del tope del heap; si sigue siendo la de menor tiempo restante, el despacho continúa.
+
+    enviar() y cerrar() son métodos normales: sólo actualizan el heap y encolan despachos,
+    no esperan nada. La cola de despachos no tiene límite.
+
+    Complejidad temporal:
+    - O(log n) amortizado por tarea: cada llegada provoca a lo más una interrupción.
+
+    Complejidad espacial:
+    - O(n) en el peor caso para el heap de tareas listas.
+    """
+
+    def __init__(self, politica="srpt"):
+        if politica not in ("sjf", "srpt"):
+            raise ValueError("La política debe ser 'sjf' o 'srpt'")
+        self.politica = politica
+        self._heap = []  # (tiempo restante, ri, id)
+        self._llegadas = []  # ri de cada tarea, por id
+        self._duraciones = []
+        self._tiempo = 0
+        self._ultima_llegada = -math.inf
+        self._en_curso = None  # SRPT: (tarea, inicio de su despacho actual) si corre sin cortarse
+        self._cerrado = False
+        self._cola = asyncio.Queue()
+
+        # Acumulados para los promedios en línea
+        self.completadas = 0
+        self.suma_finalizaciones = 0
+        self.suma_esperas = 0
+
+    @property
+    def promedio_finalizacion(self):
+        """Tiempo promedio de finalización de las tareas completadas hasta ahora."""
+        return self.suma_finalizaciones / self.completadas if self.completadas else 0.0
+
+    @property
+    def promedio_espera(self):
+        """Tiempo promedio de espera de las tareas completadas hasta ahora."""
+        return self.suma_esperas / self.completadas if self.completadas else 0.0
+
+    def enviar(self, ri, pi):
+        """
+        Registra una tarea que llega en ri con duración pi.
+        :return: Identificador de la tarea (orden de llegada)
+        """
+        if self._cerrado:
+            raise RuntimeError("El planificador ya fue cerrado")
+        if ri < self._ultima_llegada:
+            raise ValueError("Las tareas deben enviarse en orden no decreciente de llegada")
+
+        self._avanzar(ri)
+        tarea = len(self._llegadas)
+        self._llegadas.append(ri)
+        self._duraciones.append(pi)
+        self._ultima_llegada = ri
+        if not self._heap:
+            self._tiempo = max(self._tiempo, ri)
+        heapq.heappush(self._heap, (pi, ri, tarea))
+        if self._en_curso is not None and self._heap[0][2] != self._en_curso[0]:
+            # La nueva tarea desplaza a la que corría: su despacho termina en esta llegada
+            corriendo, inicio = self._en_curso
+            self._en_curso = None
+            self._cola.put_nowait(Despacho(corriendo, inicio, self._tiempo, False))
+        return tarea
+
+    def cerrar(self):
+        """Indica que no llegarán más tareas y despacha todo lo pendiente."""
+        if not self._cerrado:
+            self._cerrado = True
+            self._avanzar(math.inf)
+            self._cola.put_nowait(None)
+
+    async def siguiente_despacho(self):
+        """Espera la siguiente decisión de despacho; devuelve None al cerrar el planificador."""
+        return await self._cola.get()
+
+    async def despachos(self):
+        """Itera las decisiones de despacho hasta que el planificador se cierre."""
+        while True:
+            despacho = await self._cola.get()
+            if despacho is None:
+                return
+            yield despacho
+
+    def _avanzar(self, hasta):
+        # Ejecuta la simulación mientras el tiempo actual sea menor que la próxima llegada
+        heap = self._heap
+        while heap and self._tiempo < hasta:
+            restante, ri, tarea = heapq.heappop(heap)
+            inicio = self._tiempo
+            despacho = inicio
+            if self._en_curso is not None:
+                despacho = self._en_curso[1]  # Sigue el despacho que no se cortó en la llegada
+                self._en_curso = None
+            if self.politica == "sjf" or inicio + restante <= hasta:
+                self._tiempo = inicio + restante
+                self._completar(tarea, despacho)
+            else:
+                # SRPT: corre hasta la llegada; el despacho se emite si la llegada la interrumpe
+                self._tiempo = hasta
+                heapq.heappush(heap, (restante - (hasta - inicio), ri, tarea))
+                self._en_curso = (tarea, despacho)
+
+    def _completar(self, tarea, inicio):
+        fin = self._tiempo
+        self.completadas += 1
+        self.suma_finalizaciones += fin
+        self.suma_esperas += fin - self._llegadas[tarea] - self._duraciones[tarea]
+        self._cola.put_nowait(Despacho(tarea, inicio, fin, True))
+
+
+async def _generar_carga(planificador, n, tasa_llegada, duracion_media, semilla, enviadas):
+    rng = random.Random(semilla)
+    ri = 0.0
+    for _ in range(n):
+        ri += rng.expovariate(tasa_llegada)
+        tarea = planificador.enviar(ri, rng.expovariate(1 / duracion_media))
+        enviadas[tarea] = time.perf_counter()
+        await asyncio.sleep(0)  # Cede el control al consumidor como lo haría un productor real
+    planificador.cerrar()
+
+
+async def _medir(n, politica, tasa_llegada, duracion_media, semilla):
+    planificador = PlanificadorOnline(politica)
+    enviadas = {}
+    latencias = []
+
+    inicio = time.perf_counter()
+    productor = asyncio.create_task(
+        _generar_carga(planificador, n, tasa_llegada, duracion_media, semilla, enviadas)
+    )
+    async for despacho in planificador.despachos():
+        if despacho.completada:
+            latencias.append(time.perf_counter() - enviadas[despacho.tarea])
+    await productor
+    total = time.perf_counter() - inicio
+
+    latencias.sort()
+    return {
+        "politica": politica,
+        "tareas": n,
+        "segundos": total,
+        "tareas_por_segundo": n / total if total else math.inf,
+        "latencia_p50": latencias[len(latencias) // 2] if latencias else 0.0,
+        "latencia_p99": latencias[min(len(latencias) - 1, int(len(latencias) * 0.99))] if latencias else 0.0,
+        "promedio_finalizacion": planificador.promedio_finalizacion,
+        "promedio_espera": planificador.promedio_espera,
+    }
+
+
+def medir_rendimiento(n=100_000, politica="srpt", tasa_llegada=1.0, duracion_media=0.9, semilla=0):
+    """
+    Generador de carga local en el mismo proceso: mide el rendimiento (tareas por segundo)
+    y la latencia real entre el envío de una tarea y su despacho como completada.
+    :return: Diccionario con las métricas de la corrida
+    """
+    return asyncio.run(_medir(n, politica, tasa_llegada, duracion_media, semilla))
+
+
+# Ejemplo de uso
+if __name__ == "__main__":
+    async def ejemplo():
+        planificador = PlanificadorOnline("srpt")
+
+        async def productor():
+            for ri, pi in [(0, 3), (1, 9), (2, 6)]:
+                planificador.enviar(ri, pi)
+            planificador.cerrar()
+
+        tarea = asyncio.create_task(productor())
+        async for despacho in planificador.despachos():
+            print(despacho)
+        await tarea
+        print(f"Tiempo promedio de finalización (preemptive): {planificador.promedio_finalizacion}")
+
+    asyncio.run(ejemplo())
+
+    for politica in ("sjf", "srpt"):
+        print(medir_rendimiento(20_000, politica))
@@ -0,0 +1,155 @@
+from .grafo_compacto import GrafoCompacto
+
+
+def dfs_iterativa(grafo, inicio):
+    """
+    Realiza una búsqueda en profundidad (DFS) no recursiva a partir del nodo 'inicio'.
+
+    Complejidad temporal:
+    O(V + E), donde V es el número de vértices y E el número de aristas.
+    - Cada nodo se visita una vez.
+    - Cada arista se examina una vez en grafos no dirigidos.
+
+    Complejidad espacial:
+    O(V), ya que:
+    - Se mantiene un conjunto de nodos visitados.
+    - El stack puede almacenar hasta V nodos en el peor caso.
+
+    Explicación:
+    En lugar de usar llamadas recursivas del sistema, utilizamos un stack
+    para controlar el flujo del algoritmo, simulando el comportamiento recursivo.
+    Con un GrafoCompacto se recorre el CSR por ids enteros con un bytearray de visitados.
+    """
+    if isinstance(grafo, GrafoCompacto):
+        return _dfs_iterativa_csr(grafo, inicio)
+
+    visitado = set()         # Set para registrar nodos visitados
+    stack = [inicio]         # Stack inicializado con el nodo de inicio
+    orden_visita = []        # Lista para registrar el orden de visita
+
+    while stack:
+        nodo = stack.pop()   # Tomar el último nodo agregado
+        if nodo not in visitado:
+            visitado.add(nodo)
+            orden_visita.append(nodo)
+            # Añadir vecinos al stack (en orden inverso)
+            for vecino in reversed(grafo[nodo]):
+                if vecino not in visitado:
+                    stack.append(vecino)
+
+    return orden_visita
+
+
+def _dfs_iterativa_csr(grafo, inicio):
+    # Misma DFS que dfs_iterativa sobre desplazamientos/destinos; las etiquetas se traducen al final
+    desplazamientos, destinos = grafo.desplazamientos, grafo.destinos
+    visitado = bytearray(grafo.num_nodos)
+    stack = [grafo.id_de(inicio)]
+    orden_visita = []
+
+    while stack:
+        nodo = stack.pop()
+        if not visitado[nodo]:
+            visitado[nodo] = 1
+            orden_visita.append(nodo)
+            # Vecinos en orden inverso, recorriendo el segmento CSR de atrás hacia adelante
+            for e in range(desplazamientos[nodo + 1] - 1, desplazamientos[nodo] - 1, -1):
+                vecino = destinos[e]
+                if not visitado[vecino]:
+                    stack.append(vecino)
+
+    if grafo.etiquetas is None:
+        return orden_visita
+    return [grafo.etiqueta_de(v) for v in orden_visita]
+
+
+class _Visitados:
+    """Conjunto de nodos enteros 0..n-1 respaldado por un bytearray (1 byte por nodo)."""
+
+    def __init__(self, n):
+        self.marcas = bytearray(n)
+
+    def __contains__(self, nodo):
+        return self.marcas[nodo] == 1
+
+    def add(self, nodo):
+        self.marcas[nodo] = 1
+
+
+def dfs_perezosa(grafo, *inicios, eventos=False, num_nodos=None):
+    """
+    DFS como generador: entrega los nodos conforme se descubren, sin construir la lista completa.
+
+    Complejidad temporal:
+    O(V + E) si se consume completo; si el consumidor se detiene antes, sólo se paga
+    por la parte del grafo explorada hasta ese momento.
+
+    Complejidad espacial:
+    O(V): la pila guarda un marco (nodo, iterador de vecinos) por cada nodo del camino actual,
+    sin duplicados. El conjunto de visitados es un bytearray cuando los nodos son enteros
+    (num_nodos dado o grafo compacto de grafo_compacto) y un set en otro caso.
+
+    Explicación:
+    En vez de apilar todos los vecinos no visitados, cada marco conserva su iterador y se
+    avanza un vecino a la vez, igual que la recursión. Por eso el orden de descubrimiento es
+    exactamente el del DFS recursivo.
+
+    :param inicios: Uno o varios nodos de inicio; se recorre desde cada uno que siga sin visitar
+    :param eventos: Si es True, se generan tuplas ("pre", v) al descubrir v y ("post", v) al terminarlo
+    :param num_nodos: Si los nodos son enteros 0..n-1, usar un bytearray como conjunto de visitados
+    """
+    if isinstance(grafo, GrafoCompacto):
+        # Núcleo sobre ids enteros del CSR; se traducen etiquetas sólo al entregar
+        nombre = grafo.etiqueta_de
+        vecinos = grafo.vecinos_ids
+        inicios = [grafo.id_de(v) for v in inicios]
+        visitado = _Visitados(grafo.num_nodos)
+    else:
+        nombre = None
+        vecinos = grafo.__getitem__
+        visitado = _Visitados(num_nodos) if num_nodos is not None else set()
+
+    for inicio in inicios:
+        if inicio in visitado:
+            continue
+        visitado.add(inicio)
+        etiqueta = nombre(inicio) if nombre else inicio
+        yield ("pre", etiqueta) if eventos else etiqueta
+        pila = [(inicio, iter(vecinos(inicio)))]
+        while pila:
+            nodo, pendientes = pila[-1]
+            for vecino in pendientes:
+                if vecino not in visitado:
+                    visitado.add(vecino)
+                    etiqueta = nombre(vecino) if nombre else vecino
+                    yield ("pre", etiqueta) if eventos else etiqueta
+                    pila.append((vecino, iter(vecinos(vecino))))
+                    break
+            else:
+                pila.pop()
+                if eventos:
+                    yield "post", nombre(nodo) if nombre else nodo
+
+
+def buscar_dfs(grafo, objetivo, *inicios, num_nodos=None):
+    """
+    Busca con DFS el primer nodo alcanzable que cumpla el predicado 'objetivo' y se detiene ahí.
+    :return: El nodo encontrado, o None si ningún nodo alcanzable lo cumple
+    """
+    for nodo in dfs_perezosa(grafo, *inicios, num_nodos=num_nodos):
+        if objetivo(nodo):
+            return nodo
+    return None
+
+
+# Ejemplo de uso
+if __name__ == "__main__":
+    grafo = {
+        0: [1, 2],
+        1: [0, 3],
+        2: [0],
+        3: [1, 4],
+        4: [3]
+    }
+
+    print(dfs_iterativa(grafo, 0))  # Salida esperada: [0, 2, 1, 3, 4] (puede variar por el orden de vecinos)
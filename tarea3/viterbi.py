@@ -0,0 +1,328 @@
+from array import array
+from collections import defaultdict
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional: sin él la frontera de bits es un int de Python
+    np = None
+
+from .grafo_compacto import GrafoCompacto
+from .instrumentacion import sonda
+
+def viterbi_find_path(graph, start, sequence):
+    """
+    Algoritmo de Viterbi (versión determinista, parte A): encuentra un camino en un grafo dirigido
+    donde la concatenación de las etiquetas de las aristas sea exactamente igual a una secuencia dada.
+
+    Complejidad temporal:
+    - O(k * E), donde k es la longitud de la secuencia y E el número de aristas del grafo.
+      En cada paso i (para cada símbolo), se recorren todos los nodos alcanzables y sus transiciones.
+
+    Complejidad espacial:
+    - O(k * V), siendo V el número de nodos (vértices) del grafo.
+      Se guarda un diccionario dp que indica desde qué nodo se llegó a otro en cada paso.
+
+    Justificación:
+    - Se aplica programación dinámica para evitar recorrer caminos repetidos.
+    - La idea es simular, paso a paso, los símbolos de la secuencia,
+      registrando qué nodos son alcanzables en ese paso exacto y desde dónde.
+    - Al final, si se logra alcanzar algún nodo en el último paso (longitud de la secuencia),
+      se reconstruye el camino usando los "nodos padre" registrados en cada paso.
+    - Esta técnica evita recorrer caminos inválidos y permite resolver el problema en tiempo eficiente,
+      aún cuando el grafo es grande.
+    - Dentro de tarea3.instrumentacion.instrumentar() se registra la frontera de cada paso y el
+      tiempo de las fases "pasos" y "reconstruccion".
+    """
+    medicion = sonda("viterbi.viterbi_find_path")
+    paso = medicion.paso
+    medicion.fase("pasos")
+
+    n = len(sequence)
+    dp = defaultdict(dict)  # dp[i][v] = nodo padre desde el cual se llegó a v en paso i
+    dp[0][start] = None     # En el paso 0, solo se puede estar en el nodo inicial
+
+    # Por cada símbolo de la secuencia (paso i)
+    for i in range(n):
+        current_symbol = sequence[i]
+        paso(len(dp[i]))
+        for u in dp[i]:  # Por cada nodo alcanzado en el paso anterior
+            for v, sigma in graph.get(u, []):  # Por cada transición saliente desde u
+                if sigma == current_symbol:
+                    # Solo registramos v si aún no se había alcanzado en el paso i+1
+                    if v not in dp[i + 1]:
+                        dp[i + 1][v] = u  # Guardamos quién llevó a v en ese paso
+
+    # Si no se alcanzó ningún nodo al final de la secuencia, no hay solución
+    if not dp[n]:
+        medicion.terminar()
+        return "No path found"
+
+    # Reconstrucción del camino desde cualquier nodo final válido
+    medicion.fase("reconstruccion")
+    end = next(iter(dp[n]))  # Tomamos el primero que encontramos
+    path = [end]
+    for i in range(n, 0, -1):
+        end = dp[i][end]
+        path.append(end)
+
+    medicion.terminar()
+    return path[::-1]  # Invertimos para tener el camino de inicio a fin
+
+
+class AutomataEtiquetado:
+    """
+    Versión compilada del grafo etiquetado de viterbi_find_path para procesar secuencias largas.
+
+    Complejidad temporal:
+    - Compilación: O(V + E), una sola vez por grafo.
+    - Por consulta: O(k + M), donde M es el número de aristas que coinciden con el símbolo de
+      cada paso desde la frontera actual; ya no se revisan las aristas con otros símbolos.
+
+    Complejidad espacial:
+    - O(V + E) para el índice de transiciones.
+    - buscar_camino: O(sum |frontera_i|) en arreglos compactos (nodo, índice del padre) por paso.
+    - acepta: O(V); no se guarda ningún puntero hacia atrás.
+
+    Justificación:
+    - Las transiciones se indexan por símbolo y luego por nodo origen, de modo que en cada paso
+      sólo se consulta la tabla del símbolo actual para los nodos de la frontera.
+    - Los nodos y símbolos se internan como enteros; la frontera es una lista de ids y un
+      bytearray marca qué nodos ya entraron a la siguiente frontera (se limpia sólo lo marcado).
+      Con un GrafoCompacto se reutilizan sus ids y se leen las columnas destinos/simbolos_arista.
+    - La frontera se recorre en el mismo orden que viterbi_find_path y se conserva el primer padre
+      encontrado, así que buscar_camino devuelve exactamente el mismo camino.
+    - acepta_bits y buscar_camino_bits usan una frontera de bits (un bit por nodo), útil cuando
+      la frontera abarca buena parte del grafo:
+      * Con NumPy, cada símbolo se compila a arreglos (origen, destino) de sus aristas y un paso es
+        siguiente[destino[frontera[origen]]] = True: O(V + E_sigma) en código vectorizado.
+      * Sin NumPy, la frontera es un int de Python y cada símbolo guarda, por destino v, la máscara
+        de sus predecesores: v entra a la siguiente frontera si (mascara & frontera) != 0.
+        Cada paso cuesta O(D_sigma * V / 64) palabras (D_sigma: destinos del símbolo); conviene con
+        pocos nodos o grafos densos (con 1000 nodos y grado 64, unas 4 veces más rápido que acepta),
+        no con grafos grandes y dispersos.
+      * buscar_camino_bits guarda sólo la frontera de cada paso (V bits) y reconstruye los padres
+        hacia atrás; devuelve un camino válido, no necesariamente el mismo que viterbi_find_path.
+    """
+
+    def __init__(self, graph, usar_numpy=True):
+        self.usar_numpy = usar_numpy and np is not None
+        self._bits = {}  # s -> (origen, destino) con NumPy, o {v: máscara de predecesores} sin él
+        self.nodos = []
+        self._ids = {}
+        self._simbolos = {}
+        self._por_simbolo = []  # _por_simbolo[s] = {u: (v1, v2, ...)} en el orden original
+
+        def nodo_id(v):
+            i = self._ids.get(v)
+            if i is None:
+                i = self._ids[v] = len(self.nodos)
+                self.nodos.append(v)
+            return i
+
+        por_simbolo = []
+        if isinstance(graph, GrafoCompacto):
+            self.nodos = list(graph)
+            self._ids = {v: i for i, v in enumerate(self.nodos)}
+            simbolos = graph.simbolos or ()  # None en un grafo sin aristas
+            self._simbolos = {sigma: s for s, sigma in enumerate(simbolos)}
+            por_simbolo = [defaultdict(list) for _ in simbolos]
+            d, destinos, sims = graph.desplazamientos, graph.destinos, graph.simbolos_arista
+            for u in range(graph.num_nodos):
+                for e in range(d[u], d[u + 1]):
+                    por_simbolo[sims[e]][u].append(destinos[e])
+        else:
+            for u, aristas in graph.items():
+                iu = nodo_id(u)
+                for v, sigma in aristas:
+                    s = self._simbolos.get(sigma)
+                    if s is None:
+                        s = self._simbolos[sigma] = len(por_simbolo)
+                        por_simbolo.append(defaultdict(list))
+                    por_simbolo[s][iu].append(nodo_id(v))
+        self._por_simbolo = [{u: tuple(vs) for u, vs in tabla.items()} for tabla in por_simbolo]
+        self._marcas = bytearray(len(self.nodos))
+
+    def _tablas(self, sequence):
+        # Tabla de transiciones de cada símbolo; None si el símbolo no aparece en el grafo
+        for sigma in sequence:
+            s = self._simbolos.get(sigma)
+            yield None if s is None else self._por_simbolo[s]
+
+    def acepta(self, start, sequence):
+        """
+        Indica si existe algún camino desde start cuya secuencia de etiquetas sea sequence,
+        sin guardar punteros hacia atrás.
+        """
+        inicio = self._ids.get(start)
+        if inicio is None:
+            return len(sequence) == 0  # Nodo sin transiciones salientes
+
+        marcas = self._marcas
+        frontera = [inicio]
+        for tabla in self._tablas(sequence):
+            if tabla is None:
+                return False
+            siguiente = []
+            for u in frontera:
+                for v in tabla.get(u, ()):
+                    if not marcas[v]:
+                        marcas[v] = 1
+                        siguiente.append(v)
+            for v in siguiente:
+                marcas[v] = 0
+            if not siguiente:
+                return False
+            frontera = siguiente
+        return True
+
+    def buscar_camino(self, start, sequence):
+        """
+        Mismo contrato que viterbi_find_path(graph, start, sequence): el camino como lista de
+        nodos, o "No path found".
+        """
+        medicion = sonda("viterbi.AutomataEtiquetado.buscar_camino")
+        paso = medicion.paso
+        inicio = self._ids.get(start)
+        if inicio is None:
+            medicion.terminar()
+            return [start] if len(sequence) == 0 else "No path found"
+
+        marcas = self._marcas
+        frontera = array("q", [inicio])
+        pasos = []  # Por paso: (nodos, índice del padre en la frontera anterior)
+        for tabla in self._tablas(sequence):
+            paso(len(frontera))
+            if tabla is None:
+                medicion.terminar()
+                return "No path found"
+            siguiente, padres = array("q"), array("q")
+            for indice, u in enumerate(frontera):
+                for v in tabla.get(u, ()):
+                    if not marcas[v]:
+                        marcas[v] = 1
+                        siguiente.append(v)
+                        padres.append(indice)
+            for v in siguiente:
+                marcas[v] = 0
+            if not siguiente:
+                medicion.terminar()
+                return "No path found"
+            pasos.append((siguiente, padres))
+            frontera = siguiente
+
+        # Reconstrucción desde el primer nodo de la última frontera
+        path = []
+        indice = 0
+        for nodos, padres in reversed(pasos):
+            path.append(self.nodos[nodos[indice]])
+            indice = padres[indice]
+        path.append(start)
+        medicion.terminar()
+        return path[::-1]
+
+    def _tabla_bits(self, sigma):
+        # Compilación perezosa, por símbolo, de la representación de bits; None si no aparece
+        s = self._simbolos.get(sigma)
+        if s is None:
+            return None
+        tabla = self._bits.get(s)
+        if tabla is None:
+            if self.usar_numpy:
+                pares = [(u, v) for u, vs in self._por_simbolo[s].items() for v in vs]
+                tabla = (np.array([u for u, _ in pares], dtype=np.int64),
+                         np.array([v for _, v in pares], dtype=np.int64))
+            else:
+                tabla = defaultdict(int)
+                for u, vs in self._por_simbolo[s].items():
+                    for v in vs:
+                        tabla[v] |= 1 << u
+                tabla = dict(tabla)
+            self._bits[s] = tabla
+        return tabla
+
+    def _pasos_bits(self, inicio, sequence, guardar):
+        # Avanza la frontera de bits; devuelve (frontera final o None, fronteras previas a cada paso)
+        n = len(self.nodos)
+        if self.usar_numpy:
+            frontera = np.zeros(n, dtype=bool)
+            frontera[inicio] = True
+        else:
+            frontera = 1 << inicio
+        guardadas = []
+        for sigma in sequence:
+            tabla = self._tabla_bits(sigma)
+            if tabla is None:
+                return None, guardadas
+            if guardar:
+                guardadas.append(np.packbits(frontera) if self.usar_numpy else frontera)
+            if self.usar_numpy:
+                origen, destino = tabla
+                siguiente = np.zeros(n, dtype=bool)
+                siguiente[destino[frontera[origen]]] = True
+                if not siguiente.any():
+                    return None, guardadas
+            else:
+                siguiente = 0
+                for v, predecesores in tabla.items():
+                    if predecesores & frontera:
+                        siguiente |= 1 << v
+                if not siguiente:
+                    return None, guardadas
+            frontera = siguiente
+        return frontera, guardadas
+
+    def acepta_bits(self, start, sequence):
+        """Mismo contrato que acepta, con la frontera como conjunto de bits."""
+        inicio = self._ids.get(start)
+        if inicio is None:
+            return len(sequence) == 0
+        frontera, _ = self._pasos_bits(inicio, sequence, guardar=False)
+        return frontera is not None
+
+    def buscar_camino_bits(self, start, sequence):
+        """
+        Un camino cuyas etiquetas son sequence (o "No path found"), con la frontera como conjunto
+        de bits; memoria O(k * V / 8) bytes para las fronteras guardadas.
+        """
+        inicio = self._ids.get(start)
+        if inicio is None:
+            return [start] if len(sequence) == 0 else "No path found"
+        frontera, guardadas = self._pasos_bits(inicio, sequence, guardar=True)
+        if frontera is None:
+            return "No path found"
+
+        # Se parte del nodo de menor id en la última frontera y se busca hacia atrás un predecesor
+        # que estuviera en la frontera anterior
+        n = len(self.nodos)
+        if self.usar_numpy:
+            v = int(np.flatnonzero(frontera)[0])
+        else:
+            v = (frontera & -frontera).bit_length() - 1
+        path = [v]
+        for sigma, previa in zip(reversed(sequence), reversed(guardadas)):
+            tabla = self._tabla_bits(sigma)
+            if self.usar_numpy:
+                origen, destino = tabla
+                previa = np.unpackbits(previa, count=n).view(bool)
+                v = int(origen[np.argmax((destino == v) & previa[origen])])
+            else:
+                candidatos = tabla[v] & previa
+                v = (candidatos & -candidatos).bit_length() - 1
+            path.append(v)
+        return [self.nodos[u] for u in reversed(path)]
+
+
+# Ejemplo de uso con grafo dirigido
+if __name__ == "__main__":
+    graph_a = {
+        'A': [('B', 'a'), ('C', 'b')],
+        'B': [('D', 'b')],
+        'C': [('D', 'a')],
+        'D': []
+    }
+
+    # Buscar camino que siga la secuencia ['a', 'b']
+    print(viterbi_find_path(graph_a, 'A', ['a', 'b']))  # Resultado esperado: ['A', 'B', 'D']
+
+    automata = AutomataEtiquetado(graph_a)
+    print(automata.acepta_bits('A', ['a', 'b']), automata.buscar_camino_bits('A', ['b', 'a']))
@@ -0,0 +1,643 @@
+import heapq
+import math
+import random
+import time
+from collections import defaultdict
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional: sin él se usa el índice por símbolo en Python puro
+    np = None
+
+from .grafo_compacto import GrafoCompacto
+from .instrumentacion import sonda
+
+def viterbi_max_path(graph, start, sequence):
+    """
+    Algoritmo de Viterbi (versión probabilística, parte B): encuentra el camino más probable
+    en un grafo dirigido donde la secuencia de sonidos (etiquetas) debe coincidir exactamente con una dada.
+
+    Complejidad temporal:
+    - O(k * E), donde k es la longitud de la secuencia y E el número de aristas.
+      Se procesan todas las aristas desde los nodos alcanzables en cada paso.
+
+    Complejidad espacial:
+    - O(k * V), donde V es el número de nodos. Se guarda la mejor probabilidad para cada nodo en cada paso.
+
+    Justificación:
+    - El algoritmo busca no solo un camino válido, sino el más probable.
+    - Para cada paso i, se guarda en dp[i][v] la mejor probabilidad acumulada (en logaritmo) para llegar al nodo v.
+    - Las probabilidades se manejan en logaritmo para evitar errores por precisión o subdesbordamiento con números muy pequeños.
+    - En cada transición compatible con el símbolo actual, se acumula la probabilidad y se actualiza el camino si mejora.
+    - Al final se elige el nodo final con mayor probabilidad y se reconstruye el camino desde los nodos padre almacenados.
+    - Dentro de tarea3.instrumentacion.instrumentar() se registra la frontera de cada paso y el
+      tiempo de las fases "pasos" y "reconstruccion".
+    """
+    medicion = sonda("viterbi_b.viterbi_max_path")
+    paso = medicion.paso
+    medicion.fase("pasos")
+
+    n = len(sequence)
+    dp = defaultdict(dict)  # dp[i][v] = (log(probabilidad acumulada), nodo padre)
+    dp[0][start] = (0.0, None)  # log(1) = 0: empezamos con probabilidad 1 en el nodo inicial
+
+    # Procesamos cada símbolo de la secuencia
+    for i in range(n):
+        current_symbol = sequence[i]
+        paso(len(dp[i]))
+        for u in dp[i]:  # Para cada nodo alcanzado en el paso anterior
+            curr_log_prob, _ = dp[i][u]
+            for v, sigma, prob in graph.get(u, []):  # Transiciones desde u
+                if sigma == current_symbol:
+                    # Acumulamos la probabilidad usando logaritmos
+                    new_log_prob = curr_log_prob + math.log(prob)
+                    # Si es mejor que la anterior, actualizamos
+                    if v not in dp[i + 1] or new_log_prob > dp[i + 1][v][0]:
+                        dp[i + 1][v] = (new_log_prob, u)
+
+    # Si no hay nodos alcanzados al final, no hay solución
+    if not dp[n]:
+        medicion.terminar()
+        return "No path found"
+
+    # Elegimos el nodo final con mayor probabilidad acumulada
+    medicion.fase("reconstruccion")
+    end = max(dp[n], key=lambda x: dp[n][x][0])
+    path = [end]
+
+    # Reconstrucción del camino óptimo desde los nodos padre
+    for i in range(n, 0, -1):
+        end = dp[i][end][1]
+        path.append(end)
+
+    medicion.terminar()
+    return path[::-1]  # Invertimos el camino para devolverlo de inicio a fin
+
+
+def _paso_viterbi(graph, actual, sigma):
+    # Un paso de viterbi_max_path: {v: log_prob} y {v: padre} a partir de {u: log_prob}
+    siguiente, padre = {}, {}
+    for u, curr_log_prob in actual.items():
+        for v, simbolo, prob in graph.get(u, []):
+            if simbolo == sigma:
+                new_log_prob = curr_log_prob + math.log(prob)
+                if v not in siguiente or new_log_prob > siguiente[v]:
+                    siguiente[v] = new_log_prob
+                    padre[v] = u
+    return siguiente, padre
+
+
+def viterbi_max_path_checkpoints(graph, start, sequence):
+    """
+    Mismo resultado que viterbi_max_path, guardando sólo O(sqrt(k)) puntos de control.
+
+    Complejidad temporal:
+    - O(k * E): una pasada hacia adelante y otra para recalcular cada segmento (a lo más el doble).
+
+    Complejidad espacial:
+    - O(sqrt(k) * V): los puntos de control cada sqrt(k) pasos, más los padres de un solo
+      segmento de sqrt(k) pasos mientras se reconstruye.
+
+    Justificación:
+    - La pasada hacia adelante sólo conserva las probabilidades de la frontera en los pasos
+      múltiplos de c = ceil(sqrt(k)), en lugar de los padres de todos los pasos.
+    - La reconstrucción recorre los segmentos del último al primero: recalcula el segmento desde
+      su punto de control (ahora sí guardando padres) y retrocede el nodo actual hasta su inicio.
+    - Los pasos son deterministas (mismo orden de nodos y aristas), así que el camino es idéntico.
+    """
+    n = len(sequence)
+    c = max(1, math.isqrt(n - 1) + 1) if n else 1
+    actual = {start: 0.0}
+    puntos = [actual]  # puntos[j] = frontera en el paso j * c
+
+    for i in range(n):
+        actual, _ = _paso_viterbi(graph, actual, sequence[i])
+        if not actual:
+            return "No path found"
+        if (i + 1) % c == 0 and i + 1 < n:
+            puntos.append(actual)
+
+    end = max(actual, key=actual.get)
+    path = [end]
+    for j in range(len(puntos) - 1, -1, -1):
+        # Recalcular el segmento [j * c, min((j + 1) * c, n)) guardando sus padres
+        frontera = puntos[j]
+        padres = []
+        for i in range(j * c, min((j + 1) * c, n)):
+            frontera, padre = _paso_viterbi(graph, frontera, sequence[i])
+            padres.append(padre)
+        for padre in reversed(padres):
+            end = padre[end]
+            path.append(end)
+
+    return path[::-1]
+
+
+def viterbi_en_linea(graph, start, simbolos, retraso_max=None):
+    """
+    Viterbi en línea: consume los símbolos de un iterador y genera trozos del camino en cuanto
+    quedan fijos.
+
+    Complejidad temporal:
+    - O(k * E) para los pasos, más la búsqueda del ancestro común de la frontera en cada paso,
+      que recorre la ventana aún no confirmada.
+
+    Complejidad espacial:
+    - O(L * V), con L el largo de la ventana no confirmada (a lo más retraso_max si se indica).
+
+    Justificación:
+    - Si todos los estados vivos de la frontera descienden del mismo nodo en el paso j, cualquier
+      camino final pasa por ese nodo, así que el prefijo hasta j ya es el del decodificador fuera
+      de línea y se puede emitir y descartar sus padres.
+    - Con retraso_max, si la ventana excede ese largo se confirma el prefijo del estado más
+      probable y se descartan los estados incompatibles; el resultado deja de ser exacto
+      a cambio de memoria acotada.
+
+    :param simbolos: Iterable de símbolos (puede ser infinito o muy largo)
+    :return: Generador de listas de nodos; concatenadas forman el camino completo
+    :raises ValueError: "No path found" si la secuencia no tiene camino (los trozos ya emitidos
+                        dejan de ser válidos)
+    """
+    yield [start]
+    actual = {start: 0.0}
+    padres = []  # padres[j] = {nodo: padre} del paso confirmado + 1 + j
+
+    def confirmar(hasta, nodo):
+        # Emite los nodos de los pasos confirmados + 1 .. confirmados + hasta, terminando en nodo
+        trozo = [nodo]
+        for padre in reversed(padres[1:hasta]):
+            nodo = padre[nodo]
+            trozo.append(nodo)
+        del padres[:hasta]
+        return trozo[::-1]
+
+    for sigma in simbolos:
+        actual, padre = _paso_viterbi(graph, actual, sigma)
+        if not actual:
+            raise ValueError("No path found")
+        padres.append(padre)
+
+        # Buscar el paso más reciente donde toda la frontera tiene un único ancestro
+        vivos = set(actual)
+        for j in range(len(padres), 0, -1):
+            if len(vivos) == 1:
+                yield confirmar(j, next(iter(vivos)))
+                break
+            vivos = {padres[j - 1][v] for v in vivos}
+
+        if retraso_max is not None and len(padres) > retraso_max:
+            # Forzar la decisión con el estado más probable y podar los incompatibles
+            hasta = len(padres) - retraso_max
+            mejor = max(actual, key=actual.get)
+            ancestro = {v: v for v in actual}
+            for padre in reversed(padres[hasta:]):
+                ancestro = {v: padre[a] for v, a in ancestro.items()}
+            elegido = ancestro[mejor]
+            actual = {v: lp for v, lp in actual.items() if ancestro[v] == elegido}
+            yield confirmar(hasta, elegido)
+
+    if padres:
+        yield confirmar(len(padres), max(actual, key=actual.get))
+
+
+class EstadisticasPoda:
+    """
+    Contadores acumulados de viterbi_max_path_beam, para comparar precisión contra latencia.
+    - conservados / podados: estados que sobrevivieron o se descartaron, sumados sobre los pasos.
+    - validaciones / perdidas: corridas con validación en sombra y cuántas de ellas no
+      encontraron el mismo camino que el decodificador exacto.
+    """
+
+    def __init__(self):
+        self.pasos = 0
+        self.conservados = 0
+        self.podados = 0
+        self.validaciones = 0
+        self.perdidas = 0
+
+    @property
+    def fraccion_podada(self):
+        total = self.conservados + self.podados
+        return self.podados / total if total else 0.0
+
+    @property
+    def tasa_perdida(self):
+        return self.perdidas / self.validaciones if self.validaciones else 0.0
+
+    def __repr__(self):
+        return (f"EstadisticasPoda(pasos={self.pasos}, conservados={self.conservados}, "
+                f"podados={self.podados}, validaciones={self.validaciones}, perdidas={self.perdidas})")
+
+
+def viterbi_max_path_beam(graph, start, sequence, ancho=None, umbral=None,
+                          estadisticas=None, validar=False):
+    """
+    Viterbi con poda por haz: en cada paso sólo se expanden los estados más prometedores.
+
+    Complejidad temporal:
+    - O(k * (B * d + V' log V')), con B el ancho del haz, d el grado de salida y V' los estados
+      generados en el paso (que se ordenan para elegir los B mejores).
+
+    Complejidad espacial:
+    - O(k * B) para los padres de los estados conservados.
+
+    Justificación:
+    - La mayoría de las hipótesis tienen probabilidad despreciable; se conservan sólo los
+      'ancho' estados más probables y/o los que están a menos de 'umbral' (en log) del mejor.
+    - Con validar=True se corre además viterbi_max_path y se cuenta en estadisticas si la poda
+      perdió el camino exacto (corrida en sombra).
+    - Sin ancho ni umbral el resultado es idéntico a viterbi_max_path.
+
+    :param ancho: Número máximo de estados conservados por paso (>= 1, opcional)
+    :param umbral: Distancia máxima en log al mejor estado del paso (>= 0, opcional)
+    :param estadisticas: EstadisticasPoda donde acumular los contadores (opcional)
+    :return: Mismo contrato que viterbi_max_path
+    """
+    if ancho is not None and ancho < 1:
+        raise ValueError("ancho debe ser al menos 1")
+    if umbral is not None and umbral < 0:
+        raise ValueError("umbral debe ser no negativo")
+    medicion = sonda("viterbi_b.viterbi_max_path_beam")
+    paso = medicion.paso
+    actual = {start: 0.0}
+    padres = []
+    for sigma in sequence:
+        paso(len(actual))
+        actual, padre = _paso_viterbi(graph, actual, sigma)
+        if not actual:
+            resultado = "No path found"
+            break
+        generados = len(actual)
+        if umbral is not None:
+            mejor = max(actual.values())
+            actual = {v: lp for v, lp in actual.items() if lp >= mejor - umbral}
+        if ancho is not None and len(actual) > ancho:
+            conservar = set(heapq.nlargest(ancho, actual, key=actual.get))
+            actual = {v: lp for v, lp in actual.items() if v in conservar}
+        if len(actual) < generados:
+            padre = {v: padre[v] for v in actual}  # Sólo se guardan los padres de los conservados
+        if estadisticas is not None:
+            estadisticas.pasos += 1
+            estadisticas.conservados += len(actual)
+            estadisticas.podados += generados - len(actual)
+        padres.append(padre)
+    else:
+        end = max(actual, key=actual.get)
+        resultado = [end]
+        for padre in reversed(padres):
+            end = padre[end]
+            resultado.append(end)
+        resultado.reverse()
+
+    if validar and estadisticas is not None:
+        estadisticas.validaciones += 1
+        if viterbi_max_path(graph, start, sequence) != resultado:
+            estadisticas.perdidas += 1
+    medicion.terminar()
+    return resultado
+
+
+def viterbi_k_mejores(graph, start, sequence, k):
+    """
+    Devuelve los k caminos más probables que generan exactamente la secuencia (Viterbi de listas).
+
+    Complejidad temporal:
+    - O(n * E * k log k), con n la longitud de la secuencia: cada arista propaga hasta k hipótesis.
+
+    Complejidad espacial:
+    - O(n * V * k) para los punteros (nodo padre, rango del padre) de cada hipótesis.
+
+    Justificación:
+    - Cada nodo guarda en cada paso sus k mejores hipótesis (log_prob, padre, rango en el padre).
+      Toda hipótesis entre las k mejores de v en el paso i+1 extiende a una de las k mejores de
+      algún u en el paso i, así que basta propagar k por nodo.
+    - Al final se mezclan las listas de todos los nodos y se reconstruyen los k primeros caminos.
+    - Aristas paralelas con el mismo símbolo cuentan como caminos distintos aunque visiten los
+      mismos nodos.
+
+    :return: Lista de tuplas (log_prob, camino) de mayor a menor probabilidad; vacía si no hay camino
+    """
+    actual = {start: [(0.0, None, None)]}  # nodo -> [(log_prob, padre, rango del padre), ...]
+    pasos = []
+    for sigma in sequence:
+        candidatos = defaultdict(list)
+        for u, hipotesis in actual.items():
+            for v, simbolo, prob in graph.get(u, []):
+                if simbolo == sigma:
+                    lp = math.log(prob)
+                    for rango, (lp_u, _, _) in enumerate(hipotesis):
+                        candidatos[v].append((lp_u + lp, u, rango))
+        if not candidatos:
+            return []
+        actual = {v: heapq.nlargest(k, lista, key=lambda h: h[0]) for v, lista in candidatos.items()}
+        pasos.append(actual)
+
+    finales = heapq.nlargest(k, ((h[0], v, rango) for v, lista in actual.items()
+                                 for rango, h in enumerate(lista)), key=lambda h: h[0])
+    resultados = []
+    for log_prob, nodo, rango in finales:
+        camino = [nodo]
+        for paso in reversed(pasos):
+            _, nodo, rango = paso[nodo][rango]
+            camino.append(nodo)
+        resultados.append((log_prob, camino[::-1]))
+    return resultados
+
+
+def viterbi_por_tablas(inicio, tablas, paso=None):
+    """
+    Núcleo de Viterbi sobre ids enteros, común a ModeloViterbi y a decodificacion_corpus.
+
+    Complejidad temporal:
+    - O(sum_i M_i) más el costo de las búsquedas en las tablas, con M_i las aristas del símbolo
+      del paso i que salen de la frontera; nunca se revisan aristas con otros símbolos.
+
+    Complejidad espacial:
+    - O(sum_i |frontera_i|) para los padres de cada paso.
+
+    Justificación:
+    - tablas entrega, por paso, la tabla de transiciones de su símbolo: tabla.get(u, ()) da los
+      pares (v, log_prob) que salen de u en el orden original de las aristas.
+    - Igual que viterbi_max_path, se conserva el primer padre que alcanza el máximo y el nodo
+      final es el primero con el mejor puntaje. Con log_prob = 0 en todas las aristas esto
+      reproduce viterbi_find_path: primer padre encontrado y primer nodo de la última frontera.
+
+    :param paso: Función opcional que recibe el tamaño de la frontera de cada paso
+    :return: Lista de ids del camino, o None si no hay camino
+    """
+    actual = {inicio: 0.0}
+    padres = []
+    for tabla in tablas:
+        if paso is not None:
+            paso(len(actual))
+        siguiente, padre = {}, {}
+        for u, lp_u in actual.items():
+            for v, lp in tabla.get(u, ()):
+                nuevo = lp_u + lp
+                if v not in siguiente or nuevo > siguiente[v]:
+                    siguiente[v] = nuevo
+                    padre[v] = u
+        if not siguiente:
+            return None
+        padres.append(padre)
+        actual = siguiente
+
+    end = max(actual, key=actual.get)
+    path = [end]
+    for padre in reversed(padres):
+        end = padre[end]
+        path.append(end)
+    path.reverse()
+    return path
+
+
+class ModeloViterbi:
+    """
+    Modelo compilado del grafo probabilístico de viterbi_max_path para decodificar muchas secuencias.
+
+    Complejidad temporal:
+    - Compilación: O(V + E log E), una sola vez; los logaritmos se calculan aquí y no en cada paso.
+    - Decodificación: O(k * E_sigma) por secuencia, con E_sigma las aristas del símbolo de cada paso.
+      Con NumPy cada paso es una actualización max-plus vectorizada sobre todas las secuencias del
+      lote que leen el mismo símbolo, más O(B * V) una sola vez por lote para crear los puntajes.
+
+    Complejidad espacial:
+    - O(B * V) para las probabilidades del lote actual (B secuencias).
+    - O(k * B * D_sigma) para los punteros al padre, con D_sigma los destinos distintos del símbolo.
+
+    Justificación:
+    - Para cada símbolo se guarda su matriz de transición en log como CSR por destino
+      (arreglos origen, log_prob ordenados por destino y el inicio de cada destino), así:
+      nuevo[v] = max_u (actual[u] + log P(u -> v)) es un maximum.reduceat por segmento.
+    - El padre de cada destino es la primera arista del segmento que alcanza el máximo
+      (minimum.reduceat sobre los índices de las aristas empatadas).
+    - Los puntajes usan dos matrices que se alternan; en cada paso sólo se escriben las columnas
+      destino del símbolo y se limpian las que se escribieron dos pasos antes, así un paso no
+      recorre las V columnas de cada secuencia.
+    - Con un GrafoCompacto se reutilizan sus ids y se leen las columnas destinos, simbolos_arista
+      y pesos, sin pasar por graph[u].
+    - Sin NumPy se usa el mismo índice por símbolo con listas de Python, que reproduce exactamente
+      el orden de desempate de viterbi_max_path. Con NumPy los resultados coinciden salvo empates
+      exactos entre caminos, que se resuelven por el orden de los nodos en el grafo.
+    """
+
+    def __init__(self, graph, usar_numpy=True):
+        self.nodos = []
+        self._ids = {}
+        self._simbolos = {}
+        aristas = []  # aristas[s] = lista de (u, v, log_prob) en el orden original
+
+        def nodo_id(v):
+            i = self._ids.get(v)
+            if i is None:
+                i = self._ids[v] = len(self.nodos)
+                self.nodos.append(v)
+            return i
+
+        if isinstance(graph, GrafoCompacto):
+            self.nodos = list(graph)
+            self._ids = {v: i for i, v in enumerate(self.nodos)}
+            simbolos = graph.simbolos or ()  # None en un grafo sin aristas
+            self._simbolos = {sigma: s for s, sigma in enumerate(simbolos)}
+            aristas = [[] for _ in simbolos]
+            d, destinos, sims, pesos = graph.desplazamientos, graph.destinos, graph.simbolos_arista, graph.pesos
+            for u in range(graph.num_nodos):
+                for e in range(d[u], d[u + 1]):
+                    aristas[sims[e]].append((u, destinos[e], math.log(pesos[e])))
+        else:
+            for u, salientes in graph.items():
+                iu = nodo_id(u)
+                for v, sigma, prob in salientes:
+                    s = self._simbolos.get(sigma)
+                    if s is None:
+                        s = self._simbolos[sigma] = len(aristas)
+                        aristas.append([])
+                    aristas[s].append((iu, nodo_id(v), math.log(prob)))
+
+        self.usar_numpy = usar_numpy and np is not None
+        if self.usar_numpy:
+            self._csr = [self._compilar_csr(lista) for lista in aristas]
+        else:
+            # Índice por símbolo y luego por origen: {u: [(v, log_prob), ...]}
+            self._indice = []
+            for lista in aristas:
+                tabla = defaultdict(list)
+                for u, v, lp in lista:
+                    tabla[u].append((v, lp))
+                self._indice.append(dict(tabla))
+
+    @staticmethod
+    def _compilar_csr(lista):
+        origen = np.array([a[0] for a in lista], dtype=np.int64)
+        destino = np.array([a[1] for a in lista], dtype=np.int64)
+        log_prob = np.array([a[2] for a in lista], dtype=float)
+        orden = np.argsort(destino, kind="stable")
+        destino = destino[orden]
+        destinos, inicios = np.unique(destino, return_index=True)
+        return origen[orden], log_prob[orden], destinos, inicios
+
+    def decodificar(self, start, sequence):
+        """Mismo contrato que viterbi_max_path(graph, start, sequence)."""
+        return self.decodificar_lote(start, [sequence])[0]
+
+    def decodificar_lote(self, start, secuencias, relleno=None):
+        """
+        Decodifica muchas secuencias desde el mismo nodo inicial en una sola llamada.
+        :param secuencias: Lista de secuencias de distinta longitud, o una matriz rellenada
+        :param relleno: Valor de relleno; cada fila se corta en su primera aparición
+        :return: Lista con el camino más probable (o "No path found") de cada secuencia
+        """
+        medicion = sonda("viterbi_b.ModeloViterbi.decodificar_lote")
+        medicion.fase("preparar")
+        filas = []
+        for fila in secuencias:
+            fila = list(fila)
+            if relleno is not None and relleno in fila:
+                fila = fila[:fila.index(relleno)]
+            filas.append(fila)
+
+        medicion.fase("decodificar")
+        if start not in self._ids:
+            resultados = [[start] if not fila else "No path found" for fila in filas]
+        elif self.usar_numpy:
+            resultados = self._lote_numpy(self._ids[start], filas)
+        else:
+            # Sin NumPy se registra la frontera de cada paso, una secuencia tras otra
+            resultados = [self._decodificar_python(self._ids[start], fila, medicion.paso) for fila in filas]
+        medicion.terminar()
+        return resultados
+
+    def _decodificar_python(self, inicio, fila, paso):
+        # Mismo recorrido que viterbi_max_path, pero sólo sobre las aristas del símbolo del paso
+        tablas = (self._indice[s] if s is not None else {} for s in map(self._simbolos.get, fila))
+        path = viterbi_por_tablas(inicio, tablas, paso)
+        return "No path found" if path is None else [self.nodos[v] for v in path]
+
+    def _lote_numpy(self, inicio, filas):
+        b, v = len(filas), len(self.nodos)
+        longitudes = np.array([len(f) for f in filas], dtype=np.int64)
+        simbolos = [[self._simbolos.get(sigma, -1) for sigma in f] for f in filas]
+        puntaje, nuevo = np.full((b, v), -np.inf), np.full((b, v), -np.inf)
+        puntaje[:, inicio] = 0.0
+        # Celdas finitas de cada matriz, como pares (filas, columnas) escritos en su último uso
+        escritas, escritas_nuevo = [(np.arange(b), np.array([inicio]))], []
+        finales = [None] * b  # Nodo final de cada secuencia no vacía, o None si no hay camino
+
+        pasos = []  # Por paso: (grupo[b], posición en el grupo[b], {s: padres del grupo})
+        for t in range(int(longitudes.max(initial=0))):
+            activas = np.nonzero(longitudes > t)[0]
+            simbolo_t = np.array([simbolos[i][t] for i in activas], dtype=np.int64)
+            grupo = np.full(b, -1, dtype=np.int64)
+            posicion = np.zeros(b, dtype=np.int64)
+            padres_t = {}
+            for filas_s, columnas in escritas_nuevo:
+                nuevo[np.ix_(filas_s, columnas)] = -np.inf
+            escritas_nuevo = []
+
+            for s in np.unique(simbolo_t):
+                filas_s = activas[simbolo_t == s]
+                if s < 0 or not len(self._csr[s][0]):
+                    continue  # Símbolo ausente del grafo: esas filas quedan sin estados
+                origen, log_prob, destinos, inicios = self._csr[s]
+                candidato = puntaje[filas_s][:, origen] + log_prob
+                mejor = np.maximum.reduceat(candidato, inicios, axis=1)
+                # Primer arista del segmento que alcanza el máximo
+                tamanos = np.diff(np.append(inicios, len(origen)))
+                empate = candidato == np.repeat(mejor, tamanos, axis=1)
+                indices = np.where(empate, np.arange(len(origen)), len(origen))
+                primera = np.minimum.reduceat(indices, inicios, axis=1)
+
+                nuevo[np.ix_(filas_s, destinos)] = mejor
+                escritas_nuevo.append((filas_s, destinos))
+                grupo[filas_s] = s
+                posicion[filas_s] = np.arange(len(filas_s))
+                padres_t[int(s)] = origen[primera]
+                # Las secuencias que terminan en este paso eligen su mejor destino (el de menor id)
+                for j in np.nonzero(longitudes[filas_s] == t + 1)[0]:
+                    if mejor[j].max() > -np.inf:
+                        finales[filas_s[j]] = int(destinos[np.argmax(mejor[j])])
+            pasos.append((grupo, posicion, padres_t))
+            puntaje, nuevo = nuevo, puntaje
+            escritas, escritas_nuevo = escritas_nuevo, escritas
+
+        resultados = []
+        for i, fila in enumerate(filas):
+            if not fila:
+                resultados.append([self.nodos[inicio]])
+                continue
+            if finales[i] is None:
+                resultados.append("No path found")
+                continue
+            end = finales[i]
+            path = [end]
+            for t in range(len(fila) - 1, -1, -1):
+                grupo, posicion, padres_t = pasos[t]
+                s = int(grupo[i])
+                destinos = self._csr[s][2]
+                end = int(padres_t[s][posicion[i], np.searchsorted(destinos, end)])
+                path.append(end)
+            resultados.append([self.nodos[u] for u in reversed(path)])
+        return resultados
+
+
+def grafo_probabilistico_aleatorio(n, grado, alfabeto, semilla=0):
+    """
+    Genera un grafo etiquetado aleatorio {u: [(v, sigma, prob), ...]} con n nodos enteros,
+    'grado' aristas salientes por nodo y un alfabeto de 'alfabeto' símbolos.
+    """
+    rng = random.Random(semilla)
+    return {u: [(rng.randrange(n), rng.randrange(alfabeto), rng.uniform(0.05, 1.0))
+                for _ in range(grado)] for u in range(n)}
+
+
+def secuencias_aleatorias(graph, start, cantidad, longitud, semilla=0):
+    """Secuencias generadas caminando al azar por el grafo, para que tengan solución."""
+    rng = random.Random(semilla)
+    secuencias = []
+    for _ in range(cantidad):
+        u, secuencia = start, []
+        for _ in range(longitud):
+            if not graph.get(u):
+                break
+            u, sigma, _ = rng.choice(graph[u])
+            secuencia.append(sigma)
+        secuencias.append(secuencia)
+    return secuencias
+
+
+def comparar_rendimiento(n=1000, grado=8, alfabeto=4, cantidad=16, longitud=100, semilla=0):
+    """
+    Compara viterbi_max_path (una llamada por secuencia) contra ModeloViterbi.decodificar_lote.
+    :return: Diccionario con los segundos de cada uno, la aceleración y si los caminos coinciden
+    """
+    graph = grafo_probabilistico_aleatorio(n, grado, alfabeto, semilla)
+    secuencias = secuencias_aleatorias(graph, 0, cantidad, longitud, semilla)
+
+    t0 = time.perf_counter()
+    esperados = [viterbi_max_path(graph, 0, s) for s in secuencias]
+    original = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    modelo = ModeloViterbi(graph)
+    obtenidos = modelo.decodificar_lote(0, secuencias)
+    compilado = time.perf_counter() - t0
+
+    return {
+        "original": original,
+        "compilado": compilado,
+        "aceleracion": original / compilado if compilado else math.inf,
+        "coinciden": esperados == obtenidos,
+    }
+
+
+# Ejemplo de uso
+if __name__ == "__main__":
+    graph_b = {
+        'A': [('B', 'a', 0.5), ('C', 'b', 0.5)],
+        'B': [('D', 'b', 0.6)],
+        'C': [('D', 'a', 0.9)],
+        'D': []
+    }
+
+    # Buscar camino más probable para la secuencia ['a', 'b']
+    print(viterbi_max_path(graph_b, 'A', ['a', 'b']))  # Resultado esperado: ['A', 'B', 'D']
@@ -0,0 +1,790 @@
+import csv
+import heapq
+from bisect import bisect_left, bisect_right
+import math
+import os
+import random
+import struct
+import tempfile
+
+from .instrumentacion import sonda
+
+
+def asignar_salones(actividades):
+    """
+    Asigna actividades a salones minimizando la cantidad de salones usados
+
+    Complejidad temporal:
+    - Ordenar actividades: O(n log n)
+    - Por cada actividad hacemos operaciones push/pop en el heap: O(log k) donde k es el número de salones
+    - Total: O(n log n), siendo n el número de actividades.
+
+    Complejidad espacial:
+    - O(n) para almacenar el heap, la asignación de actividades y las listas de salones.
+
+    Justificación:
+    - Ordenamos las actividades por su hora de inicio.
+    - Utilizamos un min-heap para llevar seguimiento del tiempo de finalización de las actividades
+      en los salones actuales, permitiendo reusar salones si la siguiente actividad empieza después
+      del fin más temprano.
+    - El heap mantiene los salones ordenados por la hora más temprana de disponibilidad, lo cual
+      permite siempre asignar la próxima actividad al salón que se libera antes (si es posible).
+    - Esto garantiza el uso mínimo de salones, equivalente al número máximo de actividades que se solapan.
+    - Dentro de tarea3.instrumentacion.instrumentar() se cuentan las operaciones del heap, su tamaño
+      máximo y el tiempo de las fases "ordenar" y "asignar".
+    """
+    medicion = sonda("voraces4.asignar_salones")
+    heappush, heappop = medicion.heap(heapq.heappush, heapq.heappop)
+    medicion.fase("ordenar")
+
+    #Ordeno actividades
+    actividades_ordenadas = sorted(enumerate(actividades), key=lambda x: x[1][0])
+    heap = []
+    salones = {}
+    asignaciones = {}
+    siguiente_salon_id = 0
+    medicion.fase("asignar")
+
+    # Iterar sobre las actividades ya ordenadas por inicio
+    for id_actividad, (inicio, fin) in actividades_ordenadas:
+        if heap and heap[0][0] <= inicio:
+            # Reusar salón cuya actividad termina antes de que empiece la actual
+            fin_anterior, salon_id = heappop(heap)
+        else:
+            # No hay salón libre, se debe crear uno nuevo
+            salon_id = siguiente_salon_id
+            siguiente_salon_id += 1
+            salones[salon_id] = []
+
+        # Asignar la actividad al salón seleccionado
+        salones[salon_id].append((inicio, fin))
+        asignaciones[id_actividad] = salon_id
+
+        # Registrar el nuevo tiempo de finalización en el heap
+        heappush(heap, (fin, salon_id))
+
+    medicion.terminar()
+    return salones, asignaciones
+
+
+# Registro binario de una actividad: (inicio, fin) como dos flotantes little-endian
+_FORMATO_ACTIVIDAD = struct.Struct("<dd")
+# Registro de los bloques temporales del ordenamiento externo: (inicio, id, fin)
+_FORMATO_BLOQUE = struct.Struct("<dqd")
+
+
+def _leer_actividades(fuente):
+    # Acepta un iterable de (inicio, fin), o la ruta de un CSV o de un archivo binario
+    if not isinstance(fuente, (str, os.PathLike)):
+        yield from fuente
+        return
+
+    if os.fspath(fuente).endswith(".csv"):
+        with open(fuente, newline="") as archivo:
+            for fila_num, fila in enumerate(csv.reader(archivo)):
+                try:
+                    inicio, fin = float(fila[0]), float(fila[1])
+                except (ValueError, IndexError):
+                    if fila_num == 0:
+                        continue  # Encabezado
+                    raise ValueError(f"Fila inválida en {fuente!r}: {fila}")
+                yield inicio, fin
+    else:
+        tam = _FORMATO_ACTIVIDAD.size
+        with open(fuente, "rb") as archivo:
+            while True:
+                datos = archivo.read(tam * 65536)
+                if not datos:
+                    break
+                if len(datos) % tam:
+                    raise ValueError(f"Archivo binario truncado: {fuente!r}")
+                yield from _FORMATO_ACTIVIDAD.iter_unpack(datos)
+
+
+def _leer_bloque(archivo):
+    tam = _FORMATO_BLOQUE.size
+    archivo.seek(0)
+    while True:
+        datos = archivo.read(tam * 8192)
+        if not datos:
+            return
+        yield from _FORMATO_BLOQUE.iter_unpack(datos)
+
+
+def _ordenar_por_inicio(actividades, tam_bloque):
+    # Ordenamiento externo: bloques ordenados en memoria, volcados a disco y mezclados con heap
+    bloque = []
+    temporales = []
+    try:
+        for id_actividad, (inicio, fin) in enumerate(actividades):
+            bloque.append((inicio, id_actividad, fin))
+            if len(bloque) >= tam_bloque:
+                bloque.sort()
+                temporal = tempfile.TemporaryFile()
+                temporal.write(b"".join(_FORMATO_BLOQUE.pack(*r) for r in bloque))
+                temporales.append(temporal)
+                bloque = []
+        bloque.sort()
+
+        if not temporales:
+            # Todo cupo en memoria: no hace falta tocar disco
+            yield from bloque
+            return
+        yield from heapq.merge(bloque, *(_leer_bloque(t) for t in temporales))
+    finally:
+        for temporal in temporales:
+            temporal.close()
+
+
+def asignar_salones_stream(fuente, tam_bloque=1_000_000):
+    """
+    Versión en flujo de asignar_salones: genera pares (id_actividad, salon_id) sin construir
+    los diccionarios de salones ni de asignaciones.
+
+    Complejidad temporal:
+    - O(n log n) para el ordenamiento externo (bloques de tam_bloque más una mezcla de n/tam_bloque vías).
+    - O(n log k) para las operaciones de heap, con k el número de salones.
+
+    Complejidad espacial:
+    - O(tam_bloque + k): un bloque en memoria durante el ordenamiento y el heap de salones abiertos.
+      El resto de las actividades espera en archivos temporales.
+
+    Justificación:
+    - Es el mismo algoritmo voraz que asignar_salones, con el mismo desempate por orden de entrada,
+      así que produce la misma asignación.
+    - Cuando la entrada no cabe en un bloque, se ordena por partes y se mezcla con heapq.merge.
+
+    :param fuente: Iterable de tuplas (inicio, fin), ruta a un CSV con columnas inicio,fin,
+                   o ruta a un archivo binario de pares de flotantes "<dd"
+    :param tam_bloque: Número máximo de actividades que se ordenan en memoria a la vez
+    :return: Generador de tuplas (id_actividad, salon_id); id_actividad es la posición en la entrada
+    """
+    heap = []
+    siguiente_salon_id = 0
+
+    for inicio, id_actividad, fin in _ordenar_por_inicio(_leer_actividades(fuente), tam_bloque):
+        if heap and heap[0][0] <= inicio:
+            # Reusar salón cuya actividad termina antes de que empiece la actual
+            _, salon_id = heapq.heappop(heap)
+        else:
+            salon_id = siguiente_salon_id
+            siguiente_salon_id += 1
+
+        yield id_actividad, salon_id
+        heapq.heappush(heap, (fin, salon_id))
+
+
+class IndiceSalones:
+    """
+    Índice de consulta sobre la asignación producida por asignar_salones.
+
+    Las actividades se tratan como intervalos semiabiertos [inicio, fin), igual que el
+    algoritmo voraz (un salón se reusa si la actividad anterior termina cuando inicia la nueva).
+
+    Complejidad temporal:
+    - Construcción: O(n log n).
+    - Actividades en un instante o que traslapan un rango: O(log n + r), con r el número reportado.
+    - Ocupación y número de salones libres en un instante, y número de actividades en un rango: O(log n).
+    - Lista de salones libres en un instante: O(k + log n + r) con k salones, porque se recorren
+      todos los salones para armar la lista; si sólo se necesita el número, usar cuantos_libres.
+    - Concurrencia máxima en un rango: O(log n) (tabla dispersa sobre los conteos).
+
+    Complejidad espacial:
+    - O(n log n) por la tabla dispersa; O(n) para el árbol de intervalos y los extremos ordenados.
+
+    Justificación:
+    - Un árbol de intervalos centrado guarda en cada nodo los intervalos que contienen su centro,
+      ordenados por inicio y por fin, de modo que cada consulta sólo recorre O(log n) nodos
+      y detiene la revisión de cada nodo en cuanto deja de haber coincidencias.
+    - Para los conteos basta con los inicios y fines ordenados: los intervalos que traslapan
+      [a, b) son los que inician antes de b menos los que terminan a más tardar en a.
+    - La concurrencia es constante entre extremos consecutivos; se precalcula por segmento
+      y se consulta el máximo de un rango de segmentos con una tabla dispersa.
+    """
+
+    def __init__(self, salones):
+        """
+        :param salones: Diccionario {salon_id: [(inicio, fin), ...]} devuelto por asignar_salones
+        """
+        self.salones = sorted(salones)
+        intervalos = [(inicio, fin, salon) for salon, acts in salones.items() for inicio, fin in acts]
+
+        self._inicios = sorted(a[0] for a in intervalos)
+        self._fines = sorted(a[1] for a in intervalos)
+        self._nodos = []
+        self._raiz = self._construir(intervalos)
+
+        # Conteo de actividades activas en cada segmento [tiempos[i], tiempos[i + 1])
+        self._tiempos = sorted(set(self._inicios) | set(self._fines))
+        delta = [0] * (len(self._tiempos) + 1)
+        for inicio, fin, _ in intervalos:
+            delta[bisect_left(self._tiempos, inicio)] += 1
+            delta[bisect_left(self._tiempos, fin)] -= 1
+        conteos = []
+        activos = 0
+        for d in delta[:-1]:
+            activos += d
+            conteos.append(activos)
+        self._conteos = conteos
+
+        # Tabla dispersa para máximos en rango: tabla[j][i] = max(conteos[i : i + 2^j])
+        self._tabla = [conteos]
+        j = 1
+        while (1 << j) <= len(conteos):
+            anterior = self._tabla[-1]
+            mitad = 1 << (j - 1)
+            self._tabla.append([max(anterior[i], anterior[i + mitad])
+                                for i in range(len(conteos) - (1 << j) + 1)])
+            j += 1
+
+    def _construir(self, intervalos):
+        # Árbol de intervalos centrado; los nodos se guardan como
+        # (centro, por_inicio, por_fin_desc, hijo_izq, hijo_der) en self._nodos
+        if not intervalos:
+            return -1
+        extremos = sorted(t for a in intervalos for t in a[:2])
+        centro = extremos[(len(extremos) - 1) // 2]  # Mediana inferior: siempre la contiene algún intervalo
+        izquierda = [a for a in intervalos if a[1] <= centro]
+        derecha = [a for a in intervalos if a[0] > centro]
+        medio = [a for a in intervalos if a[0] <= centro < a[1]]
+
+        por_inicio = sorted(medio, key=lambda a: a[0])
+        por_fin = sorted(medio, key=lambda a: a[1], reverse=True)
+        nodo = len(self._nodos)
+        self._nodos.append(None)
+        self._nodos[nodo] = (centro, por_inicio, por_fin,
+                             self._construir(izquierda), self._construir(derecha))
+        return nodo
+
+    def en_instante(self, t):
+        """
+        Actividades en curso en el instante t.
+        :return: Lista de tuplas (salon_id, (inicio, fin))
+        """
+        resultado = []
+        nodo = self._raiz
+        while nodo != -1:
+            centro, por_inicio, por_fin, izq, der = self._nodos[nodo]
+            if t < centro:
+                for inicio, fin, salon in por_inicio:
+                    if inicio > t:
+                        break
+                    resultado.append((salon, (inicio, fin)))
+                nodo = izq
+            else:
+                for inicio, fin, salon in por_fin:
+                    if fin <= t:
+                        break
+                    resultado.append((salon, (inicio, fin)))
+                nodo = der
+        return resultado
+
+    def en_rango(self, a, b):
+        """
+        Actividades que se traslapan con el rango [a, b).
+        :return: Lista de tuplas (salon_id, (inicio, fin))
+        """
+        resultado = []
+        pendientes = [self._raiz] if a < b else []
+        while pendientes:
+            nodo = pendientes.pop()
+            if nodo == -1:
+                continue
+            centro, por_inicio, por_fin, izq, der = self._nodos[nodo]
+            if b <= centro:
+                for inicio, fin, salon in por_inicio:
+                    if inicio >= b:
+                        break
+                    resultado.append((salon, (inicio, fin)))
+                pendientes.append(izq)
+            elif a > centro:
+                for inicio, fin, salon in por_fin:
+                    if fin <= a:
+                        break
+                    resultado.append((salon, (inicio, fin)))
+                pendientes.append(der)
+            else:
+                resultado.extend((salon, (inicio, fin)) for inicio, fin, salon in por_inicio)
+                pendientes.append(izq)
+                pendientes.append(der)
+        return resultado
+
+    def ocupacion(self, t):
+        """Número de salones ocupados en el instante t."""
+        return bisect_right(self._inicios, t) - bisect_right(self._fines, t)
+
+    def cuantas_en_rango(self, a, b):
+        """Número de actividades que se traslapan con el rango [a, b)."""
+        if a >= b:
+            return 0
+        return bisect_left(self._inicios, b) - bisect_right(self._fines, a)
+
+    def cuantos_libres(self, t):
+        """Número de salones sin actividad en el instante t."""
+        # Las actividades de un mismo salón no se traslapan: cada actividad activa ocupa un salón
+        return len(self.salones) - self.ocupacion(t)
+
+    def salones_libres(self, t):
+        """Lista de salones sin actividad en el instante t (O(k) por recorrer todos los salones)."""
+        ocupados = {salon for salon, _ in self.en_instante(t)}
+        return [salon for salon in self.salones if salon not in ocupados]
+
+    def concurrencia_maxima(self, a, b):
+        """Máximo número de actividades simultáneas dentro del rango [a, b)."""
+        if a >= b or not self._conteos:
+            return 0
+        # Segmentos [tiempos[i], tiempos[i + 1]) que intersecan [a, b)
+        i = max(bisect_right(self._tiempos, a) - 1, 0)
+        j = min(bisect_left(self._tiempos, b), len(self._conteos)) - 1
+        if i > j:
+            return 0
+        nivel = (j - i + 1).bit_length() - 1
+        fila = self._tabla[nivel]
+        return max(fila[i], fila[j - (1 << nivel) + 1])
+
+
+class _Treap:
+    # Treap (árbol de búsqueda con prioridades aleatorias) con un agregado por subárbol.
+    # Los nodos viven en listas paralelas; el índice 0 es el nodo vacío.
+
+    def __init__(self, semilla=0):
+        self._rng = random.Random(semilla)
+        self.clave = [None]
+        self.valor = [None]
+        self._prioridad = [0.0]
+        self._izq = [0]
+        self._der = [0]
+        self._libres = []
+        self.raiz = 0
+
+    def _nuevo(self, clave, valor):
+        if self._libres:
+            n = self._libres.pop()
+            self.clave[n], self.valor[n] = clave, valor
+            self._prioridad[n] = self._rng.random()
+            self._izq[n] = self._der[n] = 0
+        else:
+            n = len(self.clave)
+            self.clave.append(clave)
+            self.valor.append(valor)
+            self._prioridad.append(self._rng.random())
+            self._izq.append(0)
+            self._der.append(0)
+            self._crecer()
+        self._actualizar(n)
+        return n
+
+    def _dividir(self, n, clave, incluir):
+        # (claves < clave, resto); con incluir=True la clave igual queda a la izquierda
+        if not n:
+            return 0, 0
+        k = self.clave[n]
+        if k < clave or (incluir and k == clave):
+            a, b = self._dividir(self._der[n], clave, incluir)
+            self._der[n] = a
+            self._actualizar(n)
+            return n, b
+        a, b = self._dividir(self._izq[n], clave, incluir)
+        self._izq[n] = b
+        self._actualizar(n)
+        return a, n
+
+    def _unir(self, a, b):
+        # Todas las claves de a son menores que las de b
+        if not a or not b:
+            return a or b
+        if self._prioridad[a] > self._prioridad[b]:
+            self._der[a] = self._unir(self._der[a], b)
+            self._actualizar(a)
+            return a
+        self._izq[b] = self._unir(a, self._izq[b])
+        self._actualizar(b)
+        return b
+
+    def _bajar(self, clave, hasta=None):
+        # Camino desde la raíz hacia 'clave': [(nodo, fue_a_la_izquierda), ...]. Se detiene en el nodo
+        # con esa clave, en un hijo vacío, o (con 'hasta') en el primer nodo de prioridad menor
+        camino = []
+        n = self.raiz
+        while n and self.clave[n] != clave and (hasta is None or self._prioridad[n] >= hasta):
+            izquierda = clave < self.clave[n]
+            camino.append((n, izquierda))
+            n = self._izq[n] if izquierda else self._der[n]
+        return camino, n
+
+    def _enganchar(self, camino, hijo):
+        # Cuelga 'hijo' del último nodo del camino y recalcula los agregados hacia la raíz
+        if not camino:
+            self.raiz = hijo
+            return
+        padre, izquierda = camino[-1]
+        if izquierda:
+            self._izq[padre] = hijo
+        else:
+            self._der[padre] = hijo
+        for n, _ in reversed(camino):
+            self._actualizar(n)
+
+    def insertar(self, clave, valor):
+        nuevo = self._nuevo(clave, valor)
+        # Se baja mientras la prioridad sea mayor y se parte sólo el subárbol de abajo
+        camino, n = self._bajar(clave, hasta=self._prioridad[nuevo])
+        self._izq[nuevo], self._der[nuevo] = self._dividir(n, clave, False)
+        self._actualizar(nuevo)
+        self._enganchar(camino, nuevo)
+
+    def borrar(self, clave):
+        camino, n = self._bajar(clave)
+        if n:
+            self._libres.append(n)
+            self._enganchar(camino, self._unir(self._izq[n], self._der[n]))
+
+    def cambiar_valor(self, clave, valor):
+        camino, n = self._bajar(clave)
+        self.valor[n] = valor
+        self._actualizar(n)
+        for m, _ in reversed(camino):
+            self._actualizar(m)
+
+
+class _Huecos(_Treap):
+    # Huecos libres de todos los salones: clave (inicio, salon), valor fin; agregado: fin máximo
+
+    def __init__(self, semilla=0):
+        self.maximo = [-math.inf]
+        super().__init__(semilla)
+
+    def _crecer(self):
+        self.maximo.append(-math.inf)
+
+    def _actualizar(self, n):
+        m = self.valor[n]
+        izq, der = self.maximo[self._izq[n]], self.maximo[self._der[n]]
+        if izq > m:
+            m = izq
+        if der > m:
+            m = der
+        self.maximo[n] = m
+
+    def buscar(self, inicio, fin):
+        """Hueco (inicio_hueco, salon) con inicio_hueco <= inicio y fin_hueco >= fin, o None."""
+        n = self._buscar(self.raiz, inicio, fin)
+        return self.clave[n] if n else None
+
+    def _buscar(self, n, inicio, fin):
+        # Se prefiere el hueco que empieza más tarde: el salón que se liberó más recientemente
+        if not n or self.maximo[n] < fin:
+            return 0
+        if self.clave[n][0] > inicio:
+            return self._buscar(self._izq[n], inicio, fin)
+        encontrado = self._buscar(self._der[n], inicio, fin)
+        if encontrado:
+            return encontrado
+        if self.valor[n] >= fin:
+            return n
+        return self._buscar(self._izq[n], inicio, fin)
+
+
+class _Eventos(_Treap):
+    # Extremos de las actividades: clave (t, 0 fin | 1 inicio, id), valor -1 o +1.
+    # Agregados: suma y máximo prefijo, de modo que el máximo traslape es el máximo prefijo de la raíz.
+
+    def __init__(self, semilla=0):
+        self.suma = [0]
+        self.prefijo = [-math.inf]
+        super().__init__(semilla)
+
+    def _crecer(self):
+        self.suma.append(0)
+        self.prefijo.append(-math.inf)
+
+    def _actualizar(self, n):
+        izq, der = self._izq[n], self._der[n]
+        hasta_n = self.suma[izq] + self.valor[n]
+        self.suma[n] = hasta_n + self.suma[der]
+        p = hasta_n + self.prefijo[der]
+        if hasta_n > p:
+            p = hasta_n
+        if self.prefijo[izq] > p:
+            p = self.prefijo[izq]
+        self.prefijo[n] = p
+
+    @property
+    def maximo_traslape(self):
+        return max(self.prefijo[self.raiz], 0)
+
+
+class RoomAllocator:
+    """
+    Asignación incremental de salones: agrega y cancela actividades sobre un horario vivo,
+    manteniendo el número de salones igual al máximo traslape actual.
+
+    Las actividades son intervalos semiabiertos [inicio, fin), como en asignar_salones.
+
+    Complejidad temporal:
+    - Construcción inicial: O(n log n), con asignar_salones.
+    - agregar: O(log n) esperado si algún salón está libre en todo [inicio, fin) o si hace falta
+      abrir uno; cancelar: O(log n) esperado si el número de salones no baja.
+      (Las listas ordenadas de cada salón se actualizan con bisect: O(log n) comparaciones más
+      un desplazamiento de memoria.)
+    - Cuando hay que reacomodar, cada intercambio de la cadena cuesta O(m log n), con m las
+      actividades que cambian de salón.
+
+    Complejidad espacial:
+    - O(n): dos treaps (huecos libres y extremos) y los inicios ordenados de cada salón.
+
+    Justificación:
+    - Los huecos libres de todos los salones se guardan en un treap por (inicio, salon) con el
+      fin máximo de cada subárbol; así, encontrar un salón libre en [inicio, fin) es buscar un
+      hueco con inicio <= inicio y fin >= fin en O(log n), sin revisar salón por salón.
+    - Los extremos de las actividades se guardan en otro treap con suma y máximo prefijo por
+      subárbol: el máximo traslape de todo el horario es el máximo prefijo de la raíz.
+    - Al agregar: si hay un salón libre se usa sin mover nada. Si el traslape supera al número
+      de salones se abre uno nuevo (tampoco se mueve nada). Si no, el traslape en [inicio, fin)
+      deja al menos un salón libre en cada instante, y se aplica una cadena de intercambios
+      (tipo Kempe): el salón A libre en 'inicio' choca en x con su siguiente actividad; otro salón
+      B está libre en x, y A y B intercambian sus actividades entre x y el primer instante en que
+      ambos están libres. A queda libre más allá de x; se repite hasta cubrir [inicio, fin).
+    - Al cancelar: si el traslape baja del número de salones, se cierra el salón con menos
+      actividades y éstas se reubican con el mismo procedimiento.
+    - Sólo se reportan como cambios las actividades cuyo salón cambió, además de la agregada.
+    """
+
+    def __init__(self, actividades=None, semilla=0):
+        """
+        :param actividades: Lista opcional de tuplas (inicio, fin); sus ids son sus posiciones
+        """
+        self._huecos = _Huecos(semilla)
+        self._eventos = _Eventos(semilla + 1)
+        self._reservas = {}  # id -> [inicio, fin, salon]
+        self._salones = {}  # salon -> (inicios ordenados, {inicio: id})
+        self._cerrados = []  # Ids de salones cerrados, para reusarlos (min-heap)
+        self._siguiente_salon = 0
+        self._siguiente_id = 0
+
+        if actividades:
+            _, asignaciones = asignar_salones(actividades)
+            for _ in range(max(asignaciones.values()) + 1):
+                self._abrir_salon()
+            for id_actividad, (inicio, fin) in enumerate(actividades):
+                self._validar(inicio, fin)
+                self._reservas[id_actividad] = [inicio, fin, None]
+                self._agregar_eventos(id_actividad)
+                self._poner(id_actividad, asignaciones[id_actividad])
+            self._siguiente_id = len(actividades)
+
+    def __len__(self):
+        return len(self._reservas)
+
+    def __contains__(self, id_actividad):
+        return id_actividad in self._reservas
+
+    @property
+    def num_salones(self):
+        return len(self._salones)
+
+    @property
+    def max_traslape(self):
+        return self._eventos.maximo_traslape
+
+    def salon_de(self, id_actividad):
+        return self._reservas[id_actividad][2]
+
+    def asignaciones(self):
+        """Diccionario {id_actividad: salon_id}."""
+        return {id_actividad: r[2] for id_actividad, r in self._reservas.items()}
+
+    def salones(self):
+        """Diccionario {salon_id: [(inicio, fin), ...]} ordenado por inicio, como en asignar_salones."""
+        return {salon: [tuple(self._reservas[por_inicio[s]][:2]) for s in inicios]
+                for salon, (inicios, por_inicio) in sorted(self._salones.items())}
+
+    def agregar(self, inicio, fin, id_actividad=None):
+        """
+        Agrega la actividad [inicio, fin).
+        :param id_actividad: Identificador a usar; por defecto el siguiente entero libre
+        :return: Tupla (id_actividad, cambios), donde cambios es {id: salon_nuevo} con la actividad
+                 agregada y cada actividad existente que se movió de salón
+        """
+        self._validar(inicio, fin)
+        if id_actividad is None:
+            while self._siguiente_id in self._reservas:
+                self._siguiente_id += 1
+            id_actividad = self._siguiente_id
+        elif id_actividad in self._reservas:
+            raise ValueError(f"La actividad {id_actividad!r} ya existe")
+
+        self._reservas[id_actividad] = [inicio, fin, None]
+        self._agregar_eventos(id_actividad)
+        cambios, originales = {}, {}
+        if self.max_traslape > self.num_salones:
+            salon = self._abrir_salon()
+        else:
+            salon = self._colocar(inicio, fin, cambios, originales)
+        self._poner(id_actividad, salon)
+        cambios[id_actividad] = salon
+        return id_actividad, self._cambios_netos(cambios, originales)
+
+    def cancelar(self, id_actividad):
+        """
+        Cancela una actividad.
+        :return: Diccionario {id: salon_nuevo} de las actividades que cambiaron de salón
+                 (sólo si se cerró un salón)
+        """
+        if id_actividad not in self._reservas:
+            raise KeyError(id_actividad)
+        self._quitar(id_actividad)
+        inicio, fin, _ = self._reservas.pop(id_actividad)
+        self._eventos.borrar((fin, 0, id_actividad))
+        self._eventos.borrar((inicio, 1, id_actividad))
+
+        cambios, originales = {}, {}
+        if self.max_traslape < self.num_salones:
+            self._cerrar_un_salon(cambios, originales)
+        return self._cambios_netos(cambios, originales)
+
+    @staticmethod
+    def _validar(inicio, fin):
+        if not fin > inicio:
+            raise ValueError(f"Actividad vacía o invertida: ({inicio!r}, {fin!r})")
+
+    def _agregar_eventos(self, id_actividad):
+        inicio, fin, _ = self._reservas[id_actividad]
+        self._eventos.insertar((inicio, 1, id_actividad), 1)
+        self._eventos.insertar((fin, 0, id_actividad), -1)
+
+    def _abrir_salon(self):
+        if self._cerrados:
+            salon = heapq.heappop(self._cerrados)
+        else:
+            salon = self._siguiente_salon
+            self._siguiente_salon += 1
+        self._salones[salon] = ([], {})
+        self._huecos.insertar((-math.inf, salon), math.inf)
+        return salon
+
+    def _cerrar_un_salon(self, cambios, originales):
+        # Se cierra el salón con menos actividades y se reubican en los demás
+        salon = min(self._salones, key=lambda r: len(self._salones[r][0]))
+        inicios, por_inicio = self._salones[salon]
+        pendientes = [por_inicio[s] for s in inicios]
+        for id_actividad in pendientes:
+            originales[id_actividad] = salon
+        for id_actividad in pendientes:
+            self._quitar(id_actividad)
+        self._huecos.borrar((-math.inf, salon))
+        del self._salones[salon]
+        heapq.heappush(self._cerrados, salon)
+
+        for id_actividad in pendientes:
+            inicio, fin, _ = self._reservas[id_actividad]
+            nuevo = self._colocar(inicio, fin, cambios, originales)
+            self._poner(id_actividad, nuevo)
+            cambios[id_actividad] = nuevo
+
+    def _fin_en(self, salon, t):
+        # Fin de la actividad del salón que está en curso en t, o None si el salón está libre en t
+        inicios, por_inicio = self._salones[salon]
+        i = bisect_right(inicios, t) - 1
+        if i >= 0:
+            fin = self._reservas[por_inicio[inicios[i]]][1]
+            if fin > t:
+                return fin
+        return None
+
+    @staticmethod
+    def _cambios_netos(cambios, originales):
+        # Una cadena de intercambios puede mover una actividad y luego devolverla a su salón:
+        # sólo se reportan las que terminan en un salón distinto del que tenían antes
+        return {i: salon for i, salon in cambios.items() if originales.get(i) != salon}
+
+    def _colocar(self, inicio, fin, cambios, originales):
+        # Salón libre en [inicio, fin), reacomodando con intercambios si hace falta.
+        # Requiere que el traslape en [inicio, fin), sin contar la actividad nueva, sea menor que
+        # el número de salones. 'originales' guarda el salón previo de cada actividad movida.
+        hueco = self._huecos.buscar(inicio, fin)
+        if hueco is not None:
+            return hueco[1]
+
+        _, a = self._huecos.buscar(inicio, math.nextafter(inicio, math.inf))  # A libre en 'inicio'
+        while True:
+            inicios_a = self._salones[a][0]
+            i = bisect_right(inicios_a, inicio)
+            x = inicios_a[i] if i < len(inicios_a) else math.inf  # A está libre en [inicio, x)
+            if x >= fin:
+                return a
+            _, b = self._huecos.buscar(x, math.nextafter(x, math.inf))  # B libre en x
+
+            # Primer instante c >= x en el que ni A ni B tienen una actividad en curso
+            c = x
+            while True:
+                fines = [f for f in (self._fin_en(a, c), self._fin_en(b, c)) if f is not None]
+                if not fines:
+                    break
+                c = max(fines)
+
+            # Intercambio de las actividades de A y B que empiezan en [x, c)
+            de_a = [self._salones[a][1][s] for s in inicios_a[i:bisect_left(inicios_a, c)]]
+            inicios_b = self._salones[b][0]
+            de_b = [self._salones[b][1][s] for s in inicios_b[bisect_left(inicios_b, x):bisect_left(inicios_b, c)]]
+            for id_actividad in de_a + de_b:
+                self._quitar(id_actividad)
+            for id_actividad in de_a:
+                originales.setdefault(id_actividad, a)
+                self._poner(id_actividad, b)
+                cambios[id_actividad] = b
+            for id_actividad in de_b:
+                originales.setdefault(id_actividad, b)
+                self._poner(id_actividad, a)
+                cambios[id_actividad] = a
+
+    def _poner(self, id_actividad, salon):
+        # Ocupa en el salón un hueco que contiene [inicio, fin) y lo parte en dos
+        reserva = self._reservas[id_actividad]
+        inicio, fin = reserva[0], reserva[1]
+        inicios, por_inicio = self._salones[salon]
+        i = bisect_left(inicios, inicio)
+        anterior = self._reservas[por_inicio[inicios[i - 1]]][1] if i else -math.inf
+        siguiente = inicios[i] if i < len(inicios) else math.inf
+        self._huecos.cambiar_valor((anterior, salon), inicio)
+        self._huecos.insertar((fin, salon), siguiente)
+        inicios.insert(i, inicio)
+        por_inicio[inicio] = id_actividad
+        reserva[2] = salon
+
+    def _quitar(self, id_actividad):
+        # Libera la actividad de su salón y une los huecos de ambos lados
+        inicio, fin, salon = self._reservas[id_actividad]
+        inicios, por_inicio = self._salones[salon]
+        i = bisect_left(inicios, inicio)
+        del inicios[i]
+        del por_inicio[inicio]
+        anterior = self._reservas[por_inicio[inicios[i - 1]]][1] if i else -math.inf
+        siguiente = inicios[i] if i < len(inicios) else math.inf
+        self._huecos.borrar((fin, salon))
+        self._huecos.cambiar_valor((anterior, salon), siguiente)
+
+
+# Ejemplo de uso
+if __name__ == "__main__":
+    actividades = [(0, 30), (5, 10), (15, 20), (35, 50), (10, 15), (20, 40)]
+    salones, asignaciones = asignar_salones(actividades)
+
+    print("Asignación de actividades a salones:")
+    for salon, acts in salones.items():
+        print(f"Salón {salon}: {acts}")
+
+    print("\nAsignaciones individuales:")
+    for idx, salon in asignaciones.items():
+        print(f"Actividad {idx} -> Salón {salon}")
+
+    indice = IndiceSalones(salones)
+    print("\nEn curso en t=12:", indice.en_instante(12))
+    print("Salones libres en t=12:", indice.salones_libres(12))
+    print("Concurrencia máxima en [0, 35):", indice.concurrencia_maxima(0, 35))
+
+    agenda = RoomAllocator(actividades)
+    nueva, cambios = agenda.agregar(12, 18)
+    print(f"\nActividad {nueva} agregada; cambios: {cambios}")
+    print("Cancelar actividad 0, cambios:", agenda.cancelar(0))
+    print("Salones:", agenda.num_salones, "- traslape máximo:", agenda.max_traslape)